@@ -9,6 +9,8 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+from src.data.data_loader import refresh_tenant  # noqa: E402
+from src.data.mock_data import current_scenario  # noqa: E402
 from src.pages import (  # noqa: E402
     executive_summary,
     kpi_metrics,
@@ -16,6 +18,8 @@ from src.pages import (  # noqa: E402
     program_health,
     risk_management,
 )
+from src.utils.config import get as cfg_get  # noqa: E402
+from src.utils.config import tenant_scope, tenants  # noqa: E402
 
 PAGES = {
     "Executive Summary": executive_summary,
@@ -39,18 +43,25 @@ with st.sidebar:
         unsafe_allow_html=True,
     )
     st.divider()
+    _tenants = tenants()
+    # With several business units configured, each session picks whose data to view.
+    tenant = st.selectbox("Portfolio", _tenants) if len(_tenants) > 1 else _tenants[0]
     page = st.radio("Navigation", list(PAGES.keys()), label_visibility="collapsed")
     st.divider()
-    from src.utils.config import get as cfg_get
-
-    _source = cfg_get("data_source", "mock")
-    if _source == "asana":
-        st.caption("Data source: Asana Portfolio")
-    elif _source == "jira":
-        st.caption("Data source: JIRA")
-    else:
-        st.caption("Data source: Mock (seed=42)")
+    with tenant_scope(tenant):
+        _source = cfg_get("data_source", "mock")
+        if _source == "asana":
+            st.caption("Data source: Asana Portfolio")
+        elif _source == "jira":
+            st.caption("Data source: JIRA")
+        else:
+            _scenario = current_scenario()
+            st.caption(f"Data source: Mock ({_scenario.name}, seed={_scenario.seed})")
     st.caption("Last refresh: Live")
+    # Drops only this portfolio's cached data; other tenants keep theirs.
+    if st.button("Refresh data", use_container_width=True):
+        refresh_tenant(tenant)
 
 # Render selected page
-PAGES[page].render()
+with tenant_scope(tenant):
+    PAGES[page].render()
@@ -0,0 +1,48 @@
+"""Helpers shared by the benchmark scripts."""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data.schema import apply_schema
+
+METRIC_COLUMNS = [
+    "velocity",
+    "planned_points",
+    "delivered_points",
+    "mttr_hours",
+    "deployment_frequency",
+    "lead_time_days",
+    "change_failure_rate",
+]
+
+
+def timed(label: str, fn, repeat: int = 5) -> float:
+    """Print and return the best wall time of ``repeat`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<28} {best * 1000:8.1f} ms")
+    return best
+
+
+def weekly_metrics(programs: int, weeks: int) -> pd.DataFrame:
+    """A schema-typed metrics frame with one row per program and week."""
+    rng = np.random.default_rng(42)
+    rows = programs * weeks
+    df = pd.DataFrame(
+        {
+            "program_id": np.repeat([f"PRG-{i:04d}" for i in range(programs)], weeks),
+            "week_start": np.tile(
+                pd.date_range("2016-01-04", periods=weeks, freq="W-MON"), programs
+            ),
+        }
+    )
+    for col in METRIC_COLUMNS:
+        df[col] = rng.uniform(0, 50, rows).round(1)
+    df["defect_count"] = rng.integers(0, 10, rows)
+    df["incident_count"] = rng.integers(0, 5, rows)
+    return apply_schema(df, "metrics")
@@ -0,0 +1,44 @@
+"""Benchmark: weekly snapshot aggregation — per-model loop vs one groupby.
+
+Usage: python -m benchmarks.bench_aggregation [programs] [weeks]
+"""
+
+import sys
+
+import pandas as pd
+
+from benchmarks._common import timed, weekly_metrics
+from src.data.aggregation import weekly_snapshots
+from src.data.status_history import TRANSITION_COLUMNS, StatusHistory
+
+
+def _loop(metrics: pd.DataFrame) -> list[dict]:
+    """The previous dict-of-lists aggregation, on plain records."""
+    weeks: dict = {}
+    for record in metrics.to_dict("records"):
+        weeks.setdefault(record["week_start"], []).append(record)
+    out = []
+    for week, rows in sorted(weeks.items()):
+        n = len(rows)
+        out.append(
+            {
+                "week_start": week,
+                "total_velocity": round(sum(r["velocity"] for r in rows), 1),
+                "total_defects": sum(r["defect_count"] for r in rows),
+                "avg_mttr_hours": round(sum(r["mttr_hours"] for r in rows) / n, 1),
+                "avg_lead_time_days": round(sum(r["lead_time_days"] for r in rows) / n, 1),
+            }
+        )
+    return out
+
+
+def main(programs: int = 500, weeks: int = 520):
+    metrics = weekly_metrics(programs, weeks)
+    history = StatusHistory(pd.DataFrame(columns=TRANSITION_COLUMNS))
+    print(f"{len(metrics):,} metric rows ({programs} programs x {weeks} weeks)")
+    timed("per-model loop", lambda: _loop(metrics), repeat=1)
+    timed("groupby", lambda: weekly_snapshots(metrics, history))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,147 @@
+"""Benchmark: decisions engine — per-row iterrows vs column expressions vs incremental.
+
+The frames come from the synthetic generator, sized so the risks frame has
+about ``rows`` rows, with every escalation left open so each rule matches
+thousands of rows. The incremental runs add twenty org-style rules and
+change 1% of the risks between refreshes.
+
+Usage: python -m benchmarks.bench_decisions [rows]
+"""
+
+from datetime import date
+import sys
+
+import pandas as pd
+
+from benchmarks._common import timed
+from src.data.synthetic import generate_portfolio
+from src.utils.constants import MilestoneStatus, ProgramStatus, RiskLikelihood, RiskSeverity
+from src.utils.decision_rules import BUILTIN_RULES, DecisionTracker, compile_rules, evaluate_rules
+from src.utils.helpers import DECISION_COLUMNS, decisions_frame
+
+
+def _iterrows(programs_df, risks_df, milestones_df, escalations_df) -> pd.DataFrame:
+    """The previous engine: one ``iterrows`` loop per rule."""
+    rows = []
+    today = date.today()
+    off_track = programs_df[programs_df["status"] == ProgramStatus.OFF_TRACK.value]
+    for _, row in off_track.iterrows():
+        rows.append(
+            (
+                "critical",
+                row["name"],
+                f"{row['name']} is off track at {row['percent_complete']:.0f}%",
+                "Re-scope deliverables or add resources",
+            )
+        )
+    critical_risks = risks_df[
+        (risks_df["is_open"] == True)  # noqa: E712
+        & (risks_df["severity"] == RiskSeverity.CRITICAL.value)
+        & (risks_df["likelihood"] == RiskLikelihood.HIGH.value)
+    ]
+    for _, row in critical_risks.iterrows():
+        rows.append(
+            (
+                "critical",
+                row.get("program_id", "Unknown"),
+                f"Critical risk: {row['title']}",
+                "Accept, mitigate, or transfer risk",
+            )
+        )
+    open_esc = escalations_df[escalations_df["resolved_date"].isna()].copy()
+    open_esc["age_days"] = (pd.Timestamp(today) - pd.to_datetime(open_esc["raised_date"])).dt.days
+    for _, row in open_esc[open_esc["age_days"] > 30].iterrows():
+        rows.append(
+            (
+                "high",
+                row.get("program_id", "Unknown"),
+                f"Escalation open {row['age_days']} days: {row['title']}",
+                "Escalate to next level",
+            )
+        )
+    blocked = milestones_df[milestones_df["status"] == MilestoneStatus.BLOCKED.value]
+    for _, row in blocked.iterrows():
+        rows.append(
+            (
+                "high",
+                row.get("program_id", "Unknown"),
+                f"Blocked milestone: {row['name']}",
+                f"Unblock milestone for {row.get('program_id', 'program')}",
+            )
+        )
+    rank = {"critical": 0, "high": 1, "medium": 2}
+    rows.sort(key=lambda r: rank.get(r[0], 3))
+    return pd.DataFrame(rows, columns=DECISION_COLUMNS)
+
+
+def _org_rules(count: int = 20) -> tuple:
+    specs = []
+    for i in range(count):
+        if i % 2:
+            specs.append(
+                {
+                    "name": f"aging-risk-{i}",
+                    "entity": "risks",
+                    "when": {
+                        "is_open": True,
+                        "severity": ["High", "Critical"],
+                        "age_days": {"gt": 60 + 10 * i},
+                    },
+                    "severity": "medium",
+                    "title": "Risk open {age_days} days: {title}",
+                    "recommendation": "Review mitigation with {owner}",
+                }
+            )
+        else:
+            specs.append(
+                {
+                    "name": f"delayed-key-milestone-{i}",
+                    "entity": "milestones",
+                    "when": {
+                        "status": "Delayed",
+                        "is_key_milestone": True,
+                        "quarter": f"Q{i // 2 % 4 + 1} {2025 + i // 8}",
+                    },
+                    "severity": "high",
+                    "title": "Key milestone delayed: {name}",
+                    "recommendation": "Re-plan with {owner}",
+                }
+            )
+    return compile_rules([*BUILTIN_RULES, *specs])
+
+
+def main(rows: int = 100_000):
+    frames = generate_portfolio(programs=int(rows / 2.5), weeks=1, escalation_rate=1.0)
+    frames["escalations"]["resolved_date"] = pd.NaT
+    args = [frames[n] for n in ("programs", "risks", "milestones", "escalations")]
+    print(
+        ", ".join(
+            f"{len(df):,} {name}"
+            for name, df in zip(("programs", "risks", "milestones", "escalations"), args)
+        )
+    )
+    timed("iterrows", lambda: _iterrows(*args), repeat=1)
+    timed("column expressions", lambda: decisions_frame(*args))
+    print(f"  {len(decisions_frame(*args)):,} decisions")
+
+    rules = _org_rules()
+    entities = dict(zip(("programs", "risks", "milestones", "escalations"), args))
+    risks = entities["risks"]
+    changed = risks.copy()
+    sample = changed.sample(frac=0.01, random_state=1).index
+    changed.loc[sample, "is_open"] = ~changed.loc[sample, "is_open"]
+    versions = [entities, {**entities, "risks": changed}]
+    tracker = DecisionTracker()
+    tracker.update(entities, rules)
+    refreshes = iter(range(1_000))
+
+    def _refresh():
+        return tracker.update(versions[next(refreshes) % 2 - 1], rules)
+
+    print(f"{len(rules)} rules")
+    timed("full evaluation", lambda: evaluate_rules(rules, versions[1]))
+    timed("incremental, 1% of risks changed", _refresh)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""Benchmark: DORA maturity — per-program scalar ladders vs one pass over the cube.
+
+The scalar runs use the previous nested-``if`` classifier: the latest-week
+loop is what the KPI page did per render, the history loop classifies every
+metrics row the same way. The cube runs classify every program and week at
+once.
+
+Usage: python -m benchmarks.bench_dora [programs] [weeks]
+"""
+
+import sys
+
+from benchmarks._common import timed, weekly_metrics
+from src.data.metrics_cube import MetricsCube
+from src.utils.constants import DORA_BENCHMARKS
+from src.utils.helpers import classify_dora_frame
+
+_DORA = ["deployment_frequency", "lead_time_days", "change_failure_rate", "mttr_hours"]
+_RANK = {"Elite": 3, "High": 2, "Medium": 1, "Low": 0}
+
+
+def _ladder(value, metric, higher_is_better):
+    t = DORA_BENCHMARKS[metric]
+    if higher_is_better:
+        if value >= t["elite"]:
+            return "Elite"
+        elif value >= t["high"]:
+            return "High"
+        elif value >= t["medium"]:
+            return "Medium"
+        return "Low"
+    if value <= t["elite"]:
+        return "Elite"
+    elif value <= t["high"]:
+        return "High"
+    elif value <= t["medium"]:
+        return "Medium"
+    return "Low"
+
+
+def _scalar(deploy_freq, lead_time, cfr, mttr):
+    """The previous ``classify_dora_maturity``."""
+    levels = [
+        _ladder(deploy_freq, "deployment_frequency", True),
+        _ladder(lead_time, "lead_time_days", False),
+        _ladder(cfr, "change_failure_rate", False),
+        _ladder(mttr, "mttr_hours", False),
+    ]
+    return min(levels, key=_RANK.__getitem__)
+
+
+def _per_program(metrics, program_ids):
+    latest = metrics[metrics["week_start"] == metrics["week_start"].max()]
+    for pid in program_ids:
+        row = latest[latest["program_id"] == pid]
+        if not row.empty:
+            _scalar(*row[_DORA].iloc[0])
+
+
+def _history_rows(metrics):
+    return [_scalar(*row) for row in metrics[_DORA].itertuples(index=False)]
+
+
+def main(programs: int = 2_000, weeks: int = 104):
+    metrics = weekly_metrics(programs, weeks)
+    cube = MetricsCube.from_frame(metrics)
+    print(f"{len(metrics):,} metric rows ({programs} programs x {weeks} weeks)")
+    latest_week = cube.latest_weeks(1)[0]
+    timed(
+        "latest week, per-program loop", lambda: _per_program(metrics, cube.program_ids), repeat=1
+    )
+    timed(
+        "latest week, frame classifier",
+        lambda: classify_dora_frame(cube.by_program(latest_week, _DORA)),
+    )
+    timed("full history, per-row scalar", lambda: _history_rows(metrics), repeat=1)
+    timed("full history, cube", cube.maturity)
+    timed("weekly level counts, cube", cube.maturity_counts)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
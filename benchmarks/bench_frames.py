@@ -0,0 +1,68 @@
+"""Benchmark: model_dump() rows vs columnar frame construction.
+
+Usage: python -m benchmarks.bench_frames [milestones] [metrics]
+"""
+
+from datetime import date, timedelta
+import sys
+import time
+
+import pandas as pd
+
+from src.data.models import DeliveryMetric, Milestone
+from src.data.schema import apply_schema, frame_from_models
+from src.utils.constants import MilestoneStatus
+
+
+def _milestones(n: int) -> list[Milestone]:
+    statuses = list(MilestoneStatus)
+    return [
+        Milestone(
+            id=f"MS-{i:06d}",
+            program_id=f"PRG-{i % 1000:04d}",
+            name=f"Milestone {i}",
+            status=statuses[i % len(statuses)],
+            due_date=date(2025, 1, 1) + timedelta(days=i % 500),
+            quarter=f"Q{i % 4 + 1} 2025",
+            is_key_milestone=i % 3 == 0,
+        )
+        for i in range(n)
+    ]
+
+
+def _metrics(n: int) -> list[DeliveryMetric]:
+    return [
+        DeliveryMetric(
+            program_id=f"PRG-{i % 1000:04d}",
+            week_start=date(2025, 1, 6) + timedelta(weeks=i // 1000),
+            velocity=float(i % 50),
+            defect_count=i % 7,
+            change_failure_rate=float(i % 20),
+        )
+        for i in range(n)
+    ]
+
+
+def _compare(name: str, models: list):
+    started = time.perf_counter()
+    dumped = apply_schema(pd.DataFrame([m.model_dump() for m in models]), name)
+    dump_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    columnar = frame_from_models(models, name)
+    columnar_s = time.perf_counter() - started
+
+    pd.testing.assert_frame_equal(dumped, columnar)
+    print(f"{name}: {len(models):,} rows")
+    print(f"  model_dump + DataFrame     {dump_s * 1000:8.0f} ms")
+    print(f"  frame_from_models          {columnar_s * 1000:8.0f} ms")
+
+
+def main(n_milestones: int = 100_000, n_metrics: int = 1_000_000):
+    _compare("milestones", _milestones(n_milestones))
+    _compare("metrics", _metrics(n_metrics))
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
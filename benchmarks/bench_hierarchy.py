@@ -0,0 +1,54 @@
+"""Benchmark: portfolio tree with 10,000 leaf projects — build vs incremental updates.
+
+Usage: python -m benchmarks.bench_hierarchy [programs] [groups] [projects_per_group]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import timed
+from src.data.hierarchy import PortfolioTree
+
+
+def _nodes(programs: int, groups: int, projects: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    rows = [("ROOT", None, "Portfolio", None)]
+    for p in range(programs):
+        program = f"PRG-{p:03d}"
+        rows.append((program, "ROOT", "Program", program))
+        for g in range(groups):
+            group = f"PF-{p}-{g}"
+            rows.append((group, program, "Portfolio", program))
+            rows.extend((f"PRJ-{p}-{g}-{i}", group, "Project", program) for i in range(projects))
+    df = pd.DataFrame(rows, columns=["id", "parent_id", "level", "program_id"])
+    df["name"] = df["id"]
+    leaf = (df["level"] == "Project").to_numpy()
+    df["percent_complete"] = np.where(leaf, rng.uniform(0, 100, len(df)).round(1), np.nan)
+    df["budget_millions"] = np.where(leaf, rng.uniform(0, 1, len(df)).round(2), 0.0)
+    df["budget_spent_millions"] = df["budget_millions"] * 0.5
+    return df
+
+
+def main(programs: int = 50, groups: int = 4, projects: int = 50):
+    nodes = _nodes(programs, groups, projects)
+    leaves = nodes.loc[nodes["level"] == "Project", "id"].to_numpy()
+    print(f"{len(nodes):,} nodes, {len(leaves):,} leaf projects")
+    timed("full build", lambda: PortfolioTree(nodes))
+    tree = PortfolioTree(nodes)
+    rng = np.random.default_rng(7)
+    timed(
+        "update one project",
+        lambda: tree.update(str(rng.choice(leaves)), percent_complete=float(rng.uniform(0, 100))),
+    )
+    batch = pd.DataFrame(
+        {"budget_millions": rng.uniform(0, 1, 1_000)},
+        index=rng.choice(leaves, 1_000, replace=False),
+    )
+    timed("update 1,000 projects", lambda: tree.update_many(batch))
+    timed("read program subtotal", lambda: tree.node("PRG-000"))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:4]])
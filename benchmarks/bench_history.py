@@ -0,0 +1,76 @@
+"""Benchmark: years of daily milestone snapshots — disk size and as-of latency.
+
+Records one snapshot per day in which ~1% of milestones change, then times
+as-of reconstruction at random past dates.
+
+Usage: python -m benchmarks.bench_history [milestones] [days]
+"""
+
+from datetime import date, timedelta
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import timed
+from src.data.history import SnapshotHistory
+from src.data.schema import apply_schema
+
+_STATUSES = ["Not Started", "In Progress", "Completed", "Delayed", "Blocked"]
+
+
+def _milestones(count: int, rng: np.random.Generator) -> pd.DataFrame:
+    due = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 1000, count), unit="D")
+    df = pd.DataFrame(
+        {
+            "id": [f"MS-{i:06d}" for i in range(count)],
+            "program_id": [f"PRG-{i % 500:04d}" for i in range(count)],
+            "name": [f"Milestone {i}" for i in range(count)],
+            "status": rng.choice(_STATUSES, count),
+            "due_date": due,
+            "completed_date": pd.NaT,
+            "quarter": [f"Q{q} {y}" for q, y in zip(due.quarter, due.year)],
+            "owner": "Owner",
+            "is_key_milestone": rng.random(count) < 0.2,
+        }
+    )
+    return apply_schema(df, "milestones")
+
+
+def main(count: int = 20_000, days: int = 3 * 365):
+    rng = np.random.default_rng(42)
+    df = _milestones(count, rng)
+    start = date(2024, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.sqlite")
+        history = SnapshotHistory(path)
+        started = time.perf_counter()
+        for d in range(days):
+            changed = rng.choice(count, count // 100, replace=False)
+            df.loc[changed, "status"] = rng.choice(_STATUSES, len(changed))
+            history.record("milestones", df, start + timedelta(days=d))
+        elapsed = time.perf_counter() - started
+        print(f"{days} daily snapshots of {count:,} milestones in {elapsed:.1f}s")
+        print(f"  versions stored: {len(history.versions('milestones')):,}")
+        print(f"  on disk: {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"  full snapshots would be {days * count:,} rows")
+
+        target = start + timedelta(days=int(rng.integers(0, days)))
+        day_number = (target - date(1970, 1, 1)).days
+        timed(
+            "interval lookup",
+            lambda: history._conn.execute(
+                "SELECT COUNT(*) FROM milestones_validity "
+                "WHERE _valid_from <= ? AND _valid_to > ?",
+                (day_number, day_number),
+            ).fetchone(),
+        )
+        timed(f"as_of ({count:,} rows out)", lambda: history.as_of("milestones", target))
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
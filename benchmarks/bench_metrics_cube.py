@@ -0,0 +1,54 @@
+"""Benchmark: KPI page reductions — per-render groupby vs a prebuilt metrics cube.
+
+Times what one KPI render computes for a ten-program selection: the weekly
+DORA means, the velocity sums and the latest/previous-week card values.
+
+Usage: python -m benchmarks.bench_metrics_cube [programs] [weeks]
+"""
+
+import sys
+
+from benchmarks._common import timed, weekly_metrics
+from src.data.metrics_cube import MetricsCube
+
+_DORA = {
+    "deployment_frequency": "mean",
+    "lead_time_days": "mean",
+    "change_failure_rate": "mean",
+    "mttr_hours": "mean",
+}
+_VELOCITY = {"velocity": "sum", "planned_points": "sum", "delivered_points": "sum"}
+
+
+def _with_groupby(metrics, selected):
+    filtered = metrics[metrics["program_id"].isin(selected)]
+    filtered.groupby("week_start").agg(_DORA)
+    filtered.groupby("week_start").agg(_VELOCITY)
+    weeks = sorted(filtered["week_start"].unique())
+    for week in weeks[-2:]:
+        filtered[filtered["week_start"] == week][list(_DORA)].mean()
+
+
+def _with_cube(cube, selected):
+    view = cube.select(selected)
+    view.weekly(_DORA)
+    view.weekly(_VELOCITY)
+    for week in view.latest_weeks(2):
+        view.at_week(week, _DORA)
+
+
+def main(programs: int = 500, weeks: int = 520):
+    metrics = weekly_metrics(programs, weeks)
+    selected = [f"PRG-{i:04d}" for i in range(10)]
+    print(f"{len(metrics):,} metric rows ({programs} programs x {weeks} weeks), 10 selected")
+    timed("build cube (once per refresh)", lambda: MetricsCube.from_frame(metrics))
+    cube = MetricsCube.from_frame(metrics)
+    timed("groupby per render", lambda: _with_groupby(metrics, selected))
+    timed("cube slice per render", lambda: _with_cube(cube, selected))
+    everyone = list(cube.program_ids)
+    timed("groupby per render (all)", lambda: _with_groupby(metrics, everyone))
+    timed("cube slice per render (all)", lambda: _with_cube(cube, everyone))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
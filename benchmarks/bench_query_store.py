@@ -0,0 +1,62 @@
+"""Benchmark: program filter on the metrics history, mask vs indexed query.
+
+Compares the boolean-mask filter the KPI page used to run with an indexed
+``QueryStore.select`` as weekly history grows from one to ten years.
+
+Usage: python -m benchmarks.bench_query_store [programs]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import METRIC_COLUMNS, timed
+from src.data.query_store import QueryStore
+from src.data.schema import apply_schema
+
+
+def _metrics_history(programs: int, weeks: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    rows = programs * weeks
+    df = pd.DataFrame(
+        {
+            "program_id": np.repeat([f"PRG-{i:04d}" for i in range(programs)], weeks),
+            "week_start": np.tile(
+                pd.date_range("2015-01-05", periods=weeks, freq="W-MON"), programs
+            ),
+        }
+    )
+    for col in METRIC_COLUMNS:
+        df[col] = rng.uniform(0, 50, rows).round(1)
+    df["defect_count"] = rng.integers(0, 10, rows)
+    df["incident_count"] = rng.integers(0, 5, rows)
+    return apply_schema(df, "metrics")
+
+
+def main(programs: int = 200):
+    selected = [f"PRG-{i:04d}" for i in range(5)]
+    for years in (1, 5, 10):
+        df = _metrics_history(programs, weeks=52 * years)
+        store = QueryStore()
+        store.replace("metrics", df)
+        print(f"{years:>2} years: {len(df):,} rows")
+        timed("mask isin", lambda: df[df["program_id"].isin(selected)])
+        timed("indexed select", lambda: store.select("metrics", {"program_id": selected}))
+        recent = (df["week_start"].max() - pd.Timedelta(weeks=12)).date()
+        timed(
+            "mask isin, last 13 weeks",
+            lambda: df[
+                df["program_id"].isin(selected) & (df["week_start"] >= pd.Timestamp(recent))
+            ],
+        )
+        timed(
+            "indexed, last 13 weeks",
+            lambda: store.select(
+                "metrics", {"program_id": selected}, between={"week_start": (recent, None)}
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,60 @@
+"""Benchmark: schedule-based RAG status — scalar per program and date vs one pass.
+
+Programs come from the synthetic generator. The current view rates every
+program today; the history rates every program on every week.
+
+Usage: python -m benchmarks.bench_rag [programs] [weeks]
+"""
+
+from datetime import date
+import sys
+
+import pandas as pd
+
+from benchmarks._common import timed
+from src.data.schema import add_derived_columns
+from src.data.status_history import StatusHistory
+from src.data.synthetic import generate_portfolio
+from src.utils.constants import ProgramStatus
+
+
+def _target(start, end, when) -> float:
+    """Percent of the schedule elapsed on ``when``, one program at a time."""
+    length = (end - start).days
+    if length <= 0:
+        return 100.0 if when >= start else 0.0
+    return min(max((when - start).days / length * 100, 0.0), 100.0)
+
+
+def _rag(percent_complete: float, target_percent: float) -> ProgramStatus:
+    """The previous scalar ``rag_status``."""
+    if percent_complete >= 100:
+        return ProgramStatus.COMPLETED
+    gap = target_percent - percent_complete
+    if gap <= 10:
+        return ProgramStatus.ON_TRACK
+    elif gap <= 25:
+        return ProgramStatus.AT_RISK
+    return ProgramStatus.OFF_TRACK
+
+
+def _scalar(programs: pd.DataFrame, dates) -> list[list[str]]:
+    rows = programs[["percent_complete", "start_date", "target_end_date"]]
+    return [
+        [_rag(p, _target(s.date(), e.date(), d)).value for p, s, e in rows.itertuples(False)]
+        for d in dates
+    ]
+
+
+def main(programs: int = 5_000, weeks: int = 104):
+    frame = generate_portfolio(programs=programs, weeks=1)["programs"]
+    dates = pd.date_range(end=date.today(), periods=weeks, freq="W-MON").date
+    print(f"{programs:,} programs x {weeks} weeks")
+    timed("current view, scalar", lambda: _scalar(frame, [date.today()]), repeat=1)
+    timed("current view, derived column", lambda: add_derived_columns(frame, "programs"))
+    timed("history, scalar", lambda: _scalar(frame, dates), repeat=1)
+    timed("history, one pass", lambda: StatusHistory.from_schedule(frame, dates))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
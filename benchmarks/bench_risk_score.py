@@ -0,0 +1,43 @@
+"""Benchmark: risk register scoring and sorting — row-wise apply vs the code lookup.
+
+Usage: python -m benchmarks.bench_risk_score [rows]
+"""
+
+import sys
+
+from benchmarks._common import timed
+from src.data.schema import add_derived_columns
+from src.data.synthetic import generate_portfolio
+from src.utils.constants import RiskLikelihood, RiskSeverity
+from src.utils.helpers import risk_score
+
+
+def _apply(risks):
+    """The previous path: ``risk_score`` per row through ``apply(axis=1)``, then sort."""
+    scored = risks.copy()
+    scored["_risk_score"] = scored.apply(
+        lambda r: risk_score(RiskSeverity(r["severity"]), RiskLikelihood(r["likelihood"])),
+        axis=1,
+    )
+    return scored.sort_values("_risk_score", ascending=False).drop(columns=["_risk_score"])
+
+
+def main(rows: int = 100_000):
+    risks = generate_portfolio(programs=int(rows / 2.5), weeks=1)["risks"]
+    print(f"{len(risks):,} risks")
+    timed("apply(axis=1) + sort", lambda: _apply(risks), repeat=1)
+    timed(
+        "score column at load + sort",
+        lambda: add_derived_columns(risks, "risks").sort_values(
+            "risk_score", ascending=False, kind="stable"
+        ),
+    )
+    loaded = add_derived_columns(risks, "risks")
+    timed(
+        "sort on loaded column",
+        lambda: loaded.sort_values("risk_score", ascending=False, kind="stable"),
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
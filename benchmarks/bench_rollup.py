@@ -0,0 +1,87 @@
+"""Benchmark: portfolio rollup build and lookups at 5,000 programs.
+
+Compares the per-chart groupbys the pages used to run against lookups in a
+prebuilt department x status x quarter rollup.
+
+Usage: python -m benchmarks.bench_rollup [programs]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import timed
+from src.data.rollup import DORA_MEASURES, PortfolioRollup
+from src.data.schema import apply_schema
+from src.utils.constants import DEPARTMENTS, ProgramStatus
+
+
+def _frames(count: int):
+    rng = np.random.default_rng(42)
+    ids = [f"PRG-{i:05d}" for i in range(count)]
+    start = pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 365, count), unit="D")
+    budget = rng.uniform(0.5, 10, count).round(1)
+    programs = apply_schema(
+        pd.DataFrame(
+            {
+                "id": ids,
+                "name": [f"Program {i}" for i in range(count)],
+                "department": rng.choice(DEPARTMENTS, count),
+                "status": rng.choice([s.value for s in ProgramStatus], count),
+                "percent_complete": rng.uniform(0, 100, count).round(0),
+                "start_date": start,
+                "target_end_date": start + pd.to_timedelta(rng.integers(90, 900, count), unit="D"),
+                "owner": "Owner",
+                "description": "",
+                "budget_millions": budget,
+                "budget_spent_millions": (budget * rng.uniform(0.2, 1.2, count)).round(1),
+            }
+        ),
+        "programs",
+    )
+    risks = pd.DataFrame(
+        {
+            "program_id": rng.choice(ids, count * 10),
+            "is_open": rng.random(count * 10) < 0.6,
+        }
+    )
+    dora = pd.DataFrame(rng.uniform(0, 50, (count, len(DORA_MEASURES))), ids, DORA_MEASURES)
+    return programs, risks, dora
+
+
+def _per_chart(programs, risks):
+    programs.groupby("status", observed=True)["budget_millions"].sum()
+    programs.groupby("department", observed=True)[["budget_millions", "percent_complete"]].agg(
+        ["sum", "mean"]
+    )
+    open_risks = risks[risks["is_open"]]
+    programs["id"].map(open_risks["program_id"].value_counts()).groupby(
+        programs["department"], observed=True
+    ).sum()
+    programs["budget_millions"].sum()
+
+
+def main(count: int = 5_000):
+    programs, risks, dora = _frames(count)
+    print(f"{count:,} programs, {len(risks):,} risks")
+    timed(
+        "build rollup (once per refresh)",
+        lambda: PortfolioRollup.from_frames(programs, risks, dora),
+    )
+    rollup = PortfolioRollup.from_frames(programs, risks, dora)
+    print(f"  rollup rows: {len(rollup.table):,}")
+    timed("per-chart groupbys", lambda: _per_chart(programs, risks))
+    timed(
+        "rollup lookups",
+        lambda: (
+            rollup.breakdown("status"),
+            rollup.breakdown("department"),
+            rollup.breakdown("status", department=DEPARTMENTS[0]),
+            rollup.total(),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
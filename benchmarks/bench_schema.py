@@ -0,0 +1,39 @@
+"""Benchmark: object-dtype vs schema-typed metrics frame at 1M rows.
+
+Usage: python -m benchmarks.bench_schema [rows]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import METRIC_COLUMNS, timed
+from src.data.schema import apply_schema
+
+
+def _raw_metrics(rows: int, programs: int = 1000) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    ids = np.array([f"PRG-{i:04d}" for i in range(programs)], dtype=object)
+    df = pd.DataFrame({"program_id": ids[rng.integers(0, programs, rows)]})
+    for col in METRIC_COLUMNS:
+        df[col] = rng.uniform(0, 50, rows).round(1)
+    df["defect_count"] = rng.integers(0, 10, rows)
+    df["incident_count"] = rng.integers(0, 5, rows)
+    return df
+
+
+def main(rows: int = 1_000_000):
+    raw = _raw_metrics(rows)
+    typed = apply_schema(raw, "metrics")
+    target = "PRG-0042"
+
+    for label, df in (("object dtypes", raw), ("schema dtypes", typed)):
+        mb = df.memory_usage(deep=True).sum() / 1e6
+        print(f"{label}: {rows:,} rows, {mb:.1f} MB")
+        timed("filter program_id ==", lambda: df[df["program_id"] == target])
+        timed("groupby program_id mean", lambda: df.groupby("program_id", observed=True).mean())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
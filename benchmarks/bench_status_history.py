@@ -0,0 +1,56 @@
+"""Benchmark: status of every program for every week — linear scan vs searchsorted.
+
+Usage: python -m benchmarks.bench_status_history [programs] [weeks]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import timed
+from src.data.status_history import StatusHistory
+from src.utils.constants import ProgramStatus
+
+_STATUSES = [s.value for s in ProgramStatus]
+
+
+def _transitions(programs: int, per_program: int, rng: np.random.Generator) -> dict:
+    start = np.datetime64("2016-01-04")
+    table = {}
+    for p in range(programs):
+        offsets = np.sort(rng.choice(3650, per_program, replace=False))
+        table[f"PRG-{p:04d}"] = [
+            ((start + int(o)).item(), _STATUSES[rng.integers(0, 4)]) for o in offsets
+        ]
+    return table
+
+
+def _linear(table: dict, weeks) -> list[list[str]]:
+    out = []
+    for week in weeks:
+        row = []
+        for changes in table.values():
+            status = ProgramStatus.ON_TRACK.value
+            for changed_at, new_status in changes:
+                if week >= changed_at:
+                    status = new_status
+            row.append(status)
+        out.append(row)
+    return out
+
+
+def main(programs: int = 1000, weeks: int = 520):
+    rng = np.random.default_rng(42)
+    table = _transitions(programs, 6, rng)
+    dates = pd.date_range("2016-01-04", periods=weeks, freq="W-MON").date
+    print(f"{programs:,} programs x {weeks} weeks, 6 transitions each")
+    timed("linear scan", lambda: _linear(table, dates), repeat=1)
+    history = StatusHistory.from_transitions(table)
+    timed("build StatusHistory", lambda: StatusHistory.from_transitions(table))
+    timed("searchsorted grid", lambda: history.status_grid(dates))
+    timed("searchsorted counts", lambda: history.counts(dates))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,71 @@
+"""Benchmark: mock-style per-row generation vs the vectorized synthetic generator.
+
+The per-row path builds ``DeliveryMetric`` objects in a Python loop, as
+``mock_data._generate_metrics`` does, and converts them to a frame.
+
+Usage: python -m benchmarks.bench_synthetic [programs] [weeks]
+       python -m benchmarks.bench_synthetic <scenario>   # e.g. enterprise, stress
+"""
+
+from datetime import date, timedelta
+import random
+import sys
+
+from benchmarks._common import timed
+from src.data.mock_data import SCENARIOS
+from src.data.models import DeliveryMetric
+from src.data.schema import frame_from_models
+from src.data.synthetic import generate_portfolio
+
+
+def _per_row(programs: int, weeks: int):
+    random.seed(42)
+    start = date(2025, 7, 7)
+    metrics = []
+    for p in range(programs):
+        for w in range(weeks):
+            noise = random.uniform(0.85, 1.15)
+            trend = 1 + w * 0.008
+            velocity = round(40 * noise * trend, 1)
+            metrics.append(
+                DeliveryMetric(
+                    program_id=f"PRG-{p:05d}",
+                    week_start=start + timedelta(weeks=w),
+                    velocity=velocity,
+                    planned_points=round(velocity * random.uniform(0.9, 1.15), 1),
+                    delivered_points=round(velocity * random.uniform(0.85, 1.05), 1),
+                    defect_count=max(0, int(3 * noise + random.randint(-2, 2))),
+                    incident_count=random.randint(0, 1),
+                    mttr_hours=round(random.uniform(0.5, 4.0), 1),
+                    deployment_frequency=round(5 * noise * trend, 1),
+                    lead_time_days=round(2 * random.uniform(0.7, 1.3) * (2 - trend), 1),
+                    change_failure_rate=round(max(1, min(50, 7 * noise * (2 - trend))), 1),
+                )
+            )
+    return frame_from_models(metrics, "metrics")
+
+
+def main(programs: int = 10_000, weeks: int = 104, **density):
+    print(f"{programs:,} programs x {weeks} weeks = {programs * weeks:,} metric rows")
+    timed("per-row metrics (1/10 scale)", lambda: _per_row(programs // 10, weeks), repeat=1)
+    timed(
+        "vectorized, all datasets", lambda: generate_portfolio(programs, weeks, **density), repeat=3
+    )
+    frames = generate_portfolio(programs, weeks, **density)
+    for name, df in frames.items():
+        print(f"  {name:<20} {len(df):>10,} rows {df.memory_usage(deep=True).sum() / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in SCENARIOS:
+        scenario = SCENARIOS[sys.argv[1]]
+        main(
+            scenario.programs or 6,
+            scenario.weeks,
+            milestones_per_program=scenario.milestones_per_program,
+            risks_per_program=scenario.risks_per_program,
+            escalation_rate=scenario.escalation_rate,
+            seed=scenario.seed,
+        )
+    else:
+        main(*[int(a) for a in sys.argv[1:3]])
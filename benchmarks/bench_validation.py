@@ -0,0 +1,63 @@
+"""Benchmark: per-row model validation vs column-wise validate_frame.
+
+Usage: python -m benchmarks.bench_validation [rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+
+from src.data.models import DeliveryMetric
+from src.data.validation import validate_frame
+
+
+def _raw_metrics(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    weeks = pd.date_range("2024-01-01", periods=52, freq="W-MON").date
+    df = pd.DataFrame(
+        {
+            "program_id": [f"PRG-{i:04d}" for i in rng.integers(0, 1000, rows)],
+            "week_start": weeks[rng.integers(0, len(weeks), rows)],
+            "velocity": rng.uniform(0, 50, rows).round(1),
+            "defect_count": rng.integers(0, 10, rows),
+            "incident_count": rng.integers(0, 5, rows),
+            "change_failure_rate": rng.uniform(0, 30, rows).round(1),
+        }
+    )
+    # Sprinkle in a few bad rows to exercise quarantine
+    df["defect_count"] = df["defect_count"].astype(float)
+    df.loc[df.sample(frac=0.001, random_state=1).index, "defect_count"] = 1.5
+    return df
+
+
+def main(rows: int = 1_000_000):
+    df = _raw_metrics(rows)
+    records = df.to_dict("records")
+    print(f"metrics: {rows:,} rows")
+
+    started = time.perf_counter()
+    adapter = TypeAdapter(DeliveryMetric)
+    rejected = 0
+    for record in records:
+        try:
+            adapter.validate_python(record)
+        except ValueError:
+            rejected += 1
+    print(
+        f"  per-row model validation   {(time.perf_counter() - started) * 1000:8.0f} ms "
+        f"({rejected:,} rejected)"
+    )
+
+    started = time.perf_counter()
+    valid, violations = validate_frame(df, "metrics")
+    print(
+        f"  validate_frame             {(time.perf_counter() - started) * 1000:8.0f} ms "
+        f"({violations['row'].nunique():,} quarantined)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -2,14 +2,18 @@
 
 from datetime import date as _date
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from src.data.metrics_cube import MetricsCube
+from src.data.rollup import PortfolioRollup
 from src.utils.constants import (
     CHART_PALETTE,
     DORA_BAND_COLORS,
     DORA_BENCHMARKS,
+    DORA_MATURITY_COLORS,
     MILESTONE_COLORS,
     SEVERITY_COLORS,
     STATUS_COLORS,
@@ -18,6 +22,7 @@ from src.utils.constants import (
     RiskLikelihood,
     RiskSeverity,
 )
+from src.utils.helpers import DORA_LEVELS
 
 _LAYOUT_DEFAULTS = dict(
     font=dict(family="Inter, sans-serif", size=12, color="#1A1A2E"),
@@ -59,6 +64,7 @@ def _empty_chart(message: str, height: int = 300) -> go.Figure:
 def program_status_donut(programs_df: pd.DataFrame) -> go.Figure:
     """Donut chart of program status distribution."""
     counts = programs_df["status"].value_counts()
+    counts = counts[counts > 0]
     colors = [STATUS_COLORS.get(ProgramStatus(s), "#95A5A6") for s in counts.index]
     fig = go.Figure(
         go.Pie(
@@ -139,11 +145,15 @@ def budget_by_program_bar(programs_df: pd.DataFrame) -> go.Figure:
     )
 
 
-def budget_by_status_pie(programs_df: pd.DataFrame) -> go.Figure:
+def budget_by_status_pie(programs: PortfolioRollup | pd.DataFrame) -> go.Figure:
     """Donut chart of budget allocation by program status."""
-    if programs_df.empty:
+    if isinstance(programs, pd.DataFrame):
+        if programs.empty:
+            return _empty_chart("No budget data")
+        programs = PortfolioRollup.from_frames(programs)
+    budget_by_status = programs.breakdown("status")["budget_millions"]
+    if budget_by_status.empty:
         return _empty_chart("No budget data")
-    budget_by_status = programs_df.groupby("status")["budget_millions"].sum()
     colors = [STATUS_COLORS.get(ProgramStatus(s), "#95A5A6") for s in budget_by_status.index]
     fig = go.Figure(
         go.Pie(
@@ -212,6 +222,38 @@ def budget_utilization_bar(programs_df: pd.DataFrame) -> go.Figure:
     )
 
 
+def schedule_status_trend(counts: pd.DataFrame) -> go.Figure:
+    """Stacked area chart of programs per schedule status on each date.
+
+    ``counts`` is ``StatusHistory.counts(dates)``: one row per date, one
+    column per status.
+    """
+    if counts.empty:
+        return _empty_chart("No schedule history")
+    fig = go.Figure()
+    for status in counts.columns:
+        if not counts[status].any():
+            continue
+        color = STATUS_COLORS.get(ProgramStatus(status), "#95A5A6")
+        fig.add_trace(
+            go.Scatter(
+                x=counts.index,
+                y=counts[status],
+                name=status,
+                stackgroup="one",
+                line=dict(color=color),
+                fillcolor=_hex_to_rgba(color, 0.5),
+            )
+        )
+    return _apply_layout(
+        fig,
+        title="Schedule Status Over Time",
+        xaxis_title="Date",
+        yaxis_title="Programs",
+        height=350,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Milestone Tracker
 # ---------------------------------------------------------------------------
@@ -345,7 +387,11 @@ def gantt_chart(milestones_df: pd.DataFrame, programs_df: pd.DataFrame) -> go.Fi
 
 def milestone_status_bar(milestones_df: pd.DataFrame) -> go.Figure:
     """Stacked bar chart: milestone status by quarter."""
-    counts = milestones_df.groupby(["quarter", "status"]).size().reset_index(name="count")
+    counts = (
+        milestones_df.groupby(["quarter", "status"], observed=True)
+        .size()
+        .reset_index(name="count")
+    )
     color_map = {s.value: MILESTONE_COLORS[s] for s in MilestoneStatus}
     fig = px.bar(
         counts,
@@ -374,7 +420,11 @@ def delivery_predictability(milestones_df: pd.DataFrame) -> go.Figure:
         return _apply_layout(fig, height=300)
 
     completed["on_time"] = completed["completed_date"] <= completed["due_date"]
-    summary = completed.groupby("quarter")["on_time"].agg(["sum", "count"]).reset_index()
+    summary = (
+        completed.groupby("quarter", observed=True)["on_time"]
+        .agg(["sum", "count"])
+        .reset_index()
+    )
     summary.columns = ["quarter", "on_time", "total"]
     summary["late"] = summary["total"] - summary["on_time"]
 
@@ -445,7 +495,9 @@ def risk_trend(risks_df: pd.DataFrame) -> go.Figure:
     # Build cumulative open risk counts over time
     if "raised_date" not in open_risks.columns:
         # Fallback: simple bar chart if no date data
-        counts = open_risks.groupby("severity").size().reset_index(name="count")
+        counts = (
+            open_risks.groupby("severity", observed=True).size().reset_index(name="count")
+        )
         colors = [SEVERITY_COLORS.get(RiskSeverity(s), "#95A5A6") for s in counts["severity"]]
         fig = go.Figure(
             go.Bar(
@@ -458,39 +510,23 @@ def risk_trend(risks_df: pd.DataFrame) -> go.Figure:
         )
         return _apply_layout(fig, title="Open Risks by Severity", height=320)
 
-    # Generate time series: for each day from earliest raised_date to today,
-    # count cumulative open risks by severity
-    min_date = open_risks["raised_date"].min()
-    today = _date.today()
-    if hasattr(min_date, "date"):
-        min_date = min_date.date()
+    # Count cumulative open risks by severity at each month boundary from the
+    # earliest raised_date to today, via binary search over sorted dates.
+    raised = pd.to_datetime(open_risks["raised_date"])
+    min_date = raised.min().normalize()
+    today = pd.Timestamp(_date.today())
+    dates = pd.DatetimeIndex([min_date, today]).union(
+        pd.date_range(min_date + pd.offsets.MonthBegin(1), today, freq="MS")
+    )
 
     sev_order = [s.value for s in RiskSeverity]
     fig = go.Figure()
 
     for sev in reversed(sev_order):
-        sev_risks = open_risks[open_risks["severity"] == sev]
-        if sev_risks.empty:
+        sev_raised = np.sort(raised[open_risks["severity"] == sev].to_numpy())
+        if len(sev_raised) == 0:
             continue
-
-        # Build cumulative count at month boundaries for efficiency
-        dates = []
-        counts = []
-        d = min_date
-        while d <= today:
-            count = len(sev_risks[sev_risks["raised_date"] <= d])
-            dates.append(d)
-            counts.append(count)
-            # Move to next month
-            if d.month == 12:
-                d = d.replace(year=d.year + 1, month=1, day=1)
-            else:
-                d = d.replace(month=d.month + 1, day=1)
-        # Always include today
-        if dates[-1] != today:
-            count = len(sev_risks[sev_risks["raised_date"] <= today])
-            dates.append(today)
-            counts.append(count)
+        counts = np.searchsorted(sev_raised, dates.to_numpy(), side="right")
 
         color = SEVERITY_COLORS.get(RiskSeverity(sev), "#95A5A6")
         fill = _hex_to_rgba(color, 0.5) if color.startswith("#") else color
@@ -519,17 +555,19 @@ def risk_trend(risks_df: pd.DataFrame) -> go.Figure:
 # ---------------------------------------------------------------------------
 
 
-def velocity_trend(metrics_df: pd.DataFrame, program_id: str | None = None) -> go.Figure:
+def _as_cube(metrics: MetricsCube | pd.DataFrame) -> MetricsCube:
+    return metrics if isinstance(metrics, MetricsCube) else MetricsCube.from_frame(metrics)
+
+
+def velocity_trend(
+    metrics: MetricsCube | pd.DataFrame, program_id: str | None = None
+) -> go.Figure:
     """Line chart of velocity over time."""
-    df = metrics_df.copy()
+    cube = _as_cube(metrics)
     if program_id:
-        df = df[df["program_id"] == program_id]
+        cube = cube.select([program_id])
 
-    agg = (
-        df.groupby("week_start")
-        .agg({"velocity": "sum", "planned_points": "sum", "delivered_points": "sum"})
-        .reset_index()
-    )
+    agg = cube.weekly({"velocity": "sum", "planned_points": "sum", "delivered_points": "sum"})
 
     fig = go.Figure()
     fig.add_trace(
@@ -561,19 +599,15 @@ def velocity_trend(metrics_df: pd.DataFrame, program_id: str | None = None) -> g
     )
 
 
-def dora_metrics_chart(metrics_df: pd.DataFrame) -> go.Figure:
+def dora_metrics_chart(metrics: MetricsCube | pd.DataFrame) -> go.Figure:
     """Multi-panel DORA metrics with benchmark bands."""
-    agg = (
-        metrics_df.groupby("week_start")
-        .agg(
-            {
-                "deployment_frequency": "mean",
-                "lead_time_days": "mean",
-                "change_failure_rate": "mean",
-                "mttr_hours": "mean",
-            }
-        )
-        .reset_index()
+    agg = _as_cube(metrics).weekly(
+        {
+            "deployment_frequency": "mean",
+            "lead_time_days": "mean",
+            "change_failure_rate": "mean",
+            "mttr_hours": "mean",
+        }
     )
 
     from plotly.subplots import make_subplots
@@ -681,13 +715,37 @@ def _add_dora_bands_lower(fig, thresholds, colors, row, col):
     )
 
 
-def defect_incident_trend(metrics_df: pd.DataFrame) -> go.Figure:
-    """Stacked area chart of defects and incidents over time."""
-    agg = (
-        metrics_df.groupby("week_start")
-        .agg({"defect_count": "sum", "incident_count": "sum"})
-        .reset_index()
+def dora_maturity_trend(metrics: MetricsCube | pd.DataFrame) -> go.Figure:
+    """Stacked area chart of how many programs sit at each DORA maturity level per week."""
+    counts = _as_cube(metrics).maturity_counts()
+    if counts.empty:
+        return _empty_chart("No DORA metrics")
+
+    fig = go.Figure()
+    for level in DORA_LEVELS:
+        color = DORA_MATURITY_COLORS[level]
+        fig.add_trace(
+            go.Scatter(
+                x=counts["week_start"],
+                y=counts[level],
+                name=level,
+                stackgroup="one",
+                line=dict(color=color),
+                fillcolor=_hex_to_rgba(color, 0.5),
+            )
+        )
+    return _apply_layout(
+        fig,
+        title="DORA Maturity Over Time",
+        xaxis_title="Week",
+        yaxis_title="Programs",
+        height=350,
     )
+
+
+def defect_incident_trend(metrics: MetricsCube | pd.DataFrame) -> go.Figure:
+    """Stacked area chart of defects and incidents over time."""
+    agg = _as_cube(metrics).weekly({"defect_count": "sum", "incident_count": "sum"})
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -21,10 +21,13 @@ def program_filter(programs_df, key: str = "program_filter") -> list[str]:
 def quarter_filter(
     key: str = "quarter_filter",
     milestones_df: pd.DataFrame | None = None,
+    options: list[str] | None = None,
 ) -> list[str]:
     """Multi-select filter for quarters. Derives quarters from data when provided."""
-    if milestones_df is not None and not milestones_df.empty:
-        quarters = compute_quarters(milestones_df["due_date"].tolist())
+    if options:
+        quarters = list(options)
+    elif milestones_df is not None and not milestones_df.empty:
+        quarters = compute_quarters(milestones_df["due_date"].drop_duplicates().tolist())
     else:
         quarters = list(QUARTERS)
     return st.multiselect("Quarters", options=quarters, default=quarters, key=key)
@@ -7,11 +7,18 @@ from src.utils.constants import SEVERITY_COLORS, STATUS_COLORS, ProgramStatus, R
 
 
 def styled_program_table(df: pd.DataFrame):
-    """Display programs table with status color coding."""
-    display_df = df[
-        ["name", "department", "status", "percent_complete", "owner", "target_end_date"]
-    ].copy()
-    display_df.columns = ["Program", "Department", "Status", "% Complete", "Owner", "Target Date"]
+    """Display programs table with status color coding.
+
+    Loader frames also show the schedule-based status next to the reported one.
+    """
+    cols = ["name", "department", "status", "percent_complete", "owner", "target_end_date"]
+    labels = ["Program", "Department", "Status", "% Complete", "Owner", "Target Date"]
+    if "schedule_status" in df.columns:
+        cols.insert(3, "schedule_status")
+        labels.insert(3, "Schedule")
+    display_df = df[cols].copy()
+    display_df.columns = labels
+    display_df["Target Date"] = display_df["Target Date"].dt.date
 
     st.dataframe(
         display_df.style.map(
@@ -20,7 +27,7 @@ def styled_program_table(df: pd.DataFrame):
                 if v in [s.value for s in ProgramStatus]
                 else ""
             ),
-            subset=["Status"],
+            subset=[label for label in ("Status", "Schedule") if label in labels],
         ).format({"% Complete": "{:.0f}%"}),
         use_container_width=True,
         hide_index=True,
@@ -38,20 +45,18 @@ def _age_color(age_days: int) -> str:
 
 def styled_risk_table(df: pd.DataFrame):
     """Display risks table with severity color coding, age, and risk score."""
-    from src.utils.constants import RiskLikelihood
-    from src.utils.helpers import risk_score
+    from src.data.schema import risk_scores
 
     cols = ["title", "program_id", "severity", "likelihood", "owner", "is_open"]
     has_age = "risk_age_days" in df.columns
 
     display_df = df[cols].copy()
 
-    # Compute risk score
-    display_df["Risk Score"] = df.apply(
-        lambda r: risk_score(
-            RiskSeverity(r["severity"]), RiskLikelihood(r["likelihood"])
-        ),
-        axis=1,
+    # Loader frames carry the score; compute it for any other frame
+    display_df["Risk Score"] = (
+        df["risk_score"].to_numpy()
+        if "risk_score" in df.columns
+        else risk_scores(df["severity"], df["likelihood"])
     )
 
     if has_age:
@@ -82,7 +87,8 @@ def styled_escalation_table(df: pd.DataFrame):
     """Display escalations table."""
     display_df = df[["title", "program_id", "level", "raised_date", "resolved_date"]].copy()
     display_df.columns = ["Escalation", "Program", "Level", "Raised", "Resolved"]
-    display_df["Resolved"] = display_df["Resolved"].fillna("Open")
+    display_df["Raised"] = display_df["Raised"].dt.date
+    display_df["Resolved"] = display_df["Resolved"].dt.strftime("%Y-%m-%d").fillna("Open")
 
     st.dataframe(display_df, use_container_width=True, hide_index=True)
 
@@ -93,6 +99,7 @@ def styled_milestone_table(df: pd.DataFrame):
         ["name", "program_id", "status", "due_date", "quarter", "is_key_milestone"]
     ].copy()
     display_df.columns = ["Milestone", "Program", "Status", "Due Date", "Quarter", "Key"]
+    display_df["Due Date"] = display_df["Due Date"].dt.date
     display_df["Key"] = display_df["Key"].map({True: "Yes", False: ""})
 
     st.dataframe(display_df, use_container_width=True, hide_index=True)
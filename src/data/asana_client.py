@@ -8,7 +8,9 @@ To enable Asana integration:
 Portfolio URL format: https://app.asana.com/0/portfolio/{portfolio_gid}/{project_gid}
 
 This module fetches portfolio projects and their tasks, mapping them to the
-dashboard's data models (Program, Milestone, RiskItem, etc.).
+dashboard's data models (Program, Milestone, RiskItem, etc.). Each top-level
+portfolio item is a program; an item that is itself a portfolio is walked
+recursively, and its projects make up the program (see ``fetch_hierarchy``).
 """
 
 from datetime import date, timedelta
@@ -16,10 +18,12 @@ from datetime import date, timedelta
 import pandas as pd
 import requests
 
+from src.data.query_spec import QuerySpec
 from src.utils.config import get_nested
 from src.utils.constants import (
     EscalationLevel,
     MilestoneStatus,
+    NodeLevel,
     ProgramStatus,
     RiskLikelihood,
     RiskSeverity,
@@ -27,6 +31,13 @@ from src.utils.constants import (
 
 _BASE_URL = "https://app.asana.com/api/1.0"
 
+_CUSTOM_FIELDS = (
+    "custom_fields,custom_fields.name,"
+    "custom_fields.enum_value,custom_fields.enum_value.name,"
+    "custom_fields.number_value,custom_fields.text_value,"
+    "custom_fields.display_value"
+)
+
 
 def _get_session() -> tuple[requests.Session, str]:
     """Create an authenticated Asana session and return (session, portfolio_gid)."""
@@ -137,6 +148,28 @@ def _extract_custom_field(task: dict, field_name: str) -> str | None:
     return None
 
 
+def _portfolio_programs(
+    session: requests.Session,
+    portfolio_gid: str,
+    spec: QuerySpec | None,
+    opt_fields: str = "name,resource_type",
+) -> list[tuple[str, dict]]:
+    """Return ``(program_id, project)`` pairs, limited to the spec's programs.
+
+    Program ids follow the project's position in the portfolio, so the item
+    list is always read in full; the per-project requests for unselected
+    programs are what the spec saves.
+    """
+    items = _paginate(
+        session,
+        f"/portfolios/{portfolio_gid}/items",
+        params={"opt_fields": opt_fields},
+    )
+    selected = set(spec.program_ids) if spec and spec.program_ids is not None else None
+    programs = [(f"PRG-{idx:03d}", item) for idx, item in enumerate(items, 1)]
+    return [(pid, item) for pid, item in programs if selected is None or pid in selected]
+
+
 def _compute_percent_complete(session: requests.Session, project_gid: str) -> float:
     """Compute percent complete from task completion ratio."""
     tasks = _paginate(
@@ -150,24 +183,19 @@ def _compute_percent_complete(session: requests.Session, project_gid: str) -> fl
     return round((completed / len(tasks)) * 100, 1)
 
 
-def fetch_programs() -> pd.DataFrame:
+def fetch_programs(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch portfolio items (projects) and map to Program model."""
     session, portfolio_gid = _get_session()
 
-    items = _paginate(
+    items = _portfolio_programs(
         session,
-        f"/portfolios/{portfolio_gid}/items",
-        params={
-            "opt_fields": (
-                "name,owner,owner.name,due_on,start_on,"
-                "current_status_update,current_status_update.status_type,"
-                "current_status_update.text,"
-                "custom_fields,custom_fields.name,"
-                "custom_fields.enum_value,custom_fields.enum_value.name,"
-                "custom_fields.number_value,custom_fields.text_value,"
-                "custom_fields.display_value"
-            ),
-        },
+        portfolio_gid,
+        spec,
+        opt_fields=(
+            "name,resource_type,owner,owner.name,due_on,start_on,"
+            "current_status_update,current_status_update.status_type,"
+            "current_status_update.text," + _CUSTOM_FIELDS
+        ),
     )
 
     department_field = get_nested("asana", "department_field", "Department")
@@ -175,15 +203,26 @@ def fetch_programs() -> pd.DataFrame:
     budget_spent_field = get_nested("asana", "budget_spent_field", "Budget Spent")
 
     programs = []
-    for idx, item in enumerate(items, 1):
+    for program_id, item in items:
         gid = item["gid"]
 
         # Get project status from current_status_update
         status_update = item.get("current_status_update") or {}
         status_type = status_update.get("status_type", "")
 
-        # Compute completion percentage from tasks
-        percent = _compute_percent_complete(session, gid)
+        # Compute completion percentage from tasks, or from the projects of a
+        # nested portfolio
+        leaves = []
+        if item.get("resource_type") == "portfolio":
+            nodes = _hierarchy_nodes(session, item, program_id, None, NodeLevel.PROGRAM, program_id)
+            leaves = [n for n in nodes if n["percent_complete"] is not None]
+            percent = (
+                round(sum(n["percent_complete"] for n in leaves) / len(leaves), 1)
+                if leaves
+                else 0.0
+            )
+        else:
+            percent = _compute_percent_complete(session, gid)
 
         owner = item.get("owner") or {}
         start = _parse_date(item.get("start_on")) or date.today()
@@ -193,15 +232,19 @@ def fetch_programs() -> pd.DataFrame:
         department = _extract_custom_field(item, department_field) or "General"
         budget_str = _extract_custom_field(item, budget_field)
         budget_spent_str = _extract_custom_field(item, budget_spent_field)
-        budget = float(budget_str) if budget_str else 0.0
-        budget_spent = float(budget_spent_str) if budget_spent_str else 0.0
+        budget = float(budget_str) if budget_str else sum(n["budget_millions"] for n in leaves)
+        budget_spent = (
+            float(budget_spent_str)
+            if budget_spent_str
+            else sum(n["budget_spent_millions"] for n in leaves)
+        )
 
         description = status_update.get("text", "") or ""
 
         programs.append(
             {
-                "id": f"PRG-{idx:03d}",
-                "name": item.get("name", f"Project {idx}"),
+                "id": program_id,
+                "name": item.get("name", f"Project {program_id}"),
                 "department": department,
                 "status": _map_status(status_type, percent).value,
                 "percent_complete": percent,
@@ -225,6 +268,101 @@ def fetch_programs() -> pd.DataFrame:
     return pd.DataFrame(programs)
 
 
+def _item_budget(item: dict) -> tuple[float, float]:
+    """Budget and spend (in millions) from a portfolio item's custom fields."""
+    budget = _extract_custom_field(item, get_nested("asana", "budget_field", "Budget"))
+    spent = _extract_custom_field(
+        item, get_nested("asana", "budget_spent_field", "Budget Spent")
+    )
+    return float(budget) if budget else 0.0, float(spent) if spent else 0.0
+
+
+def _project_percent(session: requests.Session, project_gid: str) -> float:
+    """Completion from the project's task counts — one small request per project."""
+    counts = _get(
+        session,
+        f"/projects/{project_gid}/task_counts",
+        params={"opt_fields": "num_tasks,num_completed_tasks"},
+    ).get("data", {})
+    total = counts.get("num_tasks") or 0
+    return round(counts.get("num_completed_tasks", 0) / total * 100, 1) if total else 0.0
+
+
+def _hierarchy_nodes(
+    session: requests.Session,
+    item: dict,
+    node_id: str,
+    parent_id: str | None,
+    level: NodeLevel,
+    program_id: str,
+) -> list[dict]:
+    """PortfolioNode rows for ``item`` and, if it is a portfolio, everything below it.
+
+    Projects are the leaves and carry completion and budget; nested
+    portfolios only group them, so their own budget fields are not counted.
+    """
+    is_portfolio = item.get("resource_type") == "portfolio"
+    budget, spent = (0.0, 0.0) if is_portfolio else _item_budget(item)
+    nodes = [
+        {
+            "id": node_id,
+            "parent_id": parent_id,
+            "name": item.get("name", node_id),
+            "level": level.value,
+            "program_id": program_id,
+            "percent_complete": None if is_portfolio else _project_percent(session, item["gid"]),
+            "budget_millions": budget,
+            "budget_spent_millions": spent,
+        }
+    ]
+    if not is_portfolio:
+        return nodes
+    children = _paginate(
+        session,
+        f"/portfolios/{item['gid']}/items",
+        params={"opt_fields": "name,resource_type," + _CUSTOM_FIELDS},
+    )
+    for child in children:
+        if child.get("resource_type") == "portfolio":
+            child_id, child_level = f"PF-{child['gid']}", NodeLevel.PORTFOLIO
+        else:
+            child_id, child_level = f"PRJ-{child['gid']}", NodeLevel.PROJECT
+        nodes.extend(_hierarchy_nodes(session, child, child_id, node_id, child_level, program_id))
+    return nodes
+
+
+def fetch_hierarchy(spec: QuerySpec | None = None) -> pd.DataFrame:
+    """Fetch the portfolio tree: the configured portfolio, its programs and their projects.
+
+    Top-level portfolio items are programs (ids as in ``fetch_programs``).
+    A program that is itself a portfolio is walked recursively, so nested
+    portfolios become intermediate nodes and their projects the leaves.
+    """
+    session, portfolio_gid = _get_session()
+    portfolio = _get(session, f"/portfolios/{portfolio_gid}", params={"opt_fields": "name"})
+    root_id = f"PF-{portfolio_gid}"
+    nodes = [
+        {
+            "id": root_id,
+            "parent_id": None,
+            "name": portfolio.get("data", {}).get("name", "Portfolio"),
+            "level": NodeLevel.PORTFOLIO.value,
+            "program_id": None,
+            "percent_complete": None,
+            "budget_millions": 0.0,
+            "budget_spent_millions": 0.0,
+        }
+    ]
+    items = _portfolio_programs(
+        session, portfolio_gid, spec, opt_fields="name,resource_type," + _CUSTOM_FIELDS
+    )
+    for program_id, item in items:
+        nodes.extend(
+            _hierarchy_nodes(session, item, program_id, root_id, NodeLevel.PROGRAM, program_id)
+        )
+    return pd.DataFrame(nodes)
+
+
 def _fetch_project_tasks(
     session: requests.Session,
     project_gid: str,
@@ -236,18 +374,24 @@ def _fetch_project_tasks(
         params={
             "opt_fields": (
                 "name,completed,completed_at,due_on,assignee,assignee.name,"
-                "tags,tags.name,assignee_status,"
-                "custom_fields,custom_fields.name,"
-                "custom_fields.enum_value,custom_fields.enum_value.name,"
-                "custom_fields.number_value,custom_fields.text_value,"
-                "custom_fields.display_value,"
+                "tags,tags.name,assignee_status," + _CUSTOM_FIELDS + ","
                 "is_rendered_as_separator"
             ),
         },
     )
 
 
-def fetch_milestones() -> pd.DataFrame:
+def _program_tasks(session: requests.Session, item: dict) -> list[dict]:
+    """Tasks of a program's project, or of every project under a nested portfolio."""
+    if item.get("resource_type") != "portfolio":
+        return _fetch_project_tasks(session, item["gid"])
+    children = _paginate(
+        session, f"/portfolios/{item['gid']}/items", params={"opt_fields": "resource_type"}
+    )
+    return [task for child in children for task in _program_tasks(session, child)]
+
+
+def fetch_milestones(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch tasks from portfolio projects and map to Milestone model.
 
     By default maps all tasks. If asana.milestone_tag is set in config,
@@ -256,18 +400,11 @@ def fetch_milestones() -> pd.DataFrame:
     session, portfolio_gid = _get_session()
     milestone_tag = get_nested("asana", "milestone_tag")
 
-    items = _paginate(
-        session,
-        f"/portfolios/{portfolio_gid}/items",
-        params={"opt_fields": "name"},
-    )
+    items = _portfolio_programs(session, portfolio_gid, spec)
 
     milestones = []
-    mid = 0
-    for prg_idx, item in enumerate(items, 1):
-        project_gid = item["gid"]
-        program_id = f"PRG-{prg_idx:03d}"
-        tasks = _fetch_project_tasks(session, project_gid)
+    for program_id, item in items:
+        tasks = _program_tasks(session, item)
 
         for task in tasks:
             # Skip section separators
@@ -280,7 +417,6 @@ def fetch_milestones() -> pd.DataFrame:
                 if milestone_tag.lower() not in tag_names:
                     continue
 
-            mid += 1
             assignee = task.get("assignee") or {}
             due = _parse_date(task.get("due_on"))
             completed_at = task.get("completed_at")
@@ -297,7 +433,7 @@ def fetch_milestones() -> pd.DataFrame:
 
             milestones.append(
                 {
-                    "id": f"MS-{mid:03d}",
+                    "id": f"MS-{task['gid']}",
                     "program_id": program_id,
                     "name": task.get("name", ""),
                     "status": _map_milestone_status(task).value,
@@ -319,7 +455,7 @@ def fetch_milestones() -> pd.DataFrame:
     return pd.DataFrame(milestones)
 
 
-def fetch_risks() -> pd.DataFrame:
+def fetch_risks(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch tasks tagged as risks from portfolio projects.
 
     Looks for tasks with a tag matching asana.risk_tag (default: 'risk').
@@ -331,11 +467,7 @@ def fetch_risks() -> pd.DataFrame:
     severity_field = get_nested("asana", "severity_field", "Severity")
     likelihood_field = get_nested("asana", "likelihood_field", "Likelihood")
 
-    items = _paginate(
-        session,
-        f"/portfolios/{portfolio_gid}/items",
-        params={"opt_fields": "name"},
-    )
+    items = _portfolio_programs(session, portfolio_gid, spec)
 
     severity_map = {
         "low": RiskSeverity.LOW,
@@ -350,19 +482,15 @@ def fetch_risks() -> pd.DataFrame:
     }
 
     risks = []
-    rid = 0
     today = date.today()
-    for prg_idx, item in enumerate(items, 1):
-        project_gid = item["gid"]
-        program_id = f"PRG-{prg_idx:03d}"
-        tasks = _fetch_project_tasks(session, project_gid)
+    for program_id, item in items:
+        tasks = _program_tasks(session, item)
 
         for task in tasks:
             tag_names = [t.get("name", "").lower() for t in task.get("tags", [])]
             if risk_tag.lower() not in tag_names:
                 continue
 
-            rid += 1
             assignee = task.get("assignee") or {}
             sev_val = (_extract_custom_field(task, severity_field) or "medium").lower()
             lik_val = (_extract_custom_field(task, likelihood_field) or "medium").lower()
@@ -371,7 +499,7 @@ def fetch_risks() -> pd.DataFrame:
 
             risks.append(
                 {
-                    "id": f"RSK-{rid:03d}",
+                    "id": f"RSK-{task['gid']}",
                     "program_id": program_id,
                     "title": task.get("name", ""),
                     "description": "",
@@ -381,7 +509,6 @@ def fetch_risks() -> pd.DataFrame:
                     "owner": assignee.get("name", ""),
                     "raised_date": created,
                     "is_open": not task.get("completed", False),
-                    "risk_age_days": (today - created).days,
                 }
             )
 
@@ -389,14 +516,13 @@ def fetch_risks() -> pd.DataFrame:
         return pd.DataFrame(
             columns=[
                 "id", "program_id", "title", "description", "severity",
-                "likelihood", "mitigation", "owner", "raised_date",
-                "is_open", "risk_age_days",
+                "likelihood", "mitigation", "owner", "raised_date", "is_open",
             ]
         )
     return pd.DataFrame(risks)
 
 
-def fetch_escalations() -> pd.DataFrame:
+def fetch_escalations(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch tasks tagged as escalations from portfolio projects.
 
     Looks for tasks with a tag matching asana.escalation_tag (default: 'escalation').
@@ -406,11 +532,7 @@ def fetch_escalations() -> pd.DataFrame:
     esc_tag = get_nested("asana", "escalation_tag", "escalation")
     level_field = get_nested("asana", "escalation_level_field", "Escalation Level")
 
-    items = _paginate(
-        session,
-        f"/portfolios/{portfolio_gid}/items",
-        params={"opt_fields": "name"},
-    )
+    items = _portfolio_programs(session, portfolio_gid, spec)
 
     level_map = {
         "team lead": EscalationLevel.TEAM_LEAD,
@@ -420,18 +542,14 @@ def fetch_escalations() -> pd.DataFrame:
     }
 
     escalations = []
-    eid = 0
-    for prg_idx, item in enumerate(items, 1):
-        project_gid = item["gid"]
-        program_id = f"PRG-{prg_idx:03d}"
-        tasks = _fetch_project_tasks(session, project_gid)
+    for program_id, item in items:
+        tasks = _program_tasks(session, item)
 
         for task in tasks:
             tag_names = [t.get("name", "").lower() for t in task.get("tags", [])]
             if esc_tag.lower() not in tag_names:
                 continue
 
-            eid += 1
             level_val = (_extract_custom_field(task, level_field) or "director").lower()
             due = _parse_date(task.get("due_on"))
             resolved = None
@@ -442,7 +560,7 @@ def fetch_escalations() -> pd.DataFrame:
 
             escalations.append(
                 {
-                    "id": f"ESC-{eid:03d}",
+                    "id": f"ESC-{task['gid']}",
                     "program_id": program_id,
                     "risk_id": None,
                     "title": task.get("name", ""),
@@ -463,7 +581,50 @@ def fetch_escalations() -> pd.DataFrame:
     return pd.DataFrame(escalations)
 
 
-def fetch_metrics() -> pd.DataFrame:
+_STATUS_TYPES = {
+    "on_track": ProgramStatus.ON_TRACK,
+    "at_risk": ProgramStatus.AT_RISK,
+    "off_track": ProgramStatus.OFF_TRACK,
+    "on_hold": ProgramStatus.AT_RISK,
+    "complete": ProgramStatus.COMPLETED,
+}
+
+
+def fetch_status_transitions(spec: QuerySpec | None = None) -> pd.DataFrame:
+    """Fetch each project's status updates as program status transitions.
+
+    Returns one row per update: program_id, changed_at (date posted) and
+    the mapped ProgramStatus value.
+    """
+    session, portfolio_gid = _get_session()
+    items = _portfolio_programs(session, portfolio_gid, spec)
+
+    transitions = []
+    for program_id, item in items:
+        updates = _paginate(
+            session,
+            "/status_updates",
+            params={"parent": item["gid"], "opt_fields": "status_type,created_at"},
+        )
+        for update in updates:
+            status = _STATUS_TYPES.get(update.get("status_type"))
+            created_at = update.get("created_at")
+            if status is None or not created_at:
+                continue
+            transitions.append(
+                {
+                    "program_id": program_id,
+                    "changed_at": date.fromisoformat(created_at[:10]),
+                    "status": status.value,
+                }
+            )
+
+    if not transitions:
+        return pd.DataFrame(columns=["program_id", "changed_at", "status"])
+    return pd.DataFrame(transitions)
+
+
+def fetch_metrics(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Return empty metrics DataFrame — Asana has no native delivery metrics.
 
     Delivery metrics (velocity, DORA, etc.) are not available in Asana.
@@ -485,22 +646,3 @@ def fetch_metrics() -> pd.DataFrame:
             "change_failure_rate",
         ]
     )
-
-
-def fetch_weekly_snapshots() -> pd.DataFrame:
-    """Return empty weekly snapshots — not available from Asana."""
-    return pd.DataFrame(
-        columns=[
-            "week_start",
-            "total_velocity",
-            "total_defects",
-            "total_incidents",
-            "avg_mttr_hours",
-            "avg_deployment_frequency",
-            "avg_lead_time_days",
-            "avg_change_failure_rate",
-            "programs_on_track",
-            "programs_at_risk",
-            "programs_off_track",
-        ]
-    )
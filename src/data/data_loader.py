@@ -1,98 +1,418 @@
-"""Data loader abstraction — returns DataFrames from mock or JIRA source."""
+"""Data loader abstraction — returns DataFrames from mock, JIRA, or Asana source.
 
+Datasets and the structures derived from them are cached per tenant and
+refreshed on the tenant's own schedule.
+"""
+
+from collections.abc import Callable, Hashable
 from datetime import date
 
 import pandas as pd
 import streamlit as st
 
-from src.data import mock_data
-from src.utils.config import get
+from src.data.hierarchy import PortfolioTree
+from src.data.history import HISTORY_DATASETS, SnapshotHistory
+from src.data.metrics_cube import MetricsCube
+from src.data.query_spec import QuerySpec
+from src.data.query_store import QueryStore
+from src.data.rollup import DORA_MEASURES, PortfolioRollup
+from src.data.schema import add_derived_columns
+from src.data.shared_store import SharedStore
+from src.data.sources import fetch_dataset
+from src.data.status_history import StatusHistory
+from src.data.tenant_cache import TenantCache
+from src.utils.config import current_tenant, get, get_nested, load_config, on_reload, tenant_path
+from src.utils.decision_rules import DecisionChanges, DecisionTracker, configured_rules
 
+_MB = 1024 * 1024
 
-@st.cache_data(ttl=1800)
-def load_programs() -> pd.DataFrame:
-    """Load programs as a DataFrame."""
-    source = get("data_source", "mock")
-    if source == "jira":
-        from src.data.jira_client import fetch_programs
 
-        return fetch_programs()
-    if source == "asana":
-        from src.data.asana_client import fetch_programs
+@st.cache_resource
+def _tenant_cache() -> TenantCache:
+    """One cache per process; the budgets are deployment-wide, not per tenant settings."""
+    settings = load_config().get("cache") or {}
+    total_mb = settings.get("total_memory_mb", 1024)
+    return TenantCache(
+        settings.get("tenant_memory_mb", 256) * _MB, total_mb * _MB if total_mb else None
+    )
 
-        return fetch_programs()
-    return pd.DataFrame([p.model_dump() for p in mock_data.get_programs()])
 
+def _max_age_seconds() -> float:
+    return get_nested("dashboard", "refresh_interval_minutes", 30) * 60
 
-@st.cache_data(ttl=1800)
-def load_milestones() -> pd.DataFrame:
-    source = get("data_source", "mock")
-    if source == "jira":
-        from src.data.jira_client import fetch_milestones
 
-        return fetch_milestones()
-    if source == "asana":
-        from src.data.asana_client import fetch_milestones
+def _cached(
+    key: Hashable, build: Callable[[], object], expires: bool = True, version: Hashable = None
+):
+    """``build()`` cached under the current tenant, rebuilt after the refresh interval.
+
+    A ``version`` ties the value to its inputs: it is rebuilt whenever the
+    version changes. Frames are copied on the way out so a page cannot alter
+    the cached one.
+    """
+    value = _tenant_cache().get(
+        current_tenant(), key, build, _max_age_seconds() if expires else None, version
+    )
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
+def _data_version(names) -> tuple:
+    """Load times of the cached datasets ``names``; changes whenever one is reloaded."""
+    cache, tenant = _tenant_cache(), current_tenant()
+    return tuple(cache.loaded_at(tenant, name) for name in names)
+
+
+def _loaded_version(inputs: dict[str, Callable[[], pd.DataFrame]]) -> tuple:
+    """``_data_version`` of ``inputs`` (name -> loader), loading them first if needed."""
+    loaded = _data_version(inputs)
+    if None in loaded:
+        for load in inputs.values():
+            load()
+        loaded = _data_version(inputs)
+    return loaded
+
+
+def _clear_caches():
+    """Drop every tenant's cached data, query store included, and the cache budgets.
+
+    Runs whenever the settings file changes, so no cache outlives its settings.
+    """
+    _tenant_cache.clear()
+
+
+on_reload(_clear_caches)
+
+
+def refresh_tenant(tenant: str | None = None):
+    """Drop a tenant's cached data (the current tenant by default); other tenants keep theirs."""
+    _tenant_cache().invalidate(tenant or current_tenant())
+
+
+def _shared_store() -> SharedStore | None:
+    path = get_nested("store", "path")
+    if not path:
+        return None
+    return _cached(
+        "shared_store",
+        lambda: SharedStore(
+            tenant_path(path), lease_seconds=get_nested("store", "lease_seconds", 120)
+        ),
+        expires=False,
+    )
+
+
+def _history() -> SnapshotHistory | None:
+    path = get_nested("history", "path")
+    if not path:
+        return None
+    return _cached("history", lambda: SnapshotHistory(tenant_path(path)), expires=False)
+
+
+def _fetch_full(name: str) -> pd.DataFrame:
+    """Fetch a whole dataset from the source, recording it in the snapshot history."""
+    df = fetch_dataset(name)
+    history = _history()
+    if history is not None and name in HISTORY_DATASETS:
+        history.record(name, df)
+    return df
+
 
-        return fetch_milestones()
-    return pd.DataFrame([m.model_dump() for m in mock_data.get_milestones()])
+def _load(name: str) -> pd.DataFrame:
+    return add_derived_columns(_load_stored(name), name)
+
+
+def _load_stored(name: str) -> pd.DataFrame:
+    """Serve a dataset through the shared store at ``store.path``, if configured.
+
+    In ``shared`` mode the replica holding the lease refreshes the store from
+    the upstream source and the others load the published file. In
+    ``readonly`` mode the upstream source is never touched; ``python -m
+    src.data.ingest`` keeps the store current instead.
+    """
+    store = _shared_store()
+    if store is None:
+        return _fetch_full(name)
+    if get_nested("store", "mode", "shared") == "readonly":
+        df = store.read(name)
+        if df is None:
+            raise RuntimeError(
+                f"Dataset '{name}' has not been ingested yet. "
+                "Run `python -m src.data.ingest` against this store."
+            )
+        return df
+    if store.is_fresh(name, _max_age_seconds()):
+        return store.read(name)
+    if store.acquire_lease(name):
+        try:
+            df = _fetch_full(name)
+            store.write(name, df)
+            return df
+        finally:
+            store.release_lease(name)
+    # Another replica is refreshing; serve the last published version meanwhile.
+    df = store.read(name)
+    return df if df is not None else _fetch_full(name)
+
+
+def load_programs() -> pd.DataFrame:
+    """Load programs as a DataFrame."""
+    return _cached("programs", lambda: _load("programs"))
+
+
+def load_milestones() -> pd.DataFrame:
+    return _cached("milestones", lambda: _load("milestones"))
 
 
-@st.cache_data(ttl=1800)
 def load_risks() -> pd.DataFrame:
     """Load risks with computed risk_age_days column."""
-    source = get("data_source", "mock")
-    if source == "jira":
-        from src.data.jira_client import fetch_risks
-
-        return fetch_risks()
-    if source == "asana":
-        from src.data.asana_client import fetch_risks
-
-        return fetch_risks()
-    df = pd.DataFrame([r.model_dump() for r in mock_data.get_risks()])
-    today = date.today()
-    df["risk_age_days"] = df["raised_date"].apply(lambda d: (today - d).days)
-    return df
+    return _cached("risks", lambda: _load("risks"))
 
 
-@st.cache_data(ttl=1800)
 def load_escalations() -> pd.DataFrame:
-    source = get("data_source", "mock")
-    if source == "jira":
-        from src.data.jira_client import fetch_escalations
+    return _cached("escalations", lambda: _load("escalations"))
+
 
-        return fetch_escalations()
-    if source == "asana":
-        from src.data.asana_client import fetch_escalations
+def load_metrics() -> pd.DataFrame:
+    return _cached("metrics", lambda: _load("metrics"))
 
-        return fetch_escalations()
-    return pd.DataFrame([e.model_dump() for e in mock_data.get_escalations()])
 
+def load_weekly_snapshots() -> pd.DataFrame:
+    return _cached("weekly_snapshots", lambda: _load("weekly_snapshots"))
 
-@st.cache_data(ttl=1800)
-def load_metrics() -> pd.DataFrame:
-    source = get("data_source", "mock")
-    if source == "jira":
-        from src.data.jira_client import fetch_metrics
 
-        return fetch_metrics()
-    if source == "asana":
-        from src.data.asana_client import fetch_metrics
+def load_hierarchy() -> pd.DataFrame:
+    return _cached("hierarchy", lambda: _load("hierarchy"))
 
-        return fetch_metrics()
-    return pd.DataFrame([m.model_dump() for m in mock_data.get_metrics()])
 
+def load_metrics_cube() -> MetricsCube:
+    """Metrics as a program x week x metric cube, built once per metrics load and shared.
+
+    KPI charts and cards slice its arrays instead of re-grouping the metrics
+    frame. Rebuilt whenever the metrics frame is reloaded, so it always
+    agrees with :func:`load_metrics`.
+    """
+    return _cached(
+        "metrics_cube",
+        lambda: MetricsCube.from_frame(load_metrics()),
+        version=_loaded_version({"metrics": load_metrics}),
+    )
+
+
+_ROLLUP_INPUTS = {
+    "programs": load_programs,
+    "risks": load_risks,
+    "metrics": load_metrics,
+}
+
+
+def _build_rollup() -> PortfolioRollup:
+    cube = load_metrics_cube()
+    recent_weeks = cube.latest_weeks(1)
+    dora = cube.by_program(recent_weeks[0], DORA_MEASURES) if recent_weeks else None
+    return PortfolioRollup.from_frames(load_programs(), load_risks(), dora)
+
+
+def load_rollup() -> PortfolioRollup:
+    """Department x status x quarter rollup of the portfolio, with every subtotal.
+
+    Built once per data refresh, so its totals always match the loaded frames.
+    """
+    return _cached("rollup", _build_rollup, version=_loaded_version(_ROLLUP_INPUTS))
+
+
+_TREE_INPUTS = {
+    "hierarchy": load_hierarchy,
+    "risks": load_risks,
+    "milestones": load_milestones,
+}
+
+
+def load_portfolio_tree() -> PortfolioTree:
+    """Portfolio -> program -> project tree with risk and milestone stats rolled up.
+
+    Kept across refreshes: after a reload only the nodes whose values changed
+    are updated, with their ancestors. The tree is rebuilt only when nodes
+    are added, removed or moved.
+    """
+    loaded = _loaded_version(_TREE_INPUTS)
+    return _cached("portfolio_tree", _refresh_portfolio_tree, version=(loaded, date.today()))
+
+
+def _refresh_portfolio_tree() -> PortfolioTree:
+    frames = [load() for load in _TREE_INPUTS.values()]
+    tree = _tenant_cache().peek(current_tenant(), "portfolio_tree")
+    if tree is None or tree.sync(*frames) is None:
+        tree = PortfolioTree.from_frames(*frames)
+    return tree
+
+
+# ---------------------------------------------------------------------------
+# Decisions
+# ---------------------------------------------------------------------------
+
+_DECISION_INPUTS = {
+    "programs": load_programs,
+    "risks": load_risks,
+    "milestones": load_milestones,
+    "escalations": load_escalations,
+}
+
+
+def load_decisions() -> pd.DataFrame:
+    """Decisions raised by the tenant's rules (see :mod:`src.utils.decision_rules`).
+
+    Evaluated once per data version: the result is reused until one of the
+    input datasets is reloaded, the rules change or the day rolls over,
+    however many rules are configured. After a reload only the rows whose
+    contents changed are re-evaluated (see :func:`load_decision_changes`).
+    """
+    loaded = _loaded_version(_DECISION_INPUTS)
+    rules = configured_rules()
+    return _cached("decisions", _refresh_decisions, version=(loaded, rules, date.today()))
+
+
+def _decision_tracker() -> DecisionTracker:
+    return _cached("decision_tracker", DecisionTracker, expires=False)
+
+
+def _refresh_decisions() -> pd.DataFrame:
+    """Re-evaluate the rules over the rows that changed since the last data version."""
+    tracker = _decision_tracker()
+    tracker.update({name: load() for name, load in _DECISION_INPUTS.items()}, configured_rules())
+    _tenant_cache().put(current_tenant(), "decision_tracker", tracker)
+    return tracker.decisions
+
+
+def load_decision_changes() -> DecisionChanges | None:
+    """Decisions added, removed or changed by the latest data refresh.
+
+    None until there has been a refresh to compare with.
+    """
+    load_decisions()
+    tracker = _decision_tracker()
+    return tracker.changes if tracker.updates > 1 else None
+
+
+# ---------------------------------------------------------------------------
+# Filtered queries
+# ---------------------------------------------------------------------------
+
+
+def _new_query_store() -> QueryStore:
+    path = get_nested("store", "query_path")
+    store = QueryStore(tenant_path(path) if path else ":memory:")
+    # Tables left in a query_path file may predate a settings change or an eviction.
+    store.expire()
+    return store
+
+
+def _query_store() -> QueryStore:
+    """One query store per tenant; in memory unless ``store.query_path`` is set."""
+    return _cached("query_store", _new_query_store, expires=False)
+
+
+def _refreshed_query_store(name: str) -> QueryStore:
+    """The query store, with ``name`` reloaded if its table is older than the refresh interval."""
+    store = _query_store()
+    if not store.is_fresh(name, _max_age_seconds()):
+        store.replace(name, _load_stored(name))
+        # Re-measure the store against the tenant's budget now that it has grown.
+        _tenant_cache().put(current_tenant(), "query_store", store)
+    return store
+
+
+def _pushes_down_to_source() -> bool:
+    """API sources without a shared store are queried per selection instead of in full."""
+    return _shared_store() is None and get("data_source", "mock") in ("jira", "asana")
+
+
+def _fetch_slice(name: str, spec: QuerySpec | None) -> pd.DataFrame:
+    return _cached(("slice", name, spec), lambda: fetch_dataset(name, spec))
+
+
+def query(name: str, spec: QuerySpec | None = None) -> pd.DataFrame:
+    """Rows of dataset ``name`` matching ``spec``, filtered where the data lives.
+
+    With a shared store or mock data the dataset is mirrored in the indexed
+    query store and the spec becomes a SQL ``WHERE``. API sources without a
+    shared store receive the spec directly, so only the selected programs
+    are fetched.
+    """
+    if _pushes_down_to_source():
+        df = _fetch_slice(name, spec)
+    else:
+        store = _refreshed_query_store(name)
+        spec = spec or QuerySpec()
+        df = store.select(name, spec.where(name), spec.between(name))
+    return add_derived_columns(df, name)
+
+
+def count_rows(name: str) -> int:
+    """Number of rows in a dataset, counted in the query store."""
+    if _pushes_down_to_source():
+        return len(_fetch_slice(name, None))
+    return _refreshed_query_store(name).count(name)
+
+
+def milestone_quarters() -> list[str]:
+    """Quarters that have at least one milestone, without loading the milestones.
+
+    When milestones are fetched per selection, the quarters spanned by the
+    programs' schedules are offered instead.
+    """
+    if _pushes_down_to_source():
+        programs = load_programs()
+        if programs.empty:
+            return []
+        periods = pd.period_range(
+            programs["start_date"].min(), programs["target_end_date"].max(), freq="Q"
+        )
+        return [f"Q{p.quarter} {p.year}" for p in periods]
+    quarters = _refreshed_query_store("milestones").distinct("milestones", "quarter")
+    return sorted(quarters, key=lambda q: (int(q.split()[1]), int(q[1])))
+
+
+# ---------------------------------------------------------------------------
+# Snapshot history
+# ---------------------------------------------------------------------------
+
+
+def history_start() -> date | None:
+    """Day of the first recorded programs snapshot; ``None`` without a history."""
+    history = _history()
+    if history is None:
+        return None
+    first = history.versions("programs")["valid_from"].min()
+    return None if pd.isna(first) else first.date()
+
+
+def load_as_of(name: str, when: date) -> pd.DataFrame:
+    """Programs, milestones or risks as recorded on ``when``.
+
+    Needs ``history.path``: every full fetch of these datasets is then
+    recorded in a :class:`~src.data.history.SnapshotHistory`.
+    """
+    history = _history()
+    if history is None:
+        raise RuntimeError(
+            "Snapshot history is disabled. Set history.path in config/settings.yaml."
+        )
+    return add_derived_columns(history.as_of(name, when), name, today=when)
 
-@st.cache_data(ttl=1800)
-def load_weekly_snapshots() -> pd.DataFrame:
-    source = get("data_source", "mock")
-    if source == "jira":
-        from src.data.jira_client import fetch_weekly_snapshots
 
-        return fetch_weekly_snapshots()
-    if source == "asana":
-        from src.data.asana_client import fetch_weekly_snapshots
+def load_schedule_history(dates) -> StatusHistory:
+    """Schedule-based RAG status of every program on each of ``dates``.
 
-        return fetch_weekly_snapshots()
-    return pd.DataFrame([s.model_dump() for s in mock_data.get_weekly_snapshots()])
+    Each date is rated on the latest programs snapshot taken on or before it,
+    and dates before the first snapshot on the first one. With the snapshot
+    history enabled that is every recorded version; without it the current
+    programs are the only snapshot, so they are rated on every date.
+    """
+    # With a history, loading the programs has recorded at least one snapshot.
+    programs = load_programs()
+    history = _history()
+    if history is not None:
+        programs = history.versions("programs")
+        first = programs["valid_from"] == programs["valid_from"].min()
+        programs.loc[first, "valid_from"] = pd.NaT
+    return StatusHistory.from_schedule(programs, dates)
@@ -0,0 +1,274 @@
+"""Portfolio -> program -> project hierarchy with bottom-up rollups.
+
+Nodes live in flat NumPy arrays: a parent index per node and one row of
+own measures per node. Rolled-up totals are built level by level, deepest
+first, with one ``np.add.at`` per level. Because every rolled measure is a
+sum (averages are derived from sums and counts when read), changing a node
+only adds the difference to that node and its ancestors; siblings and the
+rest of the tree are never recomputed. :meth:`PortfolioTree.sync` diffs a
+fresh load against the tree and applies only the nodes that changed.
+
+Risks and milestones reference programs, so their exposure and counts are
+attached to the program nodes and roll up from there.
+"""
+
+from datetime import date
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.data.schema import risk_scores
+from src.utils.constants import MilestoneStatus, NodeLevel
+
+# Additive per-node measures. ``leaves``/``completion_total`` count the
+# nodes that report a completion percentage and sum it.
+MEASURES = [
+    "leaves",
+    "completion_total",
+    "budget_millions",
+    "budget_spent_millions",
+    "open_risks",
+    "risk_exposure",
+    "milestones",
+    "milestones_completed",
+    "milestones_late",
+]
+
+_NODE_COLUMNS = ["id", "parent_id", "name", "level", "program_id"]
+
+
+def _own_measures(values: pd.DataFrame) -> pd.DataFrame:
+    """Node fields (percent_complete, budgets, ...) -> additive own measures."""
+    out = pd.DataFrame(0.0, index=values.index, columns=MEASURES)
+    for column in MEASURES:
+        if column in values.columns:
+            out[column] = values[column].astype("float64").fillna(0.0)
+    if "percent_complete" in values.columns:
+        percent = values["percent_complete"].astype("float64")
+        out["leaves"] = percent.notna().astype("float64")
+        out["completion_total"] = percent.fillna(0.0)
+    return out
+
+
+def _program_stats(
+    risks: pd.DataFrame | None, milestones: pd.DataFrame | None, today: date | None
+) -> pd.DataFrame:
+    """Open risk exposure and milestone counts per program id."""
+    parts = []
+    if risks is not None and not risks.empty:
+        open_risks = risks[risks["is_open"].astype(bool)]
+        if "risk_score" in open_risks.columns:
+            scores = open_risks["risk_score"].to_numpy()
+        else:
+            scores = risk_scores(open_risks["severity"], open_risks["likelihood"])
+        grouped = pd.DataFrame(
+            {"open_risks": 1.0, "risk_exposure": scores.astype("float64")},
+            index=open_risks.index,
+        ).groupby(open_risks["program_id"].astype(str).to_numpy())
+        parts.append(grouped.sum())
+    if milestones is not None and not milestones.empty:
+        today = pd.Timestamp(today or date.today())
+        status = milestones["status"].astype(str)
+        completed = status == MilestoneStatus.COMPLETED.value
+        late = ~completed & (pd.to_datetime(milestones["due_date"]) < today)
+        grouped = pd.DataFrame(
+            {
+                "milestones": 1.0,
+                "milestones_completed": completed.astype("float64").to_numpy(),
+                "milestones_late": late.astype("float64").to_numpy(),
+            }
+        ).groupby(milestones["program_id"].astype(str).to_numpy())
+        parts.append(grouped.sum())
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts, axis=1).fillna(0.0)
+
+
+def _with_program_stats(
+    hierarchy: pd.DataFrame,
+    risks: pd.DataFrame | None,
+    milestones: pd.DataFrame | None,
+    today: date | None,
+) -> pd.DataFrame:
+    """Hierarchy nodes with risk and milestone stats attached to the program nodes."""
+    nodes = hierarchy.reset_index(drop=True).copy()
+    stats = _program_stats(risks, milestones, today)
+    is_program = nodes["level"].astype(str) == NodeLevel.PROGRAM.value
+    keys = nodes["program_id"].astype(str).where(is_program)
+    for column in stats.columns:
+        nodes[column] = keys.map(stats[column]).fillna(0.0).to_numpy()
+    return nodes
+
+
+def _derive(frame: pd.DataFrame) -> pd.DataFrame:
+    """Completion and utilization from the rolled-up sums."""
+    leaves = frame["leaves"].where(frame["leaves"] > 0)
+    budget = frame["budget_millions"].where(frame["budget_millions"] > 0)
+    return frame.assign(
+        percent_complete=frame["completion_total"] / leaves,
+        utilization=frame["budget_spent_millions"] / budget * 100,
+    )
+
+
+class PortfolioTree:
+    """A node hierarchy with incrementally maintained bottom-up totals."""
+
+    def __init__(self, nodes: pd.DataFrame):
+        """``nodes`` has the hierarchy columns plus any of ``MEASURES`` or node fields.
+
+        Raises ``ValueError`` for duplicate ids, unknown parents or cycles.
+        """
+        ids = nodes["id"].astype(str)
+        if ids.duplicated().any():
+            raise ValueError(f"Duplicate hierarchy node ids: {sorted(ids[ids.duplicated()])}")
+        self.nodes = nodes[[c for c in _NODE_COLUMNS if c in nodes.columns]].reset_index(drop=True)
+        self.ids = ids.to_numpy(dtype=object)
+        self._index = {node_id: i for i, node_id in enumerate(self.ids)}
+        self._lock = threading.RLock()
+
+        parent_ids = nodes["parent_id"].where(nodes["parent_id"].notna(), None)
+        self._parent_ids = parent_ids.to_numpy(dtype=object)
+        unknown = {p for p in parent_ids if p is not None and p not in self._index}
+        if unknown:
+            raise ValueError(f"Unknown hierarchy parents: {sorted(unknown)}")
+        self._parent = np.array([-1 if p is None else self._index[p] for p in parent_ids])
+        self._depth = self._depths()
+        deepest_first = np.argsort(-self._depth, kind="stable")
+        depths = self._depth[deepest_first]
+        self._levels = [
+            deepest_first[depths == d] for d in range(int(depths.max(initial=0)), 0, -1)
+        ]
+
+        self._own = _own_measures(nodes.reset_index(drop=True)).to_numpy()
+        self._rolled = self._own.copy()
+        for level in self._levels:
+            np.add.at(self._rolled, self._parent[level], self._rolled[level])
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self._parent, self._depth, self._own, self._rolled)
+        return int(self.nodes.memory_usage(deep=True).sum()) + sum(a.nbytes for a in arrays)
+
+    def _depths(self) -> np.ndarray:
+        depth = np.zeros(len(self._parent), dtype=np.int64)
+        current = self._parent.copy()
+        for _ in range(len(self._parent) + 1):
+            active = current >= 0
+            if not active.any():
+                return depth
+            depth += active
+            current[active] = self._parent[current[active]]
+        raise ValueError("Hierarchy contains a cycle")
+
+    @classmethod
+    def from_frames(
+        cls,
+        hierarchy: pd.DataFrame,
+        risks: pd.DataFrame | None = None,
+        milestones: pd.DataFrame | None = None,
+        today: date | None = None,
+    ) -> "PortfolioTree":
+        """Build from the ``hierarchy`` dataset, attaching risk and milestone stats to programs."""
+        return cls(_with_program_stats(hierarchy, risks, milestones, today))
+
+    def sync(
+        self,
+        hierarchy: pd.DataFrame,
+        risks: pd.DataFrame | None = None,
+        milestones: pd.DataFrame | None = None,
+        today: date | None = None,
+    ) -> list[str] | None:
+        """Bring the tree up to date with freshly loaded frames.
+
+        Nodes whose own values or program stats changed are passed to
+        :meth:`update_many`, so only they and their ancestors are recomputed.
+        Returns the ids whose totals changed, or ``None`` without touching
+        the tree if nodes were added, removed or moved; rebuild it with
+        :meth:`from_frames` then.
+        """
+        nodes = _with_program_stats(hierarchy, risks, milestones, today)
+        ids = nodes["id"].astype(str).to_numpy(dtype=object)
+        parent_ids = nodes["parent_id"].where(nodes["parent_id"].notna(), None)
+        if len(ids) != len(self.ids) or (ids != self.ids).any():
+            return None
+        if (parent_ids.to_numpy(dtype=object) != self._parent_ids).any():
+            return None
+
+        own = _own_measures(nodes)
+        changed = np.flatnonzero((own.to_numpy() != self._own).any(axis=1))
+        changes = own.iloc[changed].drop(columns=["leaves", "completion_total"])
+        percent = own["completion_total"].where(own["leaves"] > 0)
+        changes["percent_complete"] = percent.iloc[changed]
+        changes.index = ids[changed]
+        with self._lock:
+            self.nodes = nodes[[c for c in _NODE_COLUMNS if c in nodes.columns]]
+            return self.update_many(changes)
+
+    def _frame(self, positions: np.ndarray) -> pd.DataFrame:
+        with self._lock:
+            rolled = pd.DataFrame(self._rolled[positions], columns=MEASURES)
+            frame = pd.concat([self.nodes.iloc[positions].reset_index(drop=True), rolled], axis=1)
+        frame["depth"] = self._depth[positions]
+        return _derive(frame)
+
+    def frame(self) -> pd.DataFrame:
+        """Every node with its rolled-up measures, completion and utilization."""
+        return self._frame(np.arange(len(self.ids)))
+
+    def node(self, node_id: str) -> pd.Series:
+        """Rolled-up measures of one node."""
+        return self._frame(np.array([self._index[node_id]])).iloc[0]
+
+    def children(self, node_id: str | None = None) -> pd.DataFrame:
+        """Direct children of ``node_id`` (the roots when ``None``)."""
+        parent = -1 if node_id is None else self._index[node_id]
+        return self._frame(np.flatnonzero(self._parent == parent))
+
+    def ancestors(self, node_id: str) -> list[str]:
+        """Ids from ``node_id``'s parent up to its root."""
+        out = []
+        current = self._parent[self._index[node_id]]
+        while current >= 0:
+            out.append(self.ids[current])
+            current = self._parent[current]
+        return out
+
+    def update(self, node_id: str, **fields) -> list[str]:
+        """Change one node's own values and refresh only its ancestors' totals.
+
+        ``fields`` are node fields such as ``percent_complete`` or
+        ``budget_millions``. Returns the ids whose totals changed.
+        """
+        return self.update_many(pd.DataFrame([fields], index=[node_id]))
+
+    def update_many(self, changes: pd.DataFrame) -> list[str]:
+        """Apply several node changes (indexed by node id) in one vectorized pass."""
+        unknown = set(changes.columns) - {*MEASURES, "percent_complete"}
+        if unknown:
+            raise ValueError(f"Cannot update hierarchy fields: {sorted(unknown)}")
+        positions = np.array([self._index[node_id] for node_id in changes.index], dtype=np.int64)
+        if not len(positions):
+            return []
+        with self._lock:
+            current = pd.DataFrame(self._own[positions], columns=MEASURES)
+            # Unchanged fields keep their values; percent_complete is rebuilt from its sums.
+            values = current.copy()
+            if "percent_complete" not in changes.columns:
+                values["percent_complete"] = np.where(
+                    current["leaves"] > 0, current["completion_total"], np.nan
+                )
+            for column in changes.columns:
+                values[column] = changes[column].to_numpy()
+            own = _own_measures(values).to_numpy()
+
+            delta = own - self._own[positions]
+            self._own[positions] = own
+            touched = set()
+            while len(positions):
+                np.add.at(self._rolled, positions, delta)
+                touched.update(positions.tolist())
+                parents = self._parent[positions]
+                keep = parents >= 0
+                positions, delta = parents[keep], delta[keep]
+        return [self.ids[i] for i in sorted(touched)]
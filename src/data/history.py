@@ -0,0 +1,161 @@
+"""Deduplicated snapshot history of programs, milestones and risks.
+
+Real sources only report the current state, so every full refresh is
+recorded here as a snapshot. Only rows whose content changed since the
+previous snapshot are stored: each stored row is one *version* of an entity,
+valid over the half-open day range ``[_valid_from, _valid_to)``. Years of
+daily refreshes therefore cost one row per actual change.
+
+Validity ranges are kept in an SQLite R*Tree, so :meth:`SnapshotHistory.as_of`
+is an interval-index lookup of the versions alive on a given day rather than
+a scan over every version ever recorded.
+"""
+
+from datetime import date
+from pathlib import Path
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.data.query_store import decode_dates, encode_dates, to_day_number
+from src.data.schema import MODELS, apply_schema
+
+HISTORY_DATASETS = ("programs", "milestones", "risks")
+
+# Day number standing in for "still valid". R*Tree stores float32
+# coordinates, which hold whole day numbers exactly up to 2**24.
+_OPEN = 10_000_000
+
+_META = ["_version", "_hash", "_valid_from", "_valid_to"]
+
+
+def _payload_columns(name: str) -> list[str]:
+    return list(MODELS[name].model_fields)
+
+
+def _row_hashes(frame: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy().view(np.int64)
+
+
+class SnapshotHistory:
+    """Versioned entity history in one SQLite file (or in memory)."""
+
+    def __init__(self, path: Path | str = ":memory:"):
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            with self._lock:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+
+    def _ensure_tables(self, name: str):
+        columns = ", ".join(f'"{col}"' for col in _payload_columns(name))
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} (_version INTEGER PRIMARY KEY, "
+            f"_hash INTEGER, _valid_from INTEGER, _valid_to INTEGER, {columns})"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{name}_open ON {name} (id) WHERE _valid_to = {_OPEN}"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{name}_id ON {name} (id, _valid_from)")
+        self._conn.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name}_validity "
+            "USING rtree(_version, _valid_from, _valid_to)"
+        )
+
+    def _has_table(self, name: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def record(self, name: str, df: pd.DataFrame, day: date | None = None) -> int:
+        """Record a full snapshot of dataset ``name`` taken on ``day`` (default today).
+
+        Entities that are new or changed get a new version; changed and
+        vanished entities have their previous version closed at ``day``. A
+        second snapshot on the same day replaces that day's versions.
+        Returns the number of versions written.
+        """
+        day_number = to_day_number(day or date.today())
+        frame = apply_schema(df[_payload_columns(name)], name)
+        frame = frame.drop_duplicates("id", keep="last").reset_index(drop=True)
+        incoming = pd.DataFrame({"id": frame["id"].astype(str), "_hash": _row_hashes(frame)})
+
+        with self._lock, self._conn:
+            self._ensure_tables(name)
+            current = pd.read_sql_query(
+                f"SELECT _version, id, _hash, _valid_from FROM {name} WHERE _valid_to = ?",
+                self._conn,
+                params=(_OPEN,),
+            )
+            if (current["_valid_from"] > day_number).any():
+                raise ValueError(f"{name}: snapshots must be recorded in date order")
+
+            merged = current.merge(incoming, on="id", how="outer", suffixes=("_old", ""))
+            same = merged["_hash_old"] == merged["_hash"]
+            stale = merged[merged["_version"].notna() & ~same]
+            written = merged[merged["_hash"].notna() & ~same]
+
+            replaced = stale.loc[stale["_valid_from"] == day_number, "_version"].astype(int)
+            closed = stale.loc[stale["_valid_from"] != day_number, "_version"].astype(int)
+            for table in (name, f"{name}_validity"):
+                self._conn.executemany(
+                    f"DELETE FROM {table} WHERE _version = ?", [(v,) for v in replaced]
+                )
+                self._conn.executemany(
+                    f"UPDATE {table} SET _valid_to = ? WHERE _version = ?",
+                    [(day_number, v) for v in closed],
+                )
+
+            if not written.empty:
+                start = self._conn.execute(
+                    f"SELECT COALESCE(MAX(_version), 0) FROM {name}"
+                ).fetchone()[0]
+                rows = encode_dates(frame[frame["id"].astype(str).isin(written["id"])], name)
+                versions = np.arange(start + 1, start + 1 + len(rows))
+                rows.insert(0, "_version", versions)
+                rows.insert(1, "_hash", _row_hashes(frame.loc[rows.index]))
+                rows.insert(2, "_valid_from", day_number)
+                rows.insert(3, "_valid_to", _OPEN)
+                rows.to_sql(name, self._conn, if_exists="append", index=False)
+                self._conn.executemany(
+                    f"INSERT INTO {name}_validity VALUES (?, ?, ?)",
+                    [(int(v), day_number, _OPEN) for v in versions],
+                )
+        return len(written)
+
+    def as_of(self, name: str, when: date) -> pd.DataFrame:
+        """Reconstruct dataset ``name`` as it was recorded on day ``when``."""
+        if not self._has_table(name):
+            return apply_schema(pd.DataFrame(columns=_payload_columns(name)), name)
+        day_number = to_day_number(when)
+        columns = ", ".join(f't."{col}"' for col in _payload_columns(name))
+        with self._lock:
+            df = pd.read_sql_query(
+                f"SELECT {columns} FROM {name}_validity v "
+                f"JOIN {name} t ON t._version = v._version "
+                "WHERE v._valid_from <= ? AND v._valid_to > ? ORDER BY t.id",
+                self._conn,
+                params=(day_number, day_number),
+            )
+        return decode_dates(df, name)
+
+    def versions(self, name: str, ids: list[str] | None = None) -> pd.DataFrame:
+        """Every recorded version, with ``valid_from``/``valid_to`` dates (NaT if current)."""
+        if not self._has_table(name):
+            return pd.DataFrame(columns=[*_payload_columns(name), "valid_from", "valid_to"])
+        sql = f"SELECT * FROM {name}"
+        params: list = []
+        if ids is not None:
+            sql += f" WHERE id IN ({', '.join('?' * len(ids))})" if ids else " WHERE 0"
+            params = list(ids)
+        with self._lock:
+            df = pd.read_sql_query(sql + " ORDER BY id, _valid_from", self._conn, params=params)
+        bounds = df[["_valid_from", "_valid_to"]].astype(float).replace(_OPEN, np.nan)
+        df = decode_dates(df.drop(columns=_META), name)
+        df["valid_from"] = pd.to_datetime(bounds["_valid_from"], unit="D")
+        df["valid_to"] = pd.to_datetime(bounds["_valid_to"], unit="D")
+        return df
@@ -0,0 +1,153 @@
+"""Standalone ingestion daemon that feeds the shared dataset store.
+
+Run alongside the dashboard with ``store.mode: readonly`` so that Streamlit
+pages only ever read from the store and never wait on Asana or JIRA::
+
+    python -m src.data.ingest            # loop every ingest.interval_minutes
+    python -m src.data.ingest --once     # single pass, e.g. from cron
+    python -m src.data.ingest --tenants emea   # only some configured tenants
+
+Each configured tenant is ingested with its own settings into its own
+store (see :func:`src.utils.config.tenant_path`).
+
+The daemon is a separate process, so it can be given its own memory ceiling
+and CPU priority without affecting the UI replicas.
+"""
+
+import argparse
+import logging
+import os
+import resource
+import signal
+import sys
+import time
+
+from src.data.history import HISTORY_DATASETS, SnapshotHistory
+from src.data.shared_store import SharedStore, holder_id
+from src.data.sources import DATASETS, fetch_validated
+from src.utils.config import get_nested, tenant_path, tenant_scope, tenants
+
+logger = logging.getLogger("ingest")
+
+# Distinct per daemon, so two daemons sharing a store never both hold a lease.
+_HOLDER = f"ingest-{holder_id()}"
+
+
+def run_once(
+    store: SharedStore,
+    datasets: list[str],
+    keep_versions: int = 3,
+    history: SnapshotHistory | None = None,
+) -> dict[str, int]:
+    """Fetch each dataset from the upstream source and publish a new version.
+
+    Returns the published version per dataset. Rows that fail validation are
+    published separately as ``<dataset>_quarantine``. With a ``history``,
+    programs, milestones and risks are also recorded as today's snapshot. A
+    dataset that fails to fetch keeps its previous version; the error is
+    logged and the pass continues.
+    """
+    published = {}
+    for name in datasets:
+        if not store.acquire_lease(name, holder=_HOLDER):
+            logger.info("skipping %s: another process holds the refresh lease", name)
+            continue
+        try:
+            started = time.monotonic()
+            df, violations = fetch_validated(name)
+            published[name] = store.write(name, df)
+            store.prune(name, keep_versions)
+            if history is not None and name in HISTORY_DATASETS:
+                history.record(name, df)
+            logger.info(
+                "published %s v%d (%d rows) in %.2fs",
+                name,
+                published[name],
+                len(df),
+                time.monotonic() - started,
+            )
+            if not violations.empty:
+                store.write(f"{name}_quarantine", violations.astype({"value": str}))
+                store.prune(f"{name}_quarantine", keep_versions)
+                logger.warning(
+                    "%s: quarantined %d rows (%d violations)",
+                    name,
+                    violations["row"].nunique(),
+                    len(violations),
+                )
+        except Exception:
+            logger.exception("failed to ingest %s; keeping previous version", name)
+        finally:
+            store.release_lease(name, holder=_HOLDER)
+    return published
+
+
+def _apply_resource_limits(max_memory_mb: int | None, nice: int):
+    if max_memory_mb:
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if nice:
+        os.nice(nice)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Ingest upstream data into the shared store.")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=get_nested("ingest", "interval_minutes", 15),
+        help="minutes between passes",
+    )
+    parser.add_argument(
+        "--datasets", nargs="+", default=list(DATASETS), choices=DATASETS, metavar="NAME"
+    )
+    parser.add_argument(
+        "--tenants", nargs="+", default=tenants(), choices=tenants(), metavar="TENANT"
+    )
+    parser.add_argument("--max-memory-mb", type=int, default=get_nested("ingest", "max_memory_mb"))
+    parser.add_argument("--nice", type=int, default=get_nested("ingest", "nice", 0))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    targets = {}
+    for tenant in args.tenants:
+        with tenant_scope(tenant):
+            path = get_nested("store", "path")
+            if not path:
+                parser.error("store.path must be set in config/settings.yaml to run ingestion")
+            store = SharedStore(
+                tenant_path(path), lease_seconds=get_nested("store", "lease_seconds", 120)
+            )
+            history_path = get_nested("history", "path")
+            history = SnapshotHistory(tenant_path(history_path)) if history_path else None
+            targets[tenant] = store, history, get_nested("ingest", "keep_versions", 3)
+
+    _apply_resource_limits(args.max_memory_mb, args.nice)
+
+    stopping = False
+
+    def _stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    while True:
+        for tenant, (store, history, keep) in targets.items():
+            with tenant_scope(tenant):
+                run_once(store, args.datasets, keep_versions=keep, history=history)
+        if args.once:
+            return 0
+        deadline = time.monotonic() + args.interval * 60
+        while not stopping and time.monotonic() < deadline:
+            time.sleep(1)
+        if stopping:
+            logger.info("stopping")
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,70 @@ To enable JIRA integration:
 
 This module provides the interface that data_loader.py expects.
 Each function should return a pandas DataFrame matching the mock data schema.
+Functions receive the page's QuerySpec (or None for everything); pass
+``build_jql(name, spec)`` to the search endpoint so JIRA returns only the
+selected slice.
 """
 
 import pandas as pd
 
+from src.data.query_spec import QuerySpec
 from src.utils.config import get_nested
 
+# JIRA field the spec's date window maps to, per dataset.
+_JQL_DATE_FIELDS = {
+    "milestones": "duedate",
+    "risks": "created",
+    "escalations": "created",
+    "metrics": "updated",
+}
+
+
+def _jql_list(values) -> str:
+    return ", ".join(f'"{v}"' for v in values)
+
+
+def _quarter_clause(field: str, quarter: str) -> str:
+    """``Q3 2025`` -> a date range on ``field`` covering that quarter."""
+    label, year = quarter.split()
+    period = pd.Period(f"{year}{label}", freq="Q")
+    return (
+        f'({field} >= "{period.start_time:%Y-%m-%d}" '
+        f'AND {field} <= "{period.end_time:%Y-%m-%d}")'
+    )
+
+
+def build_jql(name: str, spec: QuerySpec | None = None) -> str:
+    """JQL restricting a dataset's search to the spec's selection.
+
+    Programs map to ``jira.project_keys`` by position (PRG-001 is the first
+    key), statuses and severities to ``status`` and ``priority``, and
+    quarters and the date window to ranges on the dataset's date field.
+    """
+    project_keys = get_nested("jira", "project_keys", [])
+    clauses = []
+    if spec is None or spec.program_ids is None:
+        keys = project_keys
+    else:
+        keys = [
+            key for idx, key in enumerate(project_keys, 1) if f"PRG-{idx:03d}" in spec.program_ids
+        ]
+    clauses.append(f"project in ({_jql_list(keys)})" if keys else "project is EMPTY")
+    if spec is not None:
+        if spec.statuses is not None and name in ("programs", "milestones"):
+            clauses.append(f"status in ({_jql_list(spec.statuses)})")
+        if spec.severities is not None and name == "risks":
+            clauses.append(f"priority in ({_jql_list(spec.severities)})")
+        date_field = _JQL_DATE_FIELDS.get(name)
+        if date_field and spec.quarters is not None and name == "milestones":
+            quarters = [_quarter_clause(date_field, q) for q in spec.quarters]
+            clauses.append(f"({' OR '.join(quarters)})" if quarters else "project is EMPTY")
+        if date_field and spec.start is not None:
+            clauses.append(f'{date_field} >= "{spec.start:%Y-%m-%d}"')
+        if date_field and spec.end is not None:
+            clauses.append(f'{date_field} <= "{spec.end:%Y-%m-%d}"')
+    return " AND ".join(clauses)
+
 
 def _get_client():
     """Create an authenticated JIRA session.
@@ -34,31 +92,38 @@ def _get_client():
     raise NotImplementedError("JIRA client fetch logic not yet implemented.")
 
 
-def fetch_programs() -> pd.DataFrame:
+def fetch_programs(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch programs from JIRA epics or initiatives."""
     raise NotImplementedError("Map JIRA epics to Program model fields.")
 
 
-def fetch_milestones() -> pd.DataFrame:
+def fetch_milestones(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch milestones from JIRA versions or custom fields."""
     raise NotImplementedError("Map JIRA fix versions to Milestone model fields.")
 
 
-def fetch_risks() -> pd.DataFrame:
+def fetch_risks(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch risks from JIRA issues with risk label/type."""
     raise NotImplementedError("Map JIRA risk issues to RiskItem model fields.")
 
 
-def fetch_escalations() -> pd.DataFrame:
+def fetch_escalations(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch escalations from JIRA issues with escalation label."""
     raise NotImplementedError("Map JIRA escalation issues to Escalation model fields.")
 
 
-def fetch_metrics() -> pd.DataFrame:
+def fetch_metrics(spec: QuerySpec | None = None) -> pd.DataFrame:
     """Fetch delivery metrics from JIRA sprint reports."""
     raise NotImplementedError("Map JIRA sprint velocity to DeliveryMetric model fields.")
 
 
-def fetch_weekly_snapshots() -> pd.DataFrame:
-    """Aggregate metrics into weekly snapshots."""
-    raise NotImplementedError("Aggregate JIRA sprint data into WeeklySnapshot model fields.")
+def fetch_hierarchy(spec: QuerySpec | None = None) -> pd.DataFrame:
+    """Fetch the initiative -> epic -> project tree (parent links via the parent field)."""
+    raise NotImplementedError("Map JIRA issue parent links to PortfolioNode model fields.")
+
+
+def fetch_status_transitions(spec: QuerySpec | None = None) -> pd.DataFrame:
+    """Fetch program status changes from the epic changelogs (expand=changelog)."""
+    raise NotImplementedError(
+        "Map JIRA status changelog entries to program_id, changed_at and status."
+    )
@@ -0,0 +1,144 @@
+"""Delivery metrics as a dense program x week x metric array.
+
+The metrics frame is long-format: one row per program and week. Every chart
+and KPI card used to re-group it by week on each render. A
+:class:`MetricsCube` is built from the frame once per refresh; a program
+selection is then an index into the first axis, and weekly totals, averages
+and latest-week deltas are NumPy reductions over the selected cells only.
+
+Cells with no metrics row are NaN and are left out of every reduction, so
+results match a ``groupby("week_start")`` over the same rows.
+"""
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.utils.constants import DORA_BENCHMARKS
+from src.utils.helpers import DORA_LEVELS, dora_maturity_codes
+
+MEASURES = [
+    "velocity",
+    "planned_points",
+    "delivered_points",
+    "mttr_hours",
+    "deployment_frequency",
+    "lead_time_days",
+    "change_failure_rate",
+    "defect_count",
+    "incident_count",
+]
+
+
+class MetricsCube:
+    """Metric values indexed by program, week and measure."""
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        program_ids: Sequence[str],
+        weeks: pd.DatetimeIndex,
+        measures: Sequence[str] = tuple(MEASURES),
+        present: np.ndarray | None = None,
+    ):
+        """``values`` has shape ``(programs, weeks, measures)``; missing cells are NaN.
+
+        ``present`` marks the (program, week) cells that have a metrics row;
+        it is derived from ``values`` when not given.
+        """
+        self.values = values
+        self.present = ~np.isnan(values).all(axis=2) if present is None else present
+        self.program_ids = list(program_ids)
+        self.weeks = pd.DatetimeIndex(weeks, name="week_start")
+        self.measures = list(measures)
+        self._program_index = {pid: i for i, pid in enumerate(self.program_ids)}
+        self._measure_index = {m: i for i, m in enumerate(self.measures)}
+
+    @classmethod
+    def from_frame(cls, metrics: pd.DataFrame) -> "MetricsCube":
+        """Build from a metrics frame; a repeated program/week keeps its last row."""
+        measures = [m for m in MEASURES if m in metrics.columns]
+        if metrics.empty:
+            return cls(np.empty((0, 0, len(measures)), np.float32), [], [], measures)
+        week_start = pd.to_datetime(metrics["week_start"])
+        programs, program_ids = pd.factorize(metrics["program_id"].astype(str), sort=True)
+        weeks, week_index = pd.factorize(week_start, sort=True)
+        values = np.full((len(program_ids), len(week_index), len(measures)), np.nan, np.float32)
+        values[programs, weeks] = metrics[measures].to_numpy(np.float32)
+        return cls(values, program_ids, week_index, measures)
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.present.nbytes
+
+    @property
+    def empty(self) -> bool:
+        return not self.present.any()
+
+    def select(self, program_ids: Iterable[str]) -> "MetricsCube":
+        """The cube restricted to ``program_ids``; unknown ids are ignored."""
+        positions = [self._program_index[p] for p in program_ids if p in self._program_index]
+        selected = [self.program_ids[i] for i in positions]
+        return MetricsCube(
+            self.values[positions], selected, self.weeks, self.measures, self.present[positions]
+        )
+
+    def latest_weeks(self, count: int = 2) -> list[pd.Timestamp]:
+        """The last ``count`` weeks with any metrics row, oldest first."""
+        with_data = self.weeks[self.present.any(axis=0)]
+        return list(with_data[-count:])
+
+    def _reduce(self, block: np.ndarray, how: str) -> np.ndarray:
+        """Sum or mean over the program axis, skipping missing cells."""
+        present = ~np.isnan(block)
+        total = np.where(present, block, 0).sum(axis=0, dtype=np.float64)
+        if how == "sum":
+            return total
+        if how == "mean":
+            counts = present.sum(axis=0)
+            return np.divide(total, counts, out=np.full(total.shape, np.nan), where=counts > 0)
+        raise ValueError(f"Unknown reduction: {how}")
+
+    def weekly(self, aggregations: dict[str, str]) -> pd.DataFrame:
+        """One row per week with data: ``{measure: "sum" | "mean"}`` over the programs."""
+        week_mask = self.present.any(axis=0)
+        out = {"week_start": self.weeks[week_mask]}
+        for measure, how in aggregations.items():
+            block = self.values[:, week_mask, self._measure_index[measure]]
+            out[measure] = self._reduce(block, how)
+        return pd.DataFrame(out)
+
+    def at_week(self, week, aggregations: dict[str, str]) -> dict[str, float]:
+        """Each measure reduced over the programs for a single week."""
+        w = self.weeks.get_loc(pd.Timestamp(week))
+        return {
+            measure: float(self._reduce(self.values[:, w, self._measure_index[measure]], how))
+            for measure, how in aggregations.items()
+        }
+
+    def by_program(self, week, measures: Sequence[str]) -> pd.DataFrame:
+        """Per-program values for one week, for programs with a row that week."""
+        w = self.weeks.get_loc(pd.Timestamp(week))
+        present = self.present[:, w]
+        block = self.values[present, w][:, [self._measure_index[m] for m in measures]]
+        index = pd.Index(np.asarray(self.program_ids, dtype=object)[present], name="program_id")
+        return pd.DataFrame(block.astype(np.float64), index=index, columns=list(measures))
+
+    def maturity(self) -> np.ndarray:
+        """DORA maturity code of every (program, week) cell, -1 where there is no row.
+
+        Codes index :data:`~src.utils.helpers.DORA_LEVELS`; the whole history
+        is classified in one pass.
+        """
+        codes = dora_maturity_codes(
+            {m: self.values[:, :, self._measure_index[m]] for m in DORA_BENCHMARKS}
+        )
+        return np.where(self.present, codes, -1).astype(np.int8)
+
+    def maturity_counts(self) -> pd.DataFrame:
+        """One row per week with data: the number of programs at each maturity level."""
+        week_mask = self.present.any(axis=0)
+        codes = self.maturity()[:, week_mask]
+        counts = {level: (codes == code).sum(axis=0) for code, level in enumerate(DORA_LEVELS)}
+        return pd.DataFrame({"week_start": self.weeks[week_mask], **counts})
@@ -1,12 +1,49 @@
-"""Realistic mock data generator for 6 programs with correlated milestones, risks, and metrics."""
-
+"""Mock data: a hand-written 6-program demo and larger generated scenarios.
+
+``mock.scenario`` in settings.yaml picks one of :data:`SCENARIOS` (or a
+scenario defined under ``mock.scenarios``). The ``demo`` scenario is the
+curated portfolio below with correlated milestones, risks and metrics;
+the others are generated at scale by :mod:`src.data.synthetic`.
+
+In the demo, each program's milestones, risks and metrics are drawn from that program's
+own random stream, derived from ``SEED`` and the program id. A program's
+data therefore never depends on generation order or on the other programs,
+and generation can be split across worker processes with identical results.
+
+Generated datasets are memoized per scenario and seed, and served as frames
+via :func:`get_frame` (the ``get_*`` model getters return the demo), so
+after the first load mock mode costs nothing. :func:`clear_cache` drops
+them; it runs automatically on :func:`src.utils.config.reload_config`.
+"""
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
 from datetime import date, timedelta
+from functools import partial
 import random
-
-from src.data.models import DeliveryMetric, Escalation, Milestone, Program, RiskItem, WeeklySnapshot
+import threading
+
+import pandas as pd
+
+from src.data.aggregation import weekly_snapshots
+from src.data.models import (
+    DeliveryMetric,
+    Escalation,
+    Milestone,
+    PortfolioNode,
+    Program,
+    RiskItem,
+    WeeklySnapshot,
+)
+from src.data.schema import frame_from_models
+from src.data.status_history import StatusHistory
+from src.data.synthetic import generate_portfolio, project_nodes
+from src.utils.config import get_nested, on_reload
 from src.utils.constants import (
     EscalationLevel,
     MilestoneStatus,
+    NodeLevel,
     ProgramStatus,
     RiskLikelihood,
     RiskSeverity,
@@ -15,8 +52,123 @@ from src.utils.constants import (
 SEED = 42
 
 
-def _seed():
-    random.seed(SEED)
+@dataclass(frozen=True)
+class Scenario:
+    """Size and seed of the mock portfolio.
+
+    ``programs=None`` is the hand-written six-program demo; any count goes
+    through the vectorized generator with the given weeks and densities,
+    ending on ``as_of`` (today unless configured).
+    """
+
+    name: str
+    programs: int | None = None
+    weeks: int = 34
+    milestones_per_program: float = 7.0
+    risks_per_program: float = 2.5
+    escalation_rate: float = 0.15
+    seed: int = SEED
+    as_of: date | None = None
+
+
+SCENARIOS = {
+    "demo": Scenario("demo"),
+    "enterprise": Scenario("enterprise", programs=500, weeks=52, seed=500),
+    "stress": Scenario(
+        "stress",
+        programs=5_000,
+        weeks=104,
+        milestones_per_program=10.0,
+        risks_per_program=4.0,
+        seed=5_000,
+    ),
+}
+
+# Keys a mock.scenarios entry may override.
+_SCENARIO_SETTINGS = {f.name for f in fields(Scenario)} - {"name"}
+
+
+def current_scenario() -> Scenario:
+    """The configured scenario, with any ``mock.scenarios`` overrides and ``mock.seed`` applied.
+
+    Raises ``ValueError`` for a scenario that is neither built in nor configured,
+    or for an override key that is not a scenario setting.
+    """
+    name = get_nested("mock", "scenario", "demo")
+    overrides = (get_nested("mock", "scenarios") or {}).get(name) or {}
+    if name not in SCENARIOS and not overrides:
+        raise ValueError(
+            f"Unknown mock scenario '{name}'. "
+            f"Use one of {sorted(SCENARIOS)} or define it under mock.scenarios."
+        )
+    unknown = set(overrides) - _SCENARIO_SETTINGS
+    if unknown:
+        raise ValueError(
+            f"Unknown setting(s) {sorted(unknown)} for mock scenario '{name}'. "
+            f"Use any of {sorted(_SCENARIO_SETTINGS)}."
+        )
+    scenario = replace(SCENARIOS.get(name, Scenario(name)), **overrides)
+    seed = get_nested("mock", "seed")
+    if seed is not None:
+        scenario = replace(scenario, seed=seed)
+    # Resolved here so generated datasets are regenerated when the day rolls over.
+    as_of = scenario.as_of or date.today()
+    if isinstance(as_of, str):
+        as_of = date.fromisoformat(as_of)
+    return replace(scenario, as_of=as_of)
+
+
+def _demo_scenario() -> Scenario:
+    """The current scenario if it is the demo, else the built-in demo."""
+    scenario = current_scenario()
+    return scenario if scenario.programs is None else SCENARIOS["demo"]
+
+
+def _rng(program_id: str, dataset: str, seed: int) -> random.Random:
+    """Independent random stream for one program's rows of ``dataset``."""
+    return random.Random(f"{seed}:{program_id}:{dataset}")
+
+
+def _per_program(
+    build: Callable[..., list], program_ids: list[str], seed: int, workers: int = 1
+) -> list:
+    """Concatenate ``build(program_id, seed)`` over programs, optionally in a process pool.
+
+    Every program has its own random stream, so the result is the same for
+    any number of workers.
+    """
+    build = partial(build, seed=seed)
+    if workers <= 1:
+        return [row for pid in program_ids for row in build(pid)]
+    with ProcessPoolExecutor(workers) as pool:
+        return [row for rows in pool.map(build, program_ids) for row in rows]
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+_cache: dict[tuple, object] = {}
+_cache_lock = threading.Lock()
+
+
+def _memoized(key: Hashable, build: Callable[[Scenario], object], scenario: Scenario):
+    """``build(scenario)``, generated once per scenario and then served from the cache."""
+    with _cache_lock:
+        if (scenario, key) in _cache:
+            return _cache[(scenario, key)]
+    value = build(scenario)
+    with _cache_lock:
+        return _cache.setdefault((scenario, key), value)
+
+
+def clear_cache():
+    """Forget every generated dataset, e.g. after ``mock.seed`` or ``mock.scenario`` changes."""
+    with _cache_lock:
+        _cache.clear()
+
+
+on_reload(clear_cache)
 
 
 # ---------------------------------------------------------------------------
@@ -114,196 +266,213 @@ PROGRAMS = [
 # ---------------------------------------------------------------------------
 
 
-def _generate_milestones() -> list[Milestone]:
-    _seed()
+_MILESTONE_PLAN = {
+    "PRG-001": [
+        ("Network architecture design", "Q2 2025", True, MilestoneStatus.COMPLETED),
+        ("VPC peering setup", "Q2 2025", False, MilestoneStatus.COMPLETED),
+        ("Dev environment migration", "Q3 2025", True, MilestoneStatus.COMPLETED),
+        ("Staging environment migration", "Q4 2025", True, MilestoneStatus.COMPLETED),
+        ("Database replication cutover", "Q4 2025", False, MilestoneStatus.COMPLETED),
+        ("Production Tier-2 migration", "Q1 2026", True, MilestoneStatus.IN_PROGRESS),
+        ("Production Tier-1 migration", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
+        ("Decommission legacy infra", "Q2 2026", False, MilestoneStatus.NOT_STARTED),
+    ],
+    "PRG-002": [
+        ("Metrics pipeline MVP", "Q1 2025", True, MilestoneStatus.COMPLETED),
+        ("Log aggregation rollout", "Q2 2025", True, MilestoneStatus.COMPLETED),
+        ("Distributed tracing integration", "Q3 2025", True, MilestoneStatus.COMPLETED),
+        ("Alerting rules migration", "Q3 2025", False, MilestoneStatus.COMPLETED),
+        ("SLO dashboards for Tier-1", "Q4 2025", True, MilestoneStatus.COMPLETED),
+        ("On-call runbook automation", "Q1 2026", False, MilestoneStatus.COMPLETED),
+        ("Full observability coverage", "Q1 2026", True, MilestoneStatus.IN_PROGRESS),
+    ],
+    "PRG-003": [
+        ("IAM audit & gap analysis", "Q1 2025", True, MilestoneStatus.COMPLETED),
+        ("mTLS for internal services", "Q2 2025", True, MilestoneStatus.COMPLETED),
+        ("Identity provider migration", "Q3 2025", True, MilestoneStatus.DELAYED),
+        ("Microsegmentation Phase 1", "Q4 2025", True, MilestoneStatus.IN_PROGRESS),
+        ("Endpoint detection rollout", "Q1 2026", False, MilestoneStatus.NOT_STARTED),
+        ("Microsegmentation Phase 2", "Q1 2026", True, MilestoneStatus.NOT_STARTED),
+        ("Compliance certification", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
+    ],
+    "PRG-004": [
+        ("API inventory & mapping", "Q3 2025", True, MilestoneStatus.COMPLETED),
+        ("Kong gateway POC", "Q3 2025", False, MilestoneStatus.COMPLETED),
+        ("Internal API migration", "Q4 2025", True, MilestoneStatus.COMPLETED),
+        ("Partner API migration", "Q1 2026", True, MilestoneStatus.IN_PROGRESS),
+        ("Rate limiting & throttling", "Q1 2026", False, MilestoneStatus.IN_PROGRESS),
+        ("Public API migration", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
+        ("Legacy gateway decommission", "Q3 2026", False, MilestoneStatus.NOT_STARTED),
+    ],
+    "PRG-005": [
+        ("DR runbook audit", "Q2 2025", True, MilestoneStatus.COMPLETED),
+        ("Automated failover POC", "Q3 2025", True, MilestoneStatus.DELAYED),
+        ("Tier-1 DR automation", "Q4 2025", True, MilestoneStatus.BLOCKED),
+        ("DR testing framework", "Q1 2026", False, MilestoneStatus.NOT_STARTED),
+        ("Cross-region replication", "Q1 2026", True, MilestoneStatus.NOT_STARTED),
+        ("Full DR drill execution", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
+    ],
+    "PRG-006": [
+        ("Data source inventory", "Q1 2025", True, MilestoneStatus.COMPLETED),
+        ("Lakehouse architecture", "Q1 2025", True, MilestoneStatus.COMPLETED),
+        ("ETL pipeline migration", "Q2 2025", True, MilestoneStatus.COMPLETED),
+        ("Data quality framework", "Q3 2025", True, MilestoneStatus.COMPLETED),
+        ("Self-service analytics", "Q3 2025", False, MilestoneStatus.COMPLETED),
+        ("Legacy warehouse decommission", "Q4 2025", True, MilestoneStatus.COMPLETED),
+        ("Cost optimization review", "Q4 2025", False, MilestoneStatus.COMPLETED),
+    ],
+}
+
+
+def _milestone_numbers() -> dict[str, int]:
+    """Number of each program's first milestone; ids run through the plan in order."""
+    numbers, next_number = {}, 1
+    for pid, plan in _MILESTONE_PLAN.items():
+        numbers[pid] = next_number
+        next_number += len(plan)
+    return numbers
+
+
+_FIRST_MILESTONE = _milestone_numbers()
+
+_MILESTONE_OWNERS = ["Priya", "James", "Maria", "Alex", "David", "Sarah", "Li", "Kumar"]
+
+
+def _program_milestones(pid: str, seed: int = SEED) -> list[Milestone]:
+    rng = _rng(pid, "milestones", seed)
     milestones = []
-    mid = 0
-
-    program_milestones = {
-        "PRG-001": [
-            ("Network architecture design", "Q2 2025", True, MilestoneStatus.COMPLETED),
-            ("VPC peering setup", "Q2 2025", False, MilestoneStatus.COMPLETED),
-            ("Dev environment migration", "Q3 2025", True, MilestoneStatus.COMPLETED),
-            ("Staging environment migration", "Q4 2025", True, MilestoneStatus.COMPLETED),
-            ("Database replication cutover", "Q4 2025", False, MilestoneStatus.COMPLETED),
-            ("Production Tier-2 migration", "Q1 2026", True, MilestoneStatus.IN_PROGRESS),
-            ("Production Tier-1 migration", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
-            ("Decommission legacy infra", "Q2 2026", False, MilestoneStatus.NOT_STARTED),
-        ],
-        "PRG-002": [
-            ("Metrics pipeline MVP", "Q1 2025", True, MilestoneStatus.COMPLETED),
-            ("Log aggregation rollout", "Q2 2025", True, MilestoneStatus.COMPLETED),
-            ("Distributed tracing integration", "Q3 2025", True, MilestoneStatus.COMPLETED),
-            ("Alerting rules migration", "Q3 2025", False, MilestoneStatus.COMPLETED),
-            ("SLO dashboards for Tier-1", "Q4 2025", True, MilestoneStatus.COMPLETED),
-            ("On-call runbook automation", "Q1 2026", False, MilestoneStatus.COMPLETED),
-            ("Full observability coverage", "Q1 2026", True, MilestoneStatus.IN_PROGRESS),
-        ],
-        "PRG-003": [
-            ("IAM audit & gap analysis", "Q1 2025", True, MilestoneStatus.COMPLETED),
-            ("mTLS for internal services", "Q2 2025", True, MilestoneStatus.COMPLETED),
-            ("Identity provider migration", "Q3 2025", True, MilestoneStatus.DELAYED),
-            ("Microsegmentation Phase 1", "Q4 2025", True, MilestoneStatus.IN_PROGRESS),
-            ("Endpoint detection rollout", "Q1 2026", False, MilestoneStatus.NOT_STARTED),
-            ("Microsegmentation Phase 2", "Q1 2026", True, MilestoneStatus.NOT_STARTED),
-            ("Compliance certification", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
-        ],
-        "PRG-004": [
-            ("API inventory & mapping", "Q3 2025", True, MilestoneStatus.COMPLETED),
-            ("Kong gateway POC", "Q3 2025", False, MilestoneStatus.COMPLETED),
-            ("Internal API migration", "Q4 2025", True, MilestoneStatus.COMPLETED),
-            ("Partner API migration", "Q1 2026", True, MilestoneStatus.IN_PROGRESS),
-            ("Rate limiting & throttling", "Q1 2026", False, MilestoneStatus.IN_PROGRESS),
-            ("Public API migration", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
-            ("Legacy gateway decommission", "Q3 2026", False, MilestoneStatus.NOT_STARTED),
-        ],
-        "PRG-005": [
-            ("DR runbook audit", "Q2 2025", True, MilestoneStatus.COMPLETED),
-            ("Automated failover POC", "Q3 2025", True, MilestoneStatus.DELAYED),
-            ("Tier-1 DR automation", "Q4 2025", True, MilestoneStatus.BLOCKED),
-            ("DR testing framework", "Q1 2026", False, MilestoneStatus.NOT_STARTED),
-            ("Cross-region replication", "Q1 2026", True, MilestoneStatus.NOT_STARTED),
-            ("Full DR drill execution", "Q2 2026", True, MilestoneStatus.NOT_STARTED),
-        ],
-        "PRG-006": [
-            ("Data source inventory", "Q1 2025", True, MilestoneStatus.COMPLETED),
-            ("Lakehouse architecture", "Q1 2025", True, MilestoneStatus.COMPLETED),
-            ("ETL pipeline migration", "Q2 2025", True, MilestoneStatus.COMPLETED),
-            ("Data quality framework", "Q3 2025", True, MilestoneStatus.COMPLETED),
-            ("Self-service analytics", "Q3 2025", False, MilestoneStatus.COMPLETED),
-            ("Legacy warehouse decommission", "Q4 2025", True, MilestoneStatus.COMPLETED),
-            ("Cost optimization review", "Q4 2025", False, MilestoneStatus.COMPLETED),
-        ],
-    }
-
-    for pid, ms_list in program_milestones.items():
-        for name, quarter, is_key, status in ms_list:
-            mid += 1
-            q_num = int(quarter[1])
-            year = int(quarter.split()[1])
-            base_month = (q_num - 1) * 3 + 1
-            due = date(year, base_month, 1) + timedelta(days=random.randint(15, 75))
-            completed = None
-            if status == MilestoneStatus.COMPLETED:
-                completed = due - timedelta(days=random.randint(-5, 10))
-            elif status == MilestoneStatus.DELAYED:
-                completed = None
-
-            milestones.append(
-                Milestone(
-                    id=f"MS-{mid:03d}",
-                    program_id=pid,
-                    name=name,
-                    status=status,
-                    due_date=due,
-                    completed_date=completed,
-                    quarter=quarter,
-                    owner=random.choice(
-                        ["Priya", "James", "Maria", "Alex", "David", "Sarah", "Li", "Kumar"]
-                    ),
-                    is_key_milestone=is_key,
-                )
+    for mid, (name, quarter, is_key, status) in enumerate(
+        _MILESTONE_PLAN.get(pid, []), _FIRST_MILESTONE.get(pid, 1)
+    ):
+        q_num = int(quarter[1])
+        year = int(quarter.split()[1])
+        base_month = (q_num - 1) * 3 + 1
+        due = date(year, base_month, 1) + timedelta(days=rng.randint(15, 75))
+        completed = None
+        if status == MilestoneStatus.COMPLETED:
+            completed = due - timedelta(days=rng.randint(-5, 10))
+
+        milestones.append(
+            Milestone(
+                id=f"MS-{mid:03d}",
+                program_id=pid,
+                name=name,
+                status=status,
+                due_date=due,
+                completed_date=completed,
+                quarter=quarter,
+                owner=rng.choice(_MILESTONE_OWNERS),
+                is_key_milestone=is_key,
             )
+        )
     return milestones
 
 
+def _generate_milestones(seed: int = SEED, workers: int = 1) -> list[Milestone]:
+    return _per_program(_program_milestones, list(_MILESTONE_PLAN), seed, workers)
+
+
 # ---------------------------------------------------------------------------
 # Risks
 # ---------------------------------------------------------------------------
 
 
-def _generate_risks() -> list[RiskItem]:
-    _seed()
-    risks_data = [
-        ("PRG-001", "Cloud vendor lock-in", RiskSeverity.HIGH, RiskLikelihood.MEDIUM, True),
-        (
-            "PRG-001",
-            "Data transfer costs exceed budget",
-            RiskSeverity.MEDIUM,
-            RiskLikelihood.HIGH,
-            True,
-        ),
-        (
-            "PRG-001",
-            "Skill gap in cloud-native tooling",
-            RiskSeverity.MEDIUM,
-            RiskLikelihood.LOW,
-            False,
-        ),
-        (
-            "PRG-002",
-            "Alert fatigue from noisy rules",
-            RiskSeverity.MEDIUM,
-            RiskLikelihood.HIGH,
-            True,
-        ),
-        (
-            "PRG-002",
-            "Tracing overhead on latency-sensitive services",
-            RiskSeverity.LOW,
-            RiskLikelihood.MEDIUM,
-            False,
-        ),
-        (
-            "PRG-003",
-            "mTLS certificate rotation failures",
-            RiskSeverity.CRITICAL,
-            RiskLikelihood.MEDIUM,
-            True,
-        ),
-        (
-            "PRG-003",
-            "Legacy apps incompatible with zero-trust",
-            RiskSeverity.HIGH,
-            RiskLikelihood.HIGH,
-            True,
-        ),
-        (
-            "PRG-003",
-            "Vendor delay on IdP integration",
-            RiskSeverity.HIGH,
-            RiskLikelihood.MEDIUM,
-            True,
-        ),
-        (
-            "PRG-004",
-            "Breaking changes to partner APIs",
-            RiskSeverity.HIGH,
-            RiskLikelihood.MEDIUM,
-            True,
-        ),
-        (
-            "PRG-004",
-            "Rate limiting misconfiguration",
-            RiskSeverity.MEDIUM,
-            RiskLikelihood.LOW,
-            False,
-        ),
-        (
-            "PRG-005",
-            "Cross-region latency exceeds RTO",
-            RiskSeverity.CRITICAL,
-            RiskLikelihood.HIGH,
-            True,
-        ),
-        (
-            "PRG-005",
-            "DR testing impacts production",
-            RiskSeverity.HIGH,
-            RiskLikelihood.MEDIUM,
-            True,
-        ),
-        (
-            "PRG-005",
-            "Incomplete runbook documentation",
-            RiskSeverity.MEDIUM,
-            RiskLikelihood.HIGH,
-            True,
-        ),
-        ("PRG-006", "Data loss during migration", RiskSeverity.CRITICAL, RiskLikelihood.LOW, False),
-    ]
+_RISK_PLAN = [
+    ("PRG-001", "Cloud vendor lock-in", RiskSeverity.HIGH, RiskLikelihood.MEDIUM, True),
+    (
+        "PRG-001",
+        "Data transfer costs exceed budget",
+        RiskSeverity.MEDIUM,
+        RiskLikelihood.HIGH,
+        True,
+    ),
+    (
+        "PRG-001",
+        "Skill gap in cloud-native tooling",
+        RiskSeverity.MEDIUM,
+        RiskLikelihood.LOW,
+        False,
+    ),
+    (
+        "PRG-002",
+        "Alert fatigue from noisy rules",
+        RiskSeverity.MEDIUM,
+        RiskLikelihood.HIGH,
+        True,
+    ),
+    (
+        "PRG-002",
+        "Tracing overhead on latency-sensitive services",
+        RiskSeverity.LOW,
+        RiskLikelihood.MEDIUM,
+        False,
+    ),
+    (
+        "PRG-003",
+        "mTLS certificate rotation failures",
+        RiskSeverity.CRITICAL,
+        RiskLikelihood.MEDIUM,
+        True,
+    ),
+    (
+        "PRG-003",
+        "Legacy apps incompatible with zero-trust",
+        RiskSeverity.HIGH,
+        RiskLikelihood.HIGH,
+        True,
+    ),
+    (
+        "PRG-003",
+        "Vendor delay on IdP integration",
+        RiskSeverity.HIGH,
+        RiskLikelihood.MEDIUM,
+        True,
+    ),
+    (
+        "PRG-004",
+        "Breaking changes to partner APIs",
+        RiskSeverity.HIGH,
+        RiskLikelihood.MEDIUM,
+        True,
+    ),
+    (
+        "PRG-004",
+        "Rate limiting misconfiguration",
+        RiskSeverity.MEDIUM,
+        RiskLikelihood.LOW,
+        False,
+    ),
+    (
+        "PRG-005",
+        "Cross-region latency exceeds RTO",
+        RiskSeverity.CRITICAL,
+        RiskLikelihood.HIGH,
+        True,
+    ),
+    (
+        "PRG-005",
+        "DR testing impacts production",
+        RiskSeverity.HIGH,
+        RiskLikelihood.MEDIUM,
+        True,
+    ),
+    (
+        "PRG-005",
+        "Incomplete runbook documentation",
+        RiskSeverity.MEDIUM,
+        RiskLikelihood.HIGH,
+        True,
+    ),
+    ("PRG-006", "Data loss during migration", RiskSeverity.CRITICAL, RiskLikelihood.LOW, False),
+]
+
+
+def _program_risks(pid: str, seed: int = SEED) -> list[RiskItem]:
+    rng = _rng(pid, "risks", seed)
     risks = []
-    for i, (pid, title, sev, lik, is_open) in enumerate(risks_data, 1):
+    for i, (risk_pid, title, sev, lik, is_open) in enumerate(_RISK_PLAN, 1):
+        if risk_pid != pid:
+            continue
         risks.append(
             RiskItem(
                 id=f"RSK-{i:03d}",
@@ -312,14 +481,19 @@ def _generate_risks() -> list[RiskItem]:
                 severity=sev,
                 likelihood=lik,
                 mitigation=f"Mitigation plan documented in confluence for {title.lower()}.",
-                owner=random.choice(["Priya", "James", "Maria", "Alex", "David", "Sarah"]),
-                raised_date=date(2025, 1, 1) + timedelta(days=random.randint(0, 300)),
+                owner=rng.choice(["Priya", "James", "Maria", "Alex", "David", "Sarah"]),
+                raised_date=date(2025, 1, 1) + timedelta(days=rng.randint(0, 300)),
                 is_open=is_open,
             )
         )
     return risks
 
 
+def _generate_risks(seed: int = SEED, workers: int = 1) -> list[RiskItem]:
+    program_ids = list(dict.fromkeys(pid for pid, *_ in _RISK_PLAN))
+    return _per_program(_program_risks, program_ids, seed, workers)
+
+
 # ---------------------------------------------------------------------------
 # Escalations
 # ---------------------------------------------------------------------------
@@ -436,122 +610,167 @@ _STATUS_HISTORY = {
 }
 
 
-def _get_status_at_date(program_id: str, as_of: date) -> ProgramStatus:
-    """Return the status of a program at a given date."""
-    transitions = _STATUS_HISTORY.get(program_id, [])
-    status = ProgramStatus.ON_TRACK
-    for transition_date, transition_status in transitions:
-        if as_of >= transition_date:
-            status = transition_status
-    return status
+_METRICS_START = date(2025, 7, 7)  # Start tracking from Q3 2025
+_METRIC_WEEKS = 34  # ~8 months of data
+
 
+def _program_metrics(pid: str, seed: int = SEED) -> list[DeliveryMetric]:
+    rng = _rng(pid, "metrics", seed)
+    prof = _METRIC_PROFILES[pid]
+    noise_lo, noise_hi = prof["noise_range"]
+    slope = prof["trend_slope"]
+    cfr_base = prof["cfr_base"]
 
-def _generate_metrics() -> list[DeliveryMetric]:
-    _seed()
     metrics = []
-    start = date(2025, 7, 7)  # Start tracking from Q3 2025
-    num_weeks = 34  # ~8 months of data
-
-    for pid, prof in _METRIC_PROFILES.items():
-        noise_lo, noise_hi = prof["noise_range"]
-        slope = prof["trend_slope"]
-        cfr_base = prof["cfr_base"]
-
-        for w in range(num_weeks):
-            week = start + timedelta(weeks=w)
-            noise = random.uniform(noise_lo, noise_hi)
-            trend = 1 + (w * slope)
-
-            velocity = round(prof["velocity_base"] * noise * trend, 1)
-            planned = round(velocity * random.uniform(0.9, 1.15), 1)
-            delivered = round(velocity * random.uniform(0.85, 1.05), 1)
-            defects = max(0, int(prof["defect_base"] * noise + random.randint(-2, 2)))
-            incidents = max(0, random.randint(0, max(1, defects // 2)))
-            mttr = round(random.uniform(0.5, 4.0), 1)
-            deploy_freq = round(prof["deploy_freq"] * noise * trend, 1)
-            lead_time = round(prof["lead_time"] * random.uniform(0.7, 1.3) * (2 - trend), 1)
-            # CFR correlated with trend: worse programs have higher CFR
-            cfr = round(max(1, min(50, cfr_base * noise * (2 - trend))), 1)
-
-            metrics.append(
-                DeliveryMetric(
-                    program_id=pid,
-                    week_start=week,
-                    velocity=max(0, velocity),
-                    planned_points=max(0, planned),
-                    delivered_points=max(0, delivered),
-                    defect_count=defects,
-                    incident_count=incidents,
-                    mttr_hours=mttr,
-                    deployment_frequency=max(0, deploy_freq),
-                    lead_time_days=max(0.1, lead_time),
-                    change_failure_rate=cfr,
-                )
+    for w in range(_METRIC_WEEKS):
+        week = _METRICS_START + timedelta(weeks=w)
+        noise = rng.uniform(noise_lo, noise_hi)
+        trend = 1 + (w * slope)
+
+        velocity = round(prof["velocity_base"] * noise * trend, 1)
+        planned = round(velocity * rng.uniform(0.9, 1.15), 1)
+        delivered = round(velocity * rng.uniform(0.85, 1.05), 1)
+        defects = max(0, int(prof["defect_base"] * noise + rng.randint(-2, 2)))
+        incidents = max(0, rng.randint(0, max(1, defects // 2)))
+        mttr = round(rng.uniform(0.5, 4.0), 1)
+        deploy_freq = round(prof["deploy_freq"] * noise * trend, 1)
+        lead_time = round(prof["lead_time"] * rng.uniform(0.7, 1.3) * (2 - trend), 1)
+        # CFR correlated with trend: worse programs have higher CFR
+        cfr = round(max(1, min(50, cfr_base * noise * (2 - trend))), 1)
+
+        metrics.append(
+            DeliveryMetric(
+                program_id=pid,
+                week_start=week,
+                velocity=max(0, velocity),
+                planned_points=max(0, planned),
+                delivered_points=max(0, delivered),
+                defect_count=defects,
+                incident_count=incidents,
+                mttr_hours=mttr,
+                deployment_frequency=max(0, deploy_freq),
+                lead_time_days=max(0.1, lead_time),
+                change_failure_rate=cfr,
             )
+        )
     return metrics
 
 
+def _generate_metrics(seed: int = SEED, workers: int = 1) -> list[DeliveryMetric]:
+    return _per_program(_program_metrics, list(_METRIC_PROFILES), seed, workers)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def get_programs() -> list[Program]:
-    return PROGRAMS
+def _demo_models(key: str, build: Callable[[int], list]) -> tuple:
+    return _memoized(key, lambda scenario: tuple(build(scenario.seed)), _demo_scenario())
+
 
+def get_programs() -> tuple[Program, ...]:
+    return tuple(PROGRAMS)
 
-def get_milestones() -> list[Milestone]:
-    return _generate_milestones()
 
+def get_milestones(workers: int = 1) -> tuple[Milestone, ...]:
+    return _demo_models("milestones", lambda seed: _generate_milestones(seed, workers))
 
-def get_risks() -> list[RiskItem]:
-    return _generate_risks()
 
+def get_risks(workers: int = 1) -> tuple[RiskItem, ...]:
+    return _demo_models("risks", lambda seed: _generate_risks(seed, workers))
 
-def get_escalations() -> list[Escalation]:
-    return _generate_escalations()
 
+def get_escalations() -> tuple[Escalation, ...]:
+    return _demo_models("escalations", lambda seed: _generate_escalations())
 
-def get_metrics() -> list[DeliveryMetric]:
-    return _generate_metrics()
 
+def get_metrics(workers: int = 1) -> tuple[DeliveryMetric, ...]:
+    return _demo_models("metrics", lambda seed: _generate_metrics(seed, workers))
 
-def get_weekly_snapshots() -> list[WeeklySnapshot]:
+
+def _generate_hierarchy() -> list[PortfolioNode]:
+    root = PortfolioNode(id="PORTFOLIO", name="Delivery Portfolio", level=NodeLevel.PORTFOLIO)
+    projects = project_nodes(frame_from_models(PROGRAMS, "programs"))
+    nodes = [root]
+    for p in PROGRAMS:
+        nodes.append(
+            PortfolioNode(
+                id=p.id, parent_id=root.id, name=p.name, level=NodeLevel.PROGRAM, program_id=p.id
+            )
+        )
+        rows = projects[projects["parent_id"] == p.id]
+        nodes.extend(PortfolioNode(**row) for row in rows.to_dict("records"))
+    return nodes
+
+
+def get_hierarchy() -> tuple[PortfolioNode, ...]:
+    """One portfolio of programs, each delivered by projects that roll up to it."""
+    return _demo_models("hierarchy", lambda seed: _generate_hierarchy())
+
+
+def get_weekly_snapshots() -> tuple[WeeklySnapshot, ...]:
     """Aggregate per-program metrics into weekly snapshots with dynamic status counts."""
-    metrics = get_metrics()
-    weeks: dict[date, list[DeliveryMetric]] = {}
-    for m in metrics:
-        weeks.setdefault(m.week_start, []).append(m)
 
-    program_ids = [p.id for p in PROGRAMS]
+    def build(seed: int) -> list[WeeklySnapshot]:
+        metrics = frame_from_models(get_metrics(), "metrics")
+        history = StatusHistory.from_transitions(_STATUS_HISTORY)
+        frame = weekly_snapshots(metrics, history, [p.id for p in PROGRAMS])
+        frame["week_start"] = frame["week_start"].dt.date
+        return [WeeklySnapshot(**row) for row in frame.to_dict("records")]
 
-    snapshots = []
-    for week, week_metrics in sorted(weeks.items()):
-        n = len(week_metrics)
+    return _demo_models("weekly_snapshots", build)
 
-        # Compute status counts dynamically based on the week
-        status_counts: dict[ProgramStatus, int] = {}
-        for pid in program_ids:
-            status = _get_status_at_date(pid, week)
-            status_counts[status] = status_counts.get(status, 0) + 1
 
-        snapshots.append(
-            WeeklySnapshot(
-                week_start=week,
-                total_velocity=round(sum(m.velocity for m in week_metrics), 1),
-                total_defects=sum(m.defect_count for m in week_metrics),
-                total_incidents=sum(m.incident_count for m in week_metrics),
-                avg_mttr_hours=round(sum(m.mttr_hours for m in week_metrics) / n, 1),
-                avg_deployment_frequency=round(
-                    sum(m.deployment_frequency for m in week_metrics) / n, 1
-                ),
-                avg_lead_time_days=round(sum(m.lead_time_days for m in week_metrics) / n, 1),
-                avg_change_failure_rate=round(
-                    sum(m.change_failure_rate for m in week_metrics) / n, 1
-                ),
-                programs_on_track=status_counts.get(ProgramStatus.ON_TRACK, 0),
-                programs_at_risk=status_counts.get(ProgramStatus.AT_RISK, 0),
-                programs_off_track=status_counts.get(ProgramStatus.OFF_TRACK, 0),
-            )
+_GETTERS = {
+    "programs": get_programs,
+    "milestones": get_milestones,
+    "risks": get_risks,
+    "escalations": get_escalations,
+    "metrics": get_metrics,
+    "hierarchy": get_hierarchy,
+    "weekly_snapshots": get_weekly_snapshots,
+}
+
+
+def _synthetic(scenario: Scenario) -> dict:
+    """Every dataset of a generated scenario, plus its status history and weekly snapshots."""
+    frames = generate_portfolio(
+        programs=scenario.programs,
+        weeks=scenario.weeks,
+        milestones_per_program=scenario.milestones_per_program,
+        risks_per_program=scenario.risks_per_program,
+        escalation_rate=scenario.escalation_rate,
+        seed=scenario.seed,
+        as_of=scenario.as_of,
+    )
+    history = StatusHistory(frames.pop("status_transitions"))
+    frames["weekly_snapshots"] = weekly_snapshots(
+        frames["metrics"], history, frames["programs"]["id"].tolist()
+    )
+    return {"frames": frames, "status_history": history}
+
+
+def get_status_history() -> StatusHistory:
+    """Status transitions of the configured scenario."""
+    scenario = current_scenario()
+    if scenario.programs is not None:
+        return _memoized("synthetic", _synthetic, scenario)["status_history"]
+    return _memoized(
+        "status_history", lambda _: StatusHistory.from_transitions(_STATUS_HISTORY), scenario
+    )
+
+
+def get_frame(name: str) -> pd.DataFrame:
+    """Dataset ``name`` of the configured scenario as a schema-typed frame, built once.
+
+    Returns a copy, so callers may modify it without touching the cache.
+    """
+    scenario = current_scenario()
+    if scenario.programs is not None:
+        frame = _memoized("synthetic", _synthetic, scenario)["frames"][name]
+    else:
+        frame = _memoized(
+            ("frame", name), lambda _: frame_from_models(_GETTERS[name](), name), scenario
         )
-    return snapshots
+    return frame.copy()
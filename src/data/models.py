@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from src.utils.constants import (
     EscalationLevel,
     MilestoneStatus,
+    NodeLevel,
     ProgramStatus,
     RiskLikelihood,
     RiskSeverity,
@@ -27,6 +28,24 @@ class Program(BaseModel):
     budget_spent_millions: float = 0.0
 
 
+class PortfolioNode(BaseModel):
+    """One node of the portfolio -> program -> project hierarchy.
+
+    Budget and completion are the node's own values (normally set on leaf
+    projects only); ``PortfolioTree`` rolls them up. Every node under a
+    program carries that program's id in ``program_id``.
+    """
+
+    id: str
+    parent_id: str | None = None
+    name: str
+    level: NodeLevel
+    program_id: str | None = None
+    percent_complete: float | None = Field(default=None, ge=0, le=100)
+    budget_millions: float = 0.0
+    budget_spent_millions: float = 0.0
+
+
 class Milestone(BaseModel):
     id: str
     program_id: str
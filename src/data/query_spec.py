@@ -0,0 +1,85 @@
+"""Filter selections passed from page widgets down to the data backends.
+
+A :class:`QuerySpec` carries what the filter widgets selected. Each backend
+translates it into its own native filter:
+
+* mock data is served from its cached frames and filtered with :meth:`mask`;
+* Asana skips the task requests for projects outside the selection;
+* JIRA turns it into a JQL clause (see ``jira_client.build_jql``);
+* the local query store turns it into a SQL ``WHERE``.
+
+Whatever a backend cannot push down is applied afterwards with :meth:`mask`,
+so every backend returns the same rows.
+"""
+
+from dataclasses import dataclass, fields
+from datetime import date
+
+import pandas as pd
+
+from src.data.schema import SCHEMAS
+
+# Date column the spec's start/end window applies to, per dataset.
+WINDOW_COLUMNS = {
+    "milestones": "due_date",
+    "risks": "raised_date",
+    "escalations": "raised_date",
+    "metrics": "week_start",
+    "weekly_snapshots": "week_start",
+}
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """Selected values per filter; None means "no filter", an empty tuple matches nothing."""
+
+    program_ids: tuple[str, ...] | None = None
+    quarters: tuple[str, ...] | None = None
+    statuses: tuple[str, ...] | None = None
+    severities: tuple[str, ...] | None = None
+    start: date | None = None
+    end: date | None = None
+
+    def __post_init__(self):
+        # Accept lists straight from st.multiselect; tuples keep the spec hashable.
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, (list, set)):
+                object.__setattr__(self, f.name, tuple(value))
+
+    def where(self, name: str) -> dict[str, tuple]:
+        """Column -> allowed values for the filters that apply to dataset ``name``."""
+        columns = SCHEMAS[name]
+        candidates = {
+            "id" if name == "programs" else "program_id": self.program_ids,
+            "quarter": self.quarters,
+            "status": self.statuses,
+            "severity": self.severities,
+        }
+        return {
+            col: values
+            for col, values in candidates.items()
+            if values is not None and col in columns
+        }
+
+    def between(self, name: str) -> dict[str, tuple[date | None, date | None]]:
+        """Date column -> inclusive ``(start, end)`` window, if one applies to ``name``."""
+        column = WINDOW_COLUMNS.get(name)
+        if column is None or (self.start is None and self.end is None):
+            return {}
+        return {column: (self.start, self.end)}
+
+    def mask(self, df: pd.DataFrame, name: str) -> pd.Series:
+        """Boolean mask of the rows of ``df`` that match the spec."""
+        keep = pd.Series(True, index=df.index)
+        for col, values in self.where(name).items():
+            if col in df.columns:
+                keep &= df[col].isin(values)
+        for col, (start, end) in self.between(name).items():
+            if col in df.columns:
+                dates = pd.to_datetime(df[col])
+                if start is not None:
+                    keep &= dates >= pd.Timestamp(start)
+                if end is not None:
+                    keep &= dates <= pd.Timestamp(end)
+        return keep
@@ -0,0 +1,161 @@
+"""Embedded SQLite query store so pages fetch only the slice they filter on.
+
+Each dataset is loaded into its own table with indexes on the columns the
+page filters use (program_id, quarter, week_start, status, severity).
+Filter changes then become indexed lookups whose cost tracks the size of
+the result rather than the full history.
+
+Dates are stored as day numbers since the Unix epoch so range predicates
+compare integers; they are converted back to ``datetime64`` on read.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data.schema import DATE, SCHEMAS, apply_schema
+
+INDEXES = {
+    "programs": [("id",), ("status",)],
+    "milestones": [("program_id", "quarter"), ("quarter",), ("status",)],
+    "risks": [("program_id", "severity"), ("severity",)],
+    "escalations": [("program_id",)],
+    "metrics": [("program_id", "week_start"), ("week_start",)],
+    "weekly_snapshots": [("week_start",)],
+    "hierarchy": [("program_id",), ("parent_id",)],
+}
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def _date_columns(name: str) -> list[str]:
+    return [col for col, dtype in SCHEMAS[name].items() if dtype == DATE]
+
+
+def to_day_number(value: date | pd.Timestamp) -> int:
+    return int((np.datetime64(pd.Timestamp(value).date(), "D") - _EPOCH).astype(int))
+
+
+def encode_dates(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """Copy of ``df`` with date columns as float day numbers (NaN for NaT) for SQLite."""
+    out = df.copy()
+    for col in _date_columns(name):
+        if col in out.columns:
+            days = out[col].to_numpy(dtype="datetime64[D]")
+            out[col] = np.where(np.isnat(days), np.nan, (days - _EPOCH).astype(float))
+    return out
+
+
+def decode_dates(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """Inverse of :func:`encode_dates`, then cast to the dataset schema."""
+    for col in _date_columns(name):
+        if col in df.columns:
+            days = pd.to_numeric(df[col]).to_numpy(dtype=float)
+            values = np.full(len(days), np.datetime64("NaT"), dtype="datetime64[D]")
+            known = ~np.isnan(days)
+            values[known] = _EPOCH + days[known].astype("int64")
+            df[col] = values.astype(DATE)
+    return apply_schema(df, name)
+
+
+class QueryStore:
+    """SQLite-backed tables of the loader datasets with filter-friendly indexes."""
+
+    def __init__(self, path: Path | str = ":memory:"):
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _loaded (name TEXT PRIMARY KEY, loaded_at REAL)"
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the database, in memory or on disk."""
+        with self._lock:
+            pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        return pages * page_size
+
+    def is_fresh(self, name: str, max_age_seconds: float) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT loaded_at FROM _loaded WHERE name = ?", (name,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < max_age_seconds
+
+    def expire(self):
+        """Mark every table stale, so each is reloaded before its next query."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM _loaded")
+
+    def replace(self, name: str, df: pd.DataFrame):
+        """Replace a dataset's table with ``df`` and rebuild its indexes."""
+        # A source with no data (e.g. Asana metrics) still gets a table to query.
+        out = encode_dates(
+            df if len(df.columns) else pd.DataFrame(columns=list(SCHEMAS[name])), name
+        )
+        with self._lock, self._conn:
+            out.to_sql(name, self._conn, if_exists="replace", index=False)
+            for cols in INDEXES.get(name, []):
+                if all(c in out.columns for c in cols):
+                    self._conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS ix_{name}_{'_'.join(cols)} "
+                        f"ON {name} ({', '.join(cols)})"
+                    )
+            self._conn.execute("INSERT OR REPLACE INTO _loaded VALUES (?, ?)", (name, time.time()))
+
+    def select(
+        self,
+        name: str,
+        where: dict[str, Sequence] | None = None,
+        between: dict[str, tuple[date | None, date | None]] | None = None,
+    ) -> pd.DataFrame:
+        """Return the rows of ``name`` matching every filter, cast to the schema.
+
+        ``where`` maps a column to the allowed values (``col IN (...)``); an
+        empty sequence matches nothing. ``between`` maps a date column to an
+        inclusive ``(start, end)`` window where either bound may be None.
+        """
+        clauses, params = [], []
+        for col, values in (where or {}).items():
+            values = list(values)
+            if not values:
+                clauses.append("0")
+                continue
+            clauses.append(f"{col} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        for col, (start, end) in (between or {}).items():
+            if start is not None:
+                clauses.append(f"{col} >= ?")
+                params.append(to_day_number(start))
+            if end is not None:
+                clauses.append(f"{col} <= ?")
+                params.append(to_day_number(end))
+        sql = f"SELECT * FROM {name}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        return decode_dates(df, name)
+
+    def distinct(self, name: str, column: str) -> list:
+        """Return the distinct non-null values of a column."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT {column} FROM {name} WHERE {column} IS NOT NULL"
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
@@ -0,0 +1,139 @@
+"""Portfolio rollup over department x status x delivery quarter.
+
+Budget, spend, completion, open risk counts and latest-week DORA means are
+aggregated once per refresh for every combination of the three dimensions,
+including all subtotals (a dimension rolled up is labelled ``ALL``). The
+portfolio total, a department's status split or a quarter's departments
+are then index lookups rather than a groupby per chart.
+
+Only additive measures (sums and counts) are rolled up; averages and
+utilization are derived from them per row, so every subtotal is exact.
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+ROLLUP_DIMENSIONS = ("department", "status", "quarter")
+ALL = "All"
+
+DORA_MEASURES = ["deployment_frequency", "lead_time_days", "change_failure_rate", "mttr_hours"]
+
+_ADDITIVE = [
+    "programs",
+    "budget_millions",
+    "budget_spent_millions",
+    "completion_total",
+    "open_risks",
+    "dora_programs",
+    *(f"{m}_total" for m in DORA_MEASURES),
+]
+
+
+def _delivery_quarter(dates: pd.Series) -> pd.Series:
+    """``"Q3 2026"``-style label of each program's target end date."""
+    dates = pd.to_datetime(dates)
+    return "Q" + dates.dt.quarter.astype(str) + " " + dates.dt.year.astype(str)
+
+
+def _facts(programs: pd.DataFrame, risks: pd.DataFrame | None, dora: pd.DataFrame | None):
+    """One row per program: the rollup dimensions and its additive measures."""
+    facts = pd.DataFrame(
+        {
+            "department": programs["department"].astype(str).to_numpy(),
+            "status": programs["status"].astype(str).to_numpy(),
+            "quarter": _delivery_quarter(programs["target_end_date"]).to_numpy(),
+            "programs": 1,
+            "budget_millions": programs["budget_millions"].astype("float64").to_numpy(),
+            "budget_spent_millions": programs["budget_spent_millions"].astype("float64").to_numpy(),
+            "completion_total": programs["percent_complete"].astype("float64").to_numpy(),
+        },
+        index=programs["id"].astype(str).to_numpy(),
+    )
+    if risks is not None and not risks.empty:
+        open_risks = risks.loc[risks["is_open"].astype(bool), "program_id"].astype(str)
+        facts["open_risks"] = open_risks.value_counts().reindex(facts.index, fill_value=0)
+    else:
+        facts["open_risks"] = 0
+    dora = (dora if dora is not None else pd.DataFrame(columns=DORA_MEASURES)).reindex(facts.index)
+    facts["dora_programs"] = dora[DORA_MEASURES].notna().all(axis=1).astype(int)
+    for measure in DORA_MEASURES:
+        facts[f"{measure}_total"] = dora[measure].astype("float64").fillna(0.0)
+    return facts
+
+
+def _derive(table: pd.DataFrame) -> pd.DataFrame:
+    """Averages and utilization from the additive columns."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        programs = table["programs"].where(table["programs"] > 0)
+        table["avg_completion"] = table["completion_total"] / programs
+        budget = table["budget_millions"].where(table["budget_millions"] > 0)
+        table["utilization"] = table["budget_spent_millions"] / budget * 100
+        dora_programs = table["dora_programs"].where(table["dora_programs"] > 0)
+        for measure in DORA_MEASURES:
+            table[f"avg_{measure}"] = table[f"{measure}_total"] / dora_programs
+    return table
+
+
+class PortfolioRollup:
+    """Every subtotal of the program measures over department, status and quarter."""
+
+    def __init__(self, table: pd.DataFrame):
+        """``table`` is indexed by ``ROLLUP_DIMENSIONS``; use :meth:`from_frames` to build one."""
+        self.table = table
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.table.memory_usage(deep=True).sum())
+
+    @classmethod
+    def from_frames(
+        cls,
+        programs: pd.DataFrame,
+        risks: pd.DataFrame | None = None,
+        dora: pd.DataFrame | None = None,
+    ) -> "PortfolioRollup":
+        """Roll up ``programs`` with their open ``risks`` and per-program ``dora`` means.
+
+        ``dora`` is indexed by program id with one column per DORA measure,
+        e.g. ``MetricsCube.by_program`` for the latest week.
+        """
+        dims = list(ROLLUP_DIMENSIONS)
+        facts = _facts(programs, risks, dora)
+        base = facts.groupby(dims, sort=False)[_ADDITIVE].sum().reset_index()
+
+        levels = []
+        for size in range(len(dims), -1, -1):
+            for kept in combinations(dims, size):
+                if kept:
+                    level = base.groupby(list(kept), sort=False)[_ADDITIVE].sum().reset_index()
+                else:
+                    level = base[_ADDITIVE].sum().to_frame().T
+                for dim in dims:
+                    if dim not in kept:
+                        level[dim] = ALL
+                levels.append(level)
+        table = pd.concat(levels, ignore_index=True).set_index(dims).sort_index()
+        return cls(_derive(table.astype("float64")))
+
+    def total(self, department: str = ALL, status: str = ALL, quarter: str = ALL) -> pd.Series:
+        """Measures for one cell; dimensions left at ``ALL`` are rolled up."""
+        key = (department, status, quarter)
+        if key in self.table.index:
+            return self.table.loc[key]
+        empty = pd.Series(0.0, index=self.table.columns, name=key)
+        return _derive(empty.to_frame().T).iloc[0]
+
+    def breakdown(self, dimension: str, **fixed: str) -> pd.DataFrame:
+        """One row per value of ``dimension``; other dimensions default to ``ALL``."""
+        unknown = set(fixed) - set(ROLLUP_DIMENSIONS)
+        if dimension not in ROLLUP_DIMENSIONS or unknown:
+            raise ValueError(f"Unknown rollup dimension: {dimension if not unknown else unknown}")
+        others = [d for d in ROLLUP_DIMENSIONS if d != dimension]
+        key = tuple(fixed.get(d, ALL) for d in others)
+        try:
+            rows = self.table.xs(key, level=others)
+        except KeyError:
+            return self.table.iloc[:0].droplevel(others)
+        return rows.drop(index=ALL, errors="ignore")
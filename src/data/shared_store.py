@@ -0,0 +1,156 @@
+"""Host-level dataset store shared by every Streamlit replica on one machine.
+
+Datasets are written once as Arrow IPC files, so replicas on one host load a
+published dataset from local disk instead of each fetching it from the
+upstream source. A per-dataset lease file elects a single replica to refresh from the upstream
+source while the others keep serving the last published version.
+
+Layout under the store root::
+
+    manifest.json               # {dataset: {"version": n, "written_at": ts}}
+    <dataset>/v000001.arrow     # immutable, published via the manifest
+    <dataset>.lease             # {"holder": "...", "expires": ts}
+"""
+
+from contextlib import contextmanager
+import fcntl
+import json
+import os
+from pathlib import Path
+import socket
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+_MANIFEST = "manifest.json"
+_LOCK = ".lock"
+
+
+def holder_id() -> str:
+    """Identify this process as a lease holder, e.g. 'web-1:4242'."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SharedStore:
+    """Versioned Arrow datasets on local disk with lease-based refresh election."""
+
+    def __init__(self, root: Path | str, lease_seconds: float = 120.0):
+        self.root = Path(root)
+        self.lease_seconds = lease_seconds
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # -- locking / manifest -------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        """Hold the store-wide lock while reading or mutating shared metadata."""
+        with open(self.root / _LOCK, "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _read_json(self, path: Path) -> dict:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_json(self, path: Path, data: dict):
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def manifest(self) -> dict:
+        """Return the published version info for every dataset."""
+        return self._read_json(self.root / _MANIFEST)
+
+    def _version_path(self, name: str, version: int) -> Path:
+        return self.root / name / f"v{version:06d}.arrow"
+
+    # -- datasets -----------------------------------------------------------
+
+    def age(self, name: str) -> float | None:
+        """Seconds since the dataset was last published, or None if never."""
+        entry = self.manifest().get(name)
+        if not entry:
+            return None
+        return time.time() - entry["written_at"]
+
+    def is_fresh(self, name: str, max_age_seconds: float) -> bool:
+        age = self.age(name)
+        return age is not None and age < max_age_seconds
+
+    def read(self, name: str) -> pd.DataFrame | None:
+        """The published version of a dataset as a new frame. Returns None if absent.
+
+        The file is memory-mapped, but the conversion to pandas copies it.
+        """
+        entry = self.manifest().get(name)
+        if not entry:
+            return None
+        path = self._version_path(name, entry["version"])
+        try:
+            source = pa.memory_map(str(path), "r")
+        except FileNotFoundError:
+            return None
+        table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True)
+
+    def write(self, name: str, df: pd.DataFrame) -> int:
+        """Publish a new version of a dataset and return its version number.
+
+        The file is fully written before the manifest points at it, so readers
+        never observe a partial dataset. Older versions stay on disk until
+        pruned; replicas that already mapped them keep reading valid bytes.
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        (self.root / name).mkdir(exist_ok=True)
+        with self._locked():
+            manifest = self.manifest()
+            version = manifest.get(name, {}).get("version", 0) + 1
+            path = self._version_path(name, version)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with pa.OSFile(str(tmp), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp, path)
+            manifest[name] = {"version": version, "written_at": time.time()}
+            self._write_json(self.root / _MANIFEST, manifest)
+        return version
+
+    def prune(self, name: str, keep: int):
+        """Delete all but the newest ``keep`` versions of a dataset."""
+        versions = sorted((self.root / name).glob("v*.arrow"))
+        for path in versions[: max(0, len(versions) - keep)]:
+            path.unlink(missing_ok=True)
+
+    # -- refresh lease ------------------------------------------------------
+
+    def acquire_lease(self, name: str, holder: str | None = None) -> bool:
+        """Try to become the refresher for a dataset.
+
+        Succeeds when no lease exists, the current lease has expired, or this
+        holder already owns it (which renews it).
+        """
+        holder = holder or holder_id()
+        path = self.root / f"{name}.lease"
+        with self._locked():
+            lease = self._read_json(path)
+            now = time.time()
+            if lease and lease.get("holder") != holder and lease.get("expires", 0) > now:
+                return False
+            self._write_json(path, {"holder": holder, "expires": now + self.lease_seconds})
+        return True
+
+    def release_lease(self, name: str, holder: str | None = None):
+        """Give up the refresh lease if this holder owns it."""
+        holder = holder or holder_id()
+        path = self.root / f"{name}.lease"
+        with self._locked():
+            if self._read_json(path).get("holder") == holder:
+                path.unlink(missing_ok=True)
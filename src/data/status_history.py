@@ -0,0 +1,155 @@
+"""Program status over time, stored as sorted transition arrays.
+
+Every source reports status changes differently: the mock has a fixed
+transition table, Asana has project status updates, JIRA has issue
+changelogs, and the snapshot history has versioned rows. Each is turned into
+one frame of ``(program_id, changed_at, status)`` transitions and loaded into
+a :class:`StatusHistory`. A schedule-based history is derived from the
+programs themselves instead (:meth:`StatusHistory.from_schedule`).
+
+Transitions are kept sorted by ``(program, date)`` in flat NumPy arrays, so
+the status of every program on every requested date is found with a single
+vectorized ``searchsorted`` rather than a scan per program and date.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.utils.constants import ProgramStatus
+from src.utils.helpers import rag_status_codes, schedule_percent
+
+TRANSITION_COLUMNS = ["program_id", "changed_at", "status"]
+
+
+def _days(values) -> np.ndarray:
+    return np.asarray(pd.to_datetime(values), dtype="datetime64[D]").astype(np.int64)
+
+
+class StatusHistory:
+    """Sorted status transitions for a set of programs."""
+
+    def __init__(self, transitions: pd.DataFrame, default: str = ProgramStatus.ON_TRACK.value):
+        """``transitions`` has one row per status change (see ``TRANSITION_COLUMNS``).
+
+        Programs are reported as ``default`` before their first transition.
+        """
+        self.default = default
+        self.program_ids = sorted(transitions["program_id"].astype(str).unique())
+        self.statuses = [s.value for s in ProgramStatus]
+        self._program_index = {pid: i for i, pid in enumerate(self.program_ids)}
+
+        programs = transitions["program_id"].astype(str).map(self._program_index).to_numpy()
+        days = _days(transitions["changed_at"])
+        order = np.lexsort((days, programs))
+        self._programs = programs[order].astype(np.int64)
+        self._days = days[order]
+        self._codes = pd.Categorical(transitions["status"], categories=self.statuses).codes[order]
+        # Programs and days combined into one sortable key per transition.
+        self._span = int(self._days.max() - self._days.min() + 2) if len(days) else 1
+        self._origin = int(self._days.min()) - 1 if len(days) else 0
+        self._keys = self._programs * self._span + (self._days - self._origin)
+
+    @classmethod
+    def from_transitions(
+        cls, transitions: dict[str, list[tuple[date, ProgramStatus | str]]], **kwargs
+    ) -> "StatusHistory":
+        """Build from ``{program_id: [(date, status), ...]}``, as in the mock data."""
+        rows = [
+            (pid, changed_at, getattr(status, "value", status))
+            for pid, changes in transitions.items()
+            for changed_at, status in changes
+        ]
+        return cls(pd.DataFrame(rows, columns=TRANSITION_COLUMNS), **kwargs)
+
+    @classmethod
+    def from_versions(cls, versions: pd.DataFrame, **kwargs) -> "StatusHistory":
+        """Build from ``SnapshotHistory.versions("programs")``."""
+        frame = versions.rename(columns={"id": "program_id", "valid_from": "changed_at"})
+        return cls(frame[TRANSITION_COLUMNS], **kwargs)
+
+    @classmethod
+    def from_schedule(cls, programs: pd.DataFrame, dates: Sequence, **kwargs) -> "StatusHistory":
+        """Build by rating ``programs`` against their schedules on each of ``dates``.
+
+        ``programs`` is a programs frame or ``SnapshotHistory.versions("programs")``;
+        a row with ``valid_from``/``valid_to`` only applies on the dates it was
+        current (``NaT`` leaves that end open), any other row on every date.
+        Every program is classified on every date in one pass (see
+        ``helpers.rag_status_codes``) and a transition is kept wherever a
+        program's status changes.
+        """
+        days = np.unique(_days(dates)).astype("datetime64[D]")
+        grid = days[:, None]
+        target = schedule_percent(
+            programs["start_date"].to_numpy()[None, :],
+            programs["target_end_date"].to_numpy()[None, :],
+            grid,
+        )
+        codes = rag_status_codes(programs["percent_complete"].to_numpy()[None, :], target)
+        alive = np.ones(codes.shape, dtype=bool)
+        if "valid_from" in programs.columns:
+            valid_from = programs["valid_from"].to_numpy("datetime64[D]")[None, :]
+            valid_to = programs["valid_to"].to_numpy("datetime64[D]")[None, :]
+            alive = (np.isnat(valid_from) | (valid_from <= grid)) & (
+                np.isnat(valid_to) | (grid < valid_to)
+            )
+
+        program_codes, program_ids = pd.factorize(programs["id"].astype(str))
+        day_pos, row_pos = np.nonzero(alive)
+        order = np.lexsort((day_pos, program_codes[row_pos]))
+        day_pos, row_pos = day_pos[order], row_pos[order]
+        program_pos, row_codes = program_codes[row_pos], codes[day_pos, row_pos]
+        changed = np.ones(len(row_pos), dtype=bool)
+        changed[1:] = (program_pos[1:] != program_pos[:-1]) | (row_codes[1:] != row_codes[:-1])
+        statuses = np.array([s.value for s in ProgramStatus], dtype=object)
+        transitions = pd.DataFrame(
+            {
+                "program_id": np.asarray(program_ids, dtype=object)[program_pos[changed]],
+                "changed_at": days[day_pos[changed]],
+                "status": statuses[row_codes[changed]],
+            },
+            columns=TRANSITION_COLUMNS,
+        )
+        return cls(transitions, **kwargs)
+
+    def _code_grid(self, query_days: np.ndarray, programs: np.ndarray) -> np.ndarray:
+        """Status codes (index into ``labels``) for each query day x program."""
+        default = len(self.statuses)
+        # Clip query days into the key range so keys never spill into the next program.
+        offsets = np.clip(query_days - self._origin, 0, self._span - 1)
+        keys = programs[None, :] * self._span + offsets[:, None]
+        if not len(self._keys):
+            return np.full(keys.shape, default)
+        pos = np.maximum(np.searchsorted(self._keys, keys, side="right") - 1, 0)
+        found = (programs[None, :] >= 0) & (self._programs[pos] == programs[None, :])
+        found &= (self._keys[pos] <= keys) & (self._codes[pos] >= 0)
+        return np.where(found, self._codes[pos], default)
+
+    def _resolve(self, program_ids: Sequence[str] | None) -> tuple[list[str], np.ndarray]:
+        program_ids = list(self.program_ids if program_ids is None else program_ids)
+        return program_ids, np.array([self._program_index.get(p, -1) for p in program_ids])
+
+    def status_grid(
+        self, dates: Sequence, program_ids: Sequence[str] | None = None
+    ) -> pd.DataFrame:
+        """Status of each program (columns) on each date (rows)."""
+        program_ids, programs = self._resolve(program_ids)
+        codes = self._code_grid(_days(dates), programs)
+        labels = np.array([*self.statuses, self.default], dtype=object)
+        return pd.DataFrame(labels[codes], index=pd.to_datetime(dates), columns=program_ids)
+
+    def counts(self, dates: Sequence, program_ids: Sequence[str] | None = None) -> pd.DataFrame:
+        """Number of programs in each status on each date."""
+        program_ids, programs = self._resolve(program_ids)
+        codes = self._code_grid(_days(dates), programs)
+        default = self.statuses.index(self.default) if self.default in self.statuses else -1
+        codes = np.where(codes == len(self.statuses), default, codes)
+        width = len(self.statuses)
+        flat = (np.arange(len(codes))[:, None] * width + codes)[codes >= 0]
+        counts = np.bincount(flat, minlength=len(codes) * width).reshape(len(codes), width)
+        return pd.DataFrame(
+            counts.astype(np.int32), index=pd.to_datetime(dates), columns=self.statuses
+        )
@@ -0,0 +1,531 @@
+"""Vectorized synthetic portfolio generator for load testing.
+
+Produces the same datasets as :mod:`src.data.mock_data`, at any scale, as
+schema-typed columnar frames built with NumPy rather than model objects.
+The mock's correlation structure is kept:
+
+* each status has a metric profile, so on-track programs trend up, at-risk
+  programs stay flat and off-track programs degrade, with noise widening
+  as health worsens;
+* change failure rate and lead time move against the velocity trend;
+* troubled programs overspend, carry more risks, more severe and more
+  likely ones, and more of them escalate;
+* milestones due before the end of the history are mostly completed on
+  healthy programs and mostly delayed or blocked on troubled ones.
+
+Usage::
+
+    frames = generate_portfolio(programs=10_000, weeks=104)
+    frames["metrics"]            # 1,040,000 rows
+    StatusHistory(frames["status_transitions"])
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.data.schema import METRIC_SCHEMA, apply_schema, enum_dtype
+from src.data.status_history import TRANSITION_COLUMNS
+from src.utils.constants import (
+    DEPARTMENTS,
+    EscalationLevel,
+    MilestoneStatus,
+    NodeLevel,
+    ProgramStatus,
+    RiskLikelihood,
+    RiskSeverity,
+)
+
+# Share of programs in each status (the mock's six are 3/1/1/1), in enum
+# order so a status's index here is also its category code.
+STATUS_MIX = {
+    ProgramStatus.ON_TRACK: 0.5,
+    ProgramStatus.AT_RISK: 0.2,
+    ProgramStatus.OFF_TRACK: 0.1,
+    ProgramStatus.COMPLETED: 0.2,
+}
+
+# Metric and delivery profiles per status, generalized from the mock's
+# per-program ``_METRIC_PROFILES``. Ranges are sampled once per program.
+_PROFILES = {
+    ProgramStatus.ON_TRACK: {
+        "velocity_base": (30, 50),
+        "defect_base": 3,
+        "deploy_freq": 5.0,
+        "lead_time": 2.0,
+        "cfr_base": 7.0,
+        "trend_slope": 0.008,
+        "noise": 0.15,
+        "percent_complete": (40, 95),
+        "spend_ratio": (0.95, 1.05),
+        "risk_rate": 0.8,
+        "milestone_completion": 0.95,
+        "severity": (0.30, 0.45, 0.20, 0.05),
+        "likelihood": (0.35, 0.45, 0.20),
+    },
+    ProgramStatus.AT_RISK: {
+        "velocity_base": (20, 30),
+        "defect_base": 5,
+        "deploy_freq": 2.0,
+        "lead_time": 5.0,
+        "cfr_base": 14.0,
+        "trend_slope": -0.002,
+        "noise": 0.25,
+        "percent_complete": (25, 70),
+        "spend_ratio": (1.2, 1.6),
+        "risk_rate": 1.5,
+        "milestone_completion": 0.7,
+        "severity": (0.10, 0.30, 0.40, 0.20),
+        "likelihood": (0.15, 0.45, 0.40),
+    },
+    ProgramStatus.OFF_TRACK: {
+        "velocity_base": (15, 22),
+        "defect_base": 4,
+        "deploy_freq": 1.5,
+        "lead_time": 7.0,
+        "cfr_base": 18.0,
+        "trend_slope": -0.008,
+        "noise": 0.30,
+        "percent_complete": (10, 50),
+        "spend_ratio": (1.8, 2.6),
+        "risk_rate": 2.0,
+        "milestone_completion": 0.5,
+        "severity": (0.05, 0.20, 0.40, 0.35),
+        "likelihood": (0.10, 0.35, 0.55),
+    },
+    ProgramStatus.COMPLETED: {
+        "velocity_base": (35, 45),
+        "defect_base": 1,
+        "deploy_freq": 6.0,
+        "lead_time": 1.5,
+        "cfr_base": 4.0,
+        "trend_slope": 0.0,
+        "noise": 0.10,
+        "percent_complete": (100, 100),
+        "spend_ratio": (0.85, 0.98),
+        "risk_rate": 0.5,
+        "milestone_completion": 1.0,
+        "severity": (0.40, 0.40, 0.15, 0.05),
+        "likelihood": (0.50, 0.35, 0.15),
+    },
+}
+
+# Each program is delivered by projects taking these shares of its budget.
+PROJECT_SHARES = (0.5, 0.3, 0.2)
+
+_OWNERS = np.array(["Priya", "James", "Maria", "Alex", "David", "Sarah", "Li", "Kumar"], object)
+_MILESTONE_NAMES = np.array(
+    [
+        "Architecture design",
+        "Proof of concept",
+        "Dev environment rollout",
+        "Staging rollout",
+        "Production rollout",
+        "Data migration",
+        "Security review",
+        "Legacy decommission",
+    ],
+    object,
+)
+_RISK_TITLES = np.array(
+    [
+        "Vendor delivery delay",
+        "Budget overrun",
+        "Key skill gap",
+        "Integration incompatibility",
+        "Capacity shortfall",
+        "Regulatory change",
+    ],
+    object,
+)
+
+
+def _profile(codes: np.ndarray, field: str) -> np.ndarray:
+    """Per-program values of a profile field, looked up by status code."""
+    table = np.array([_PROFILES[status][field] for status in STATUS_MIX], dtype="float64")
+    return table[codes]
+
+
+def _uniform_range(rng: np.random.Generator, bounds: np.ndarray) -> np.ndarray:
+    """One draw per row from the row's ``(low, high)`` bounds."""
+    return bounds[:, 0] + rng.random(len(bounds)) * (bounds[:, 1] - bounds[:, 0])
+
+
+def _choose_rows(rng: np.random.Generator, weights: np.ndarray) -> np.ndarray:
+    """One category index per row, drawn from that row's probability weights."""
+    cumulative = np.cumsum(weights, axis=1)
+    draws = rng.random(len(weights))[:, None] * cumulative[:, -1:]
+    return (draws >= cumulative).sum(axis=1)
+
+
+def _categorical(codes: np.ndarray, enum_cls) -> pd.Categorical:
+    """Enum column straight from category codes, in the enum's declaration order."""
+    return pd.Categorical.from_codes(codes, dtype=enum_dtype(enum_cls))
+
+
+def _ids(prefix: str, count: int) -> np.ndarray:
+    width = max(3, len(str(count)))
+    return np.char.mod(f"{prefix}-%0{width}d", np.arange(1, count + 1)).astype(object)
+
+
+def _days(start: date, offsets: np.ndarray) -> np.ndarray:
+    return np.datetime64(start, "D") + offsets.astype("timedelta64[D]")
+
+
+def _quarters(days: np.ndarray) -> pd.Categorical:
+    """``"Q<n> <year>"`` labels for an array of ``datetime64[D]`` dates."""
+    months = days.astype("datetime64[M]").astype(np.int64)
+    keys = months // 3  # quarters since 1970
+    uniques, codes = np.unique(keys, return_inverse=True)
+    labels = [f"Q{k % 4 + 1} {1970 + k // 4}" for k in uniques]
+    return pd.Categorical.from_codes(codes, labels)
+
+
+# ---------------------------------------------------------------------------
+# Datasets
+# ---------------------------------------------------------------------------
+
+
+def _programs(rng: np.random.Generator, count: int, as_of: date) -> tuple[pd.DataFrame, dict]:
+    status = rng.choice(len(STATUS_MIX), count, p=list(STATUS_MIX.values()))
+    completed = status == list(STATUS_MIX).index(ProgramStatus.COMPLETED)
+    # Completed programs ended before ``as_of``; the others are part-way through.
+    duration = rng.integers(270, 600, count)
+    elapsed = (duration * rng.uniform(0.1, 0.9, count)).astype(np.int64)
+    start = np.where(
+        completed,
+        _days(as_of, -rng.integers(7, 120, count) - duration),
+        _days(as_of, -elapsed),
+    )
+    target_end = start + duration.astype("timedelta64[D]")
+
+    percent = np.round(_uniform_range(rng, _profile(status, "percent_complete")))
+    budget = np.round(rng.uniform(0.5, 5.0, count), 1)
+    spend = _uniform_range(rng, _profile(status, "spend_ratio"))
+    spent = np.round(np.minimum(budget * np.maximum(percent, 5) / 100 * spend, budget * 1.5), 1)
+
+    ids = _ids("PRG", count)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "name": np.char.mod("Program %d", np.arange(1, count + 1)).astype(object),
+            "department": pd.Categorical.from_codes(
+                rng.integers(0, len(DEPARTMENTS), count), DEPARTMENTS
+            ),
+            "status": _categorical(status, ProgramStatus),
+            "percent_complete": percent,
+            "start_date": start,
+            "target_end_date": target_end,
+            "owner": _OWNERS[rng.integers(0, len(_OWNERS), count)],
+            "description": "",
+            "budget_millions": budget,
+            "budget_spent_millions": spent,
+        }
+    )
+    return apply_schema(df, "programs"), {"status": status, "start": start, "end": target_end}
+
+
+def _metrics(
+    rng: np.random.Generator, ids: np.ndarray, status: np.ndarray, weeks: int, start: date
+) -> pd.DataFrame:
+    count = len(ids)
+    shape = (count, weeks)
+    jitter = rng.uniform(0.8, 1.2, (5, count))
+    velocity_base = _uniform_range(rng, _profile(status, "velocity_base"))[:, None]
+    defect_base = (_profile(status, "defect_base") * jitter[0])[:, None]
+    deploy_base = (_profile(status, "deploy_freq") * jitter[1])[:, None]
+    lead_base = (_profile(status, "lead_time") * jitter[2])[:, None]
+    cfr_base = (_profile(status, "cfr_base") * jitter[3])[:, None]
+    spread = _profile(status, "noise")[:, None]
+
+    noise = 1 + spread * rng.uniform(-1, 1, shape)
+    trend = 1 + np.arange(weeks)[None, :] * _profile(status, "trend_slope")[:, None]
+
+    velocity = np.maximum(0, np.round(velocity_base * noise * trend, 1))
+    defects = np.maximum(0, (defect_base * noise).astype(np.int64) + rng.integers(-2, 3, shape))
+    incidents = rng.integers(0, np.maximum(1, defects // 2), endpoint=True)
+    columns = {
+        "velocity": velocity,
+        "planned_points": np.round(velocity * rng.uniform(0.9, 1.15, shape), 1),
+        "delivered_points": np.round(velocity * rng.uniform(0.85, 1.05, shape), 1),
+        "defect_count": defects,
+        "incident_count": incidents,
+        "mttr_hours": np.round(rng.uniform(0.5, 4.0, shape), 1),
+        "deployment_frequency": np.maximum(0, np.round(deploy_base * noise * trend, 1)),
+        "lead_time_days": np.maximum(
+            0.1, np.round(lead_base * rng.uniform(0.7, 1.3, shape) * (2 - trend), 1)
+        ),
+        # CFR correlated with trend: worse programs have higher CFR
+        "change_failure_rate": np.round(np.clip(cfr_base * noise * (2 - trend), 1, 50), 1),
+    }
+    df = pd.DataFrame(
+        {
+            "program_id": pd.Categorical.from_codes(np.repeat(np.arange(count), weeks), ids),
+            "week_start": np.tile(_days(start, np.arange(weeks) * 7), count),
+            **{
+                name: values.ravel().astype(METRIC_SCHEMA[name], copy=False)
+                for name, values in columns.items()
+            },
+        }
+    )
+    return apply_schema(df, "metrics")
+
+
+def _milestones(
+    rng: np.random.Generator, ids: np.ndarray, programs: dict, density: float, as_of: date
+) -> pd.DataFrame:
+    counts = np.maximum(1, rng.poisson(density, len(ids)))
+    owner = np.repeat(np.arange(len(ids)), counts)
+    total = len(owner)
+    start = programs["start"][owner].astype(np.int64)
+    end = programs["end"][owner].astype(np.int64)
+    due = (start + rng.random(total) * (end - start)).astype("datetime64[D]")
+
+    today = np.datetime64(as_of, "D")
+    past = due < today
+    done = past & (rng.random(total) < _profile(programs["status"], "milestone_completion")[owner])
+    codes = {s: i for i, s in enumerate(MilestoneStatus)}
+    status = np.where(
+        due < today + np.timedelta64(90, "D"),
+        codes[MilestoneStatus.IN_PROGRESS],
+        codes[MilestoneStatus.NOT_STARTED],
+    )
+    slipped = past & ~done
+    status[slipped] = np.where(
+        rng.random(slipped.sum()) < 0.7,
+        codes[MilestoneStatus.DELAYED],
+        codes[MilestoneStatus.BLOCKED],
+    )
+    status[done] = codes[MilestoneStatus.COMPLETED]
+    completed = due - rng.integers(-5, 11, total).astype("timedelta64[D]")
+
+    df = pd.DataFrame(
+        {
+            "id": _ids("MS", total),
+            "program_id": pd.Categorical.from_codes(owner, ids),
+            "name": _MILESTONE_NAMES[rng.integers(0, len(_MILESTONE_NAMES), total)],
+            "status": _categorical(status, MilestoneStatus),
+            "due_date": due,
+            "completed_date": np.where(done, completed, np.datetime64("NaT")),
+            "quarter": _quarters(due),
+            "owner": _OWNERS[rng.integers(0, len(_OWNERS), total)],
+            "is_key_milestone": rng.random(total) < 0.6,
+        }
+    )
+    return apply_schema(df, "milestones")
+
+
+def _risks(
+    rng: np.random.Generator, ids: np.ndarray, programs: dict, density: float, as_of: date
+) -> pd.DataFrame:
+    status = programs["status"]
+    counts = rng.poisson(density * _profile(status, "risk_rate"))
+    owner = np.repeat(np.arange(len(ids)), counts)
+    total = len(owner)
+    severity = _choose_rows(rng, _profile(status, "severity")[owner])
+    likelihood = _choose_rows(rng, _profile(status, "likelihood")[owner])
+
+    start = programs["start"][owner].astype(np.int64)
+    last = np.minimum(programs["end"][owner], np.datetime64(as_of, "D")).astype(np.int64)
+    raised = (start + rng.random(total) * np.maximum(last - start, 1)).astype("datetime64[D]")
+    closed_share = np.where(status == list(STATUS_MIX).index(ProgramStatus.COMPLETED), 0.9, 0.25)
+    title = _RISK_TITLES[rng.integers(0, len(_RISK_TITLES), total)]
+
+    df = pd.DataFrame(
+        {
+            "id": _ids("RSK", total),
+            "program_id": pd.Categorical.from_codes(owner, ids),
+            "title": title,
+            "description": "",
+            "severity": _categorical(severity, RiskSeverity),
+            "likelihood": _categorical(likelihood, RiskLikelihood),
+            "mitigation": "Mitigation plan documented in confluence.",
+            "owner": _OWNERS[rng.integers(0, len(_OWNERS), total)],
+            "raised_date": raised,
+            "is_open": rng.random(total) >= closed_share[owner],
+        }
+    )
+    return apply_schema(df, "risks")
+
+
+def _escalations(
+    rng: np.random.Generator, risks: pd.DataFrame, rate: float, as_of: date
+) -> pd.DataFrame:
+    """Escalate a share of open high and critical risks; critical ones go higher."""
+    severity = risks["severity"].cat.codes.to_numpy()
+    high = list(RiskSeverity).index(RiskSeverity.HIGH)
+    picked = np.flatnonzero(
+        risks["is_open"].to_numpy() & (severity >= high) & (rng.random(len(risks)) < rate)
+    )
+    total = len(picked)
+    critical = severity[picked] > high
+    level = np.where(critical, 2, 1) + rng.integers(0, 2, total)  # Director..C-Suite
+
+    raised = risks["raised_date"].to_numpy()[picked].astype("datetime64[D]")
+    raised = np.minimum(
+        raised + rng.integers(7, 61, total).astype("timedelta64[D]"), np.datetime64(as_of, "D")
+    )
+    resolved_on = raised + rng.integers(5, 46, total).astype("timedelta64[D]")
+    resolved = (rng.random(total) < 0.4) & (resolved_on <= np.datetime64(as_of, "D"))
+
+    df = pd.DataFrame(
+        {
+            "id": _ids("ESC", total),
+            "program_id": risks["program_id"].to_numpy()[picked],
+            "risk_id": risks["id"].to_numpy()[picked],
+            "title": risks["title"].to_numpy()[picked],
+            "level": _categorical(np.minimum(level, len(EscalationLevel) - 1), EscalationLevel),
+            "raised_date": raised,
+            "resolved_date": np.where(resolved, resolved_on, np.datetime64("NaT")),
+            "resolution": np.where(resolved, "Resolved with revised plan.", "").astype(object),
+        }
+    )
+    return apply_schema(df, "escalations")
+
+
+def _status_transitions(
+    rng: np.random.Generator, ids: np.ndarray, programs: dict, as_of: date
+) -> pd.DataFrame:
+    """Every program starts on track; troubled ones slip part-way, completed ones finish."""
+    status = programs["status"]
+    start = programs["start"]
+    code = {s: i for i, s in enumerate(STATUS_MIX)}
+    elapsed = (np.minimum(programs["end"], np.datetime64(as_of, "D")) - start).astype(np.int64)
+
+    def at(fraction: np.ndarray) -> np.ndarray:
+        return start + (elapsed * fraction).astype("timedelta64[D]")
+
+    slip = rng.uniform(0.3, 0.6, len(ids))
+    parts = [(np.arange(len(ids)), start, code[ProgramStatus.ON_TRACK])]
+    troubled = np.flatnonzero(
+        (status == code[ProgramStatus.AT_RISK]) | (status == code[ProgramStatus.OFF_TRACK])
+    )
+    parts.append((troubled, at(slip)[troubled], code[ProgramStatus.AT_RISK]))
+    off = np.flatnonzero(status == code[ProgramStatus.OFF_TRACK])
+    parts.append(
+        (off, at(slip + rng.uniform(0.1, 0.3, len(ids)))[off], code[ProgramStatus.OFF_TRACK])
+    )
+    done = np.flatnonzero(status == code[ProgramStatus.COMPLETED])
+    parts.append((done, programs["end"][done], code[ProgramStatus.COMPLETED]))
+
+    rows = np.concatenate([p[0] for p in parts])
+    labels = [s.value for s in STATUS_MIX]
+    return pd.DataFrame(
+        {
+            "program_id": ids[rows],
+            "changed_at": np.concatenate([p[1] for p in parts]).astype("datetime64[ns]"),
+            "status": np.array(labels, object)[
+                np.concatenate([np.full(len(p[0]), p[2]) for p in parts])
+            ],
+        },
+        columns=TRANSITION_COLUMNS,
+    )
+
+
+def project_nodes(programs: pd.DataFrame) -> pd.DataFrame:
+    """Leaf project nodes under each program, in program order.
+
+    Budget and spend are split by ``PROJECT_SHARES``. Completion is spread
+    evenly around the program's, within 0-100, so the projects average back
+    to it and the program rolls up to its own figures.
+    """
+    count = len(PROJECT_SHARES)
+    rows = np.repeat(np.arange(len(programs)), count)
+    number = np.tile(np.arange(1, count + 1), len(programs))
+    shares = np.tile(PROJECT_SHARES, len(programs))
+    percent = programs["percent_complete"].to_numpy("float64")[rows]
+    spread = np.minimum(np.minimum(percent, 100 - percent), 10.0)
+    offsets = np.tile(np.linspace(-1, 1, count), len(programs))
+    program_ids = programs["id"].astype(str).to_numpy(dtype=object)[rows]
+    names = programs["name"].astype(str).to_numpy(dtype=object)[rows]
+    return pd.DataFrame(
+        {
+            "id": program_ids + "-PRJ-" + number.astype(str).astype(object),
+            "parent_id": program_ids,
+            "name": names + " - Project " + number.astype(str).astype(object),
+            "level": NodeLevel.PROJECT.value,
+            "program_id": program_ids,
+            "percent_complete": percent + spread * offsets,
+            "budget_millions": programs["budget_millions"].to_numpy("float64")[rows] * shares,
+            "budget_spent_millions": (
+                programs["budget_spent_millions"].to_numpy("float64")[rows] * shares
+            ),
+        }
+    )
+
+
+def _hierarchy(programs: pd.DataFrame) -> pd.DataFrame:
+    """One portfolio of programs, each split into ``PROJECT_SHARES`` projects.
+
+    Nodes are ordered depth-first, so each program is followed by its projects.
+    """
+    root = pd.DataFrame(
+        {"id": ["PORTFOLIO"], "parent_id": [None], "name": ["Delivery Portfolio"]}
+    ).assign(level=NodeLevel.PORTFOLIO.value, program_id=None)
+    program_nodes = pd.DataFrame(
+        {
+            "id": programs["id"],
+            "parent_id": "PORTFOLIO",
+            "name": programs["name"],
+            "level": NodeLevel.PROGRAM.value,
+            "program_id": programs["id"],
+        }
+    )
+    count = len(PROJECT_SHARES)
+    program_pos = np.concatenate(
+        [np.arange(len(programs)), np.repeat(np.arange(len(programs)), count)]
+    )
+    rank = np.concatenate(
+        [np.zeros(len(programs)), np.tile(np.arange(1, count + 1), len(programs))]
+    )
+    nodes = pd.concat([program_nodes, project_nodes(programs)], ignore_index=True)
+    nodes = nodes.iloc[np.lexsort((rank, program_pos))]
+    df = pd.concat([root, nodes], ignore_index=True)
+    return apply_schema(
+        df.fillna({"budget_millions": 0.0, "budget_spent_millions": 0.0}), "hierarchy"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def generate_portfolio(
+    programs: int = 10_000,
+    weeks: int = 34,
+    milestones_per_program: float = 7.0,
+    risks_per_program: float = 2.5,
+    escalation_rate: float = 0.15,
+    seed: int = 42,
+    as_of: date | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Generate a synthetic portfolio as schema-typed frames.
+
+    The history ends on ``as_of`` (default today): ``programs`` programs
+    each get ``weeks`` weekly metric rows, the last one for the week before
+    ``as_of``'s. Milestones and risks are Poisson-distributed around the
+    given per-program densities (risks scaled by status), and
+    ``escalation_rate`` of the open high and critical risks are escalated.
+
+    Returns one frame per dataset name (``programs``, ``milestones``,
+    ``risks``, ``escalations``, ``metrics``, ``hierarchy``) plus
+    ``status_transitions`` for a :class:`~src.data.status_history.StatusHistory`.
+    The same arguments always produce the same frames.
+    """
+    rng = np.random.default_rng(seed)
+    as_of = as_of or date.today()
+    start = as_of - timedelta(days=as_of.weekday(), weeks=weeks)
+    program_frame, attrs = _programs(rng, programs, as_of)
+    ids = program_frame["id"].to_numpy()
+    risks = _risks(rng, ids, attrs, risks_per_program, as_of)
+    return {
+        "programs": program_frame,
+        "milestones": _milestones(rng, ids, attrs, milestones_per_program, as_of),
+        "risks": risks,
+        "escalations": _escalations(rng, risks, escalation_rate, as_of),
+        "metrics": _metrics(rng, ids, attrs["status"], weeks, start),
+        "hierarchy": _hierarchy(program_frame),
+        "status_transitions": _status_transitions(rng, ids, attrs, as_of),
+    }
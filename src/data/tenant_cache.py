@@ -0,0 +1,148 @@
+"""In-process cache of loaded datasets, namespaced by tenant.
+
+One deployment can serve several business units (tenants), each with its
+own source settings. Every cached frame, cube and store is kept under its
+tenant's key, so tenants never see each other's data and one tenant's refresh
+leaves the others untouched.
+
+Memory is bounded twice: each tenant has a byte budget within which its
+least recently used entries are evicted first, and the cache as a whole has
+a budget enforced by evicting the coldest tenants entirely.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import logging
+import sys
+import threading
+import time
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def sizeof(value) -> int:
+    """Approximate bytes held by a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry:
+    value: object
+    nbytes: int
+    loaded_at: float
+    version: Hashable = None
+
+
+class TenantCache:
+    """Per-tenant LRU cache with a per-tenant and a total memory budget."""
+
+    def __init__(self, tenant_budget_bytes: int, total_budget_bytes: int | None = None):
+        self.tenant_budget_bytes = tenant_budget_bytes
+        self.total_budget_bytes = total_budget_bytes
+        # Tenants and their entries, least recently used first.
+        self._tenants: OrderedDict[str, OrderedDict[Hashable, _Entry]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(
+        self,
+        tenant: str,
+        key: Hashable,
+        build: Callable[[], object],
+        max_age_seconds: float | None = None,
+        version: Hashable = None,
+    ):
+        """Cached value of ``key`` for ``tenant``, built with ``build()`` when missing or stale.
+
+        An entry is stale once older than ``max_age_seconds`` or when it was
+        built for a different ``version`` of its inputs. ``build`` runs outside
+        the cache lock, so one tenant's slow refresh does not block reads for
+        the others.
+        """
+        with self._lock:
+            entry = self._tenants.get(tenant, {}).get(key)
+            if (
+                entry is not None
+                and entry.version == version
+                and (
+                    max_age_seconds is None or time.monotonic() - entry.loaded_at < max_age_seconds
+                )
+            ):
+                self._tenants.move_to_end(tenant)
+                self._tenants[tenant].move_to_end(key)
+                return entry.value
+        value = build()
+        self.put(tenant, key, value, version)
+        return value
+
+    def peek(self, tenant: str, key: Hashable):
+        """Cached value of ``key`` for ``tenant`` whatever its age or version, or None."""
+        with self._lock:
+            entry = self._tenants.get(tenant, {}).get(key)
+            return None if entry is None else entry.value
+
+    def loaded_at(self, tenant: str, key: Hashable) -> float | None:
+        """When ``key`` was last built for ``tenant`` (monotonic clock), or None if not cached."""
+        with self._lock:
+            entry = self._tenants.get(tenant, {}).get(key)
+            return None if entry is None else entry.loaded_at
+
+    def put(self, tenant: str, key: Hashable, value, version: Hashable = None):
+        """Store ``value`` (or re-measure it, if already cached) and enforce the budgets."""
+        nbytes = sizeof(value)
+        with self._lock:
+            entries = self._tenants.setdefault(tenant, OrderedDict())
+            previous = entries.get(key)
+            loaded_at = (
+                previous.loaded_at
+                if previous is not None and previous.value is value
+                else time.monotonic()
+            )
+            entries[key] = _Entry(value, nbytes, loaded_at, version)
+            entries.move_to_end(key)
+            self._tenants.move_to_end(tenant)
+            self._evict(tenant)
+
+    def _evict(self, tenant: str):
+        """Trim ``tenant`` to its budget, then drop the coldest other tenants.
+
+        The entry just stored is the tenant's most recent, so it always survives.
+        """
+        entries = self._tenants[tenant]
+        while self._bytes(tenant) > self.tenant_budget_bytes and len(entries) > 1:
+            evicted, _ = entries.popitem(last=False)
+            logger.info("tenant %s over budget: evicted %r", tenant, evicted)
+        if self.total_budget_bytes is None:
+            return
+        while self.total_bytes() > self.total_budget_bytes and len(self._tenants) > 1:
+            coldest = next(iter(self._tenants))
+            if coldest == tenant:
+                break
+            del self._tenants[coldest]
+            logger.info("cache over budget: evicted tenant %s", coldest)
+
+    def _bytes(self, tenant: str) -> int:
+        return sum(entry.nbytes for entry in self._tenants.get(tenant, {}).values())
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self._bytes(tenant) for tenant in self._tenants)
+
+    def usage(self) -> dict[str, int]:
+        """Bytes held per tenant, coldest first."""
+        with self._lock:
+            return {tenant: self._bytes(tenant) for tenant in self._tenants}
+
+    def invalidate(self, tenant: str, key: Hashable | None = None):
+        """Drop one entry, or all of a tenant's entries so its next read refreshes."""
+        with self._lock:
+            if key is None:
+                self._tenants.pop(tenant, None)
+            else:
+                self._tenants.get(tenant, {}).pop(key, None)
@@ -0,0 +1,102 @@
+"""Vectorized validation of whole source frames against the Pydantic models.
+
+Rules come from the model definitions in ``models.py`` — nullability, enum
+membership, numeric/date/bool types, and ``Field(ge=..., le=...)`` bounds —
+and are evaluated as boolean masks over entire columns instead of building
+one model object per row. Rows that break any rule are quarantined and
+reported in bulk; the remaining rows are cast to the loader schema.
+"""
+
+from datetime import date
+from enum import Enum
+import types
+from typing import Union, get_args, get_origin
+
+import annotated_types
+import numpy as np
+import pandas as pd
+
+from src.data.schema import MODELS, apply_schema
+
+VIOLATION_COLUMNS = ["row", "column", "rule", "value"]
+
+_BOUNDS = {
+    "ge": (annotated_types.Ge, np.greater_equal),
+    "gt": (annotated_types.Gt, np.greater),
+    "le": (annotated_types.Le, np.less_equal),
+    "lt": (annotated_types.Lt, np.less),
+}
+
+
+def _unwrap(annotation) -> tuple[type, bool]:
+    """Return (base type, nullable) for annotations like ``date | None``."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        return args[0], True
+    return annotation, False
+
+
+def _collect(found: list, mask: np.ndarray, df: pd.DataFrame, column: str, rule: str):
+    """Append one violation row per True entry in ``mask``."""
+    rows = np.flatnonzero(mask)
+    if len(rows) == 0:
+        return
+    values = df[column].iloc[rows].to_numpy(dtype=object) if column in df else None
+    found.append(
+        pd.DataFrame({"row": df.index[rows], "column": column, "rule": rule, "value": values})
+    )
+
+
+def validate_frame(df: pd.DataFrame, name: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Check a raw source frame against its model and split off bad rows.
+
+    Returns ``(valid, violations)``. ``valid`` holds the rows that pass every
+    rule, cast to the loader schema. ``violations`` has one row per failed
+    check: ``row`` (index label in ``df``), ``column``, ``rule``
+    (missing/null/enum/type/ge/gt/le/lt) and the offending ``value``.
+    """
+    coerced = df.copy()
+    found: list[pd.DataFrame] = []
+
+    for field, info in MODELS[name].model_fields.items():
+        base, nullable = _unwrap(info.annotation)
+        if field not in df.columns:
+            if info.is_required():
+                _collect(found, np.ones(len(df), dtype=bool), df, field, "missing")
+            continue
+
+        col = df[field]
+        null = col.isna().to_numpy()
+        if not nullable:
+            _collect(found, null, df, field, "null")
+
+        if isinstance(base, type) and issubclass(base, Enum):
+            allowed = [member.value for member in base]
+            _collect(found, ~col.isin(allowed).to_numpy() & ~null, df, field, "enum")
+        elif base in (int, float):
+            numeric = pd.to_numeric(col, errors="coerce")
+            bad_type = numeric.isna().to_numpy() & ~null
+            if base is int:
+                bad_type |= (numeric % 1 != 0).to_numpy() & ~numeric.isna().to_numpy()
+            _collect(found, bad_type, df, field, "type")
+            values = numeric.to_numpy(dtype=float)
+            for meta in info.metadata:
+                for rule, (bound_type, op) in _BOUNDS.items():
+                    if isinstance(meta, bound_type):
+                        with np.errstate(invalid="ignore"):
+                            out = ~op(values, getattr(meta, rule)) & ~np.isnan(values)
+                        _collect(found, out, df, field, rule)
+            coerced[field] = numeric
+        elif base is bool:
+            _collect(found, ~col.isin([True, False]).to_numpy() & ~null, df, field, "type")
+        elif base is date:
+            parsed = pd.to_datetime(col, errors="coerce")
+            _collect(found, parsed.isna().to_numpy() & ~null, df, field, "type")
+            coerced[field] = parsed
+
+    violations = (
+        pd.concat(found, ignore_index=True) if found else pd.DataFrame(columns=VIOLATION_COLUMNS)
+    )
+    if not violations.empty:
+        coerced = coerced[~df.index.isin(violations["row"])]
+    return apply_schema(coerced, name), violations
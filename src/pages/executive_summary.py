@@ -3,6 +3,7 @@
 from datetime import date
 import io
 
+import pandas as pd
 import streamlit as st
 
 from src.components.charts import (
@@ -13,14 +14,17 @@ from src.components.charts import (
 )
 from src.components.status_cards import metric_card, status_badge
 from src.data.data_loader import (
+    load_decision_changes,
+    load_decisions,
     load_escalations,
-    load_metrics,
+    load_metrics_cube,
     load_milestones,
     load_programs,
     load_risks,
+    load_rollup,
 )
 from src.utils.constants import MilestoneStatus, ProgramStatus, RiskSeverity
-from src.utils.helpers import format_percent_delta, generate_decisions
+from src.utils.helpers import format_percent_delta
 
 
 def render():
@@ -31,15 +35,18 @@ def render():
     milestones = load_milestones()
     risks = load_risks()
     escalations = load_escalations()
-    metrics = load_metrics()
+    metrics = load_metrics_cube()
+    rollup = load_rollup()
+    portfolio = rollup.total()
+    by_status = rollup.breakdown("status")["programs"]
 
     # Top-line metrics
     c1, c2, c3, c4, c5, c6 = st.columns(6)
-    total_programs = len(programs)
-    on_track = len(programs[programs["status"] == ProgramStatus.ON_TRACK.value])
-    at_risk = len(programs[programs["status"] == ProgramStatus.AT_RISK.value])
-    off_track = len(programs[programs["status"] == ProgramStatus.OFF_TRACK.value])
-    open_risks = len(risks[risks["is_open"] == True])
+    total_programs = int(portfolio["programs"])
+    on_track = int(by_status.get(ProgramStatus.ON_TRACK.value, 0))
+    at_risk = int(by_status.get(ProgramStatus.AT_RISK.value, 0))
+    off_track = int(by_status.get(ProgramStatus.OFF_TRACK.value, 0))
+    open_risks = int(portfolio["open_risks"])
     open_esc = len(escalations[escalations["resolved_date"].isna()])
 
     with c1:
@@ -68,9 +75,9 @@ def render():
 
     # Budget Overview
     st.subheader("Budget Overview")
-    total_budget = programs["budget_millions"].sum()
-    total_spent = programs["budget_spent_millions"].sum()
-    utilization = (total_spent / total_budget * 100) if total_budget > 0 else 0
+    total_budget = portfolio["budget_millions"]
+    total_spent = portfolio["budget_spent_millions"]
+    utilization = portfolio["utilization"] if total_budget > 0 else 0
 
     bc1, bc2, bc3 = st.columns(3)
     with bc1:
@@ -85,7 +92,27 @@ def render():
     with col_b1:
         st.plotly_chart(budget_by_program_bar(programs), use_container_width=True)
     with col_b2:
-        st.plotly_chart(budget_by_status_pie(programs), use_container_width=True)
+        st.plotly_chart(budget_by_status_pie(rollup), use_container_width=True)
+
+    # Department rollup
+    departments = rollup.breakdown("department")
+    if not departments.empty:
+        st.markdown("**By Department**")
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "Department": departments.index,
+                    "Programs": departments["programs"].astype(int).to_numpy(),
+                    "Budget ($M)": departments["budget_millions"].round(1).to_numpy(),
+                    "Spent ($M)": departments["budget_spent_millions"].round(1).to_numpy(),
+                    "Avg Completion (%)": departments["avg_completion"].round(0).to_numpy(),
+                    "Open Risks": departments["open_risks"].astype(int).to_numpy(),
+                    "Avg Deploy Freq": departments["avg_deployment_frequency"].round(1).to_numpy(),
+                }
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
 
     st.markdown("---")
 
@@ -131,7 +158,7 @@ def render():
             .head(5)
         )
         for _, row in upcoming.iterrows():
-            st.markdown(f"- {row['name']} — due {row['due_date']} ({row['program_id']})")
+            st.markdown(f"- {row['name']} — due {row['due_date']:%Y-%m-%d} ({row['program_id']})")
 
         # Open escalations
         st.markdown("**Open Escalations**")
@@ -145,20 +172,26 @@ def render():
     st.subheader("Delivery Health (Latest Week)")
     if metrics.empty:
         st.info("No delivery metrics available for the current data source.")
-        sorted_weeks = []
+        recent_weeks = []
     else:
-        sorted_weeks = sorted(metrics["week_start"].unique())
-    latest_week = sorted_weeks[-1] if sorted_weeks else None
-    prev_week = sorted_weeks[-2] if len(sorted_weeks) >= 2 else None
+        recent_weeks = metrics.latest_weeks(2)
+    latest_week = recent_weeks[-1] if recent_weeks else None
+    prev_week = recent_weeks[-2] if len(recent_weeks) >= 2 else None
 
     if latest_week is not None:
-        latest = metrics[metrics["week_start"] == latest_week]
-        prev = metrics[metrics["week_start"] == prev_week] if prev_week is not None else None
+        highlights = {
+            "deployment_frequency": "mean",
+            "lead_time_days": "mean",
+            "velocity": "sum",
+            "incident_count": "sum",
+        }
+        latest = metrics.at_week(latest_week, highlights)
+        prev = metrics.at_week(prev_week, highlights) if prev_week is not None else None
 
-        deploy_cur = latest["deployment_frequency"].mean()
-        lead_cur = latest["lead_time_days"].mean()
-        vel_cur = latest["velocity"].sum()
-        inc_cur = latest["incident_count"].sum()
+        deploy_cur = latest["deployment_frequency"]
+        lead_cur = latest["lead_time_days"]
+        vel_cur = latest["velocity"]
+        inc_cur = latest["incident_count"]
 
         deploy_delta = None
         lead_delta = None
@@ -166,10 +199,10 @@ def render():
         inc_delta = None
 
         if prev is not None:
-            deploy_delta = format_percent_delta(deploy_cur, prev["deployment_frequency"].mean())
-            lead_delta = format_percent_delta(lead_cur, prev["lead_time_days"].mean())
-            vel_delta = format_percent_delta(vel_cur, prev["velocity"].sum())
-            inc_delta = format_percent_delta(float(inc_cur), float(prev["incident_count"].sum()))
+            deploy_delta = format_percent_delta(deploy_cur, prev["deployment_frequency"])
+            lead_delta = format_percent_delta(lead_cur, prev["lead_time_days"])
+            vel_delta = format_percent_delta(vel_cur, prev["velocity"])
+            inc_delta = format_percent_delta(inc_cur, prev["incident_count"])
 
         dc1, dc2, dc3, dc4 = st.columns(4)
         with dc1:
@@ -190,15 +223,26 @@ def render():
     st.markdown("---")
 
     # Decisions Needed
-    decisions = generate_decisions(programs, risks, milestones, escalations)
-    if decisions:
+    decisions = load_decisions()
+    if not decisions.empty:
         st.subheader("Decisions Needed")
         severity_icons = {
             "critical": ":red_circle:",
             "high": ":orange_circle:",
             "medium": ":large_yellow_circle:",
         }
-        for d in decisions:
+        changes = load_decision_changes()
+        if changes:
+            st.caption(
+                f"Since last refresh: {len(changes.added)} new, "
+                f"{len(changes.changed)} updated, {len(changes.removed)} resolved"
+            )
+            if not changes.added.empty:
+                with st.expander("New since last refresh"):
+                    for d in changes.added.itertuples(index=False):
+                        icon = severity_icons.get(d.severity, ":white_circle:")
+                        st.markdown(f"{icon} **{d.title}**")
+        for d in decisions.itertuples(index=False):
             icon = severity_icons.get(d.severity, ":white_circle:")
             st.markdown(
                 f"{icon} **{d.title}**  \n"
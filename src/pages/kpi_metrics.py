@@ -3,58 +3,69 @@
 import pandas as pd
 import streamlit as st
 
-from src.components.charts import defect_incident_trend, dora_metrics_chart, velocity_trend
+from src.components.charts import (
+    defect_incident_trend,
+    dora_maturity_trend,
+    dora_metrics_chart,
+    velocity_trend,
+)
 from src.components.filters import program_filter
 from src.components.status_cards import metric_card
-from src.data.data_loader import load_metrics, load_programs
-from src.utils.helpers import classify_dora_maturity, format_percent_delta
+from src.data.data_loader import load_metrics_cube, load_programs
+from src.utils.constants import DORA_MATURITY_COLORS
+from src.utils.helpers import classify_dora_frame, format_percent_delta
 
 
 def render():
     st.title("KPI Metrics")
 
     programs = load_programs()
-    metrics = load_metrics()
 
     # Filter
     with st.expander("Filters", expanded=False):
         selected_ids = program_filter(programs, key="kpi_prog")
 
-    if metrics.empty:
-        st.warning("No delivery metrics available. Metrics are not provided by the Asana data source.")
-        return
-
-    filtered = metrics[metrics["program_id"].isin(selected_ids)]
-
-    if filtered.empty:
-        st.warning("No metrics available for the selected programs.")
+    cube = load_metrics_cube()
+    selected = cube.select(selected_ids)
+
+    if selected.empty:
+        if cube.empty:
+            st.warning(
+                "No delivery metrics available. "
+                "Metrics are not provided by the Asana data source."
+            )
+        else:
+            st.warning("No metrics available for the selected programs.")
         return
 
     # Latest and previous week
-    sorted_weeks = sorted(filtered["week_start"].unique())
-    if not sorted_weeks:
-        st.warning("No weekly data available.")
-        return
-    latest_week = sorted_weeks[-1]
-    prev_week = sorted_weeks[-2] if len(sorted_weeks) >= 2 else None
-
-    latest = filtered[filtered["week_start"] == latest_week]
-    prev = filtered[filtered["week_start"] == prev_week] if prev_week else None
-
-    deploy_cur = latest["deployment_frequency"].mean()
-    lead_cur = latest["lead_time_days"].mean()
-    cfr_cur = latest["change_failure_rate"].mean()
-    mttr_cur = latest["mttr_hours"].mean()
+    dora_means = {
+        "deployment_frequency": "mean",
+        "lead_time_days": "mean",
+        "change_failure_rate": "mean",
+        "mttr_hours": "mean",
+    }
+    recent_weeks = selected.latest_weeks(2)
+    latest_week = recent_weeks[-1]
+    prev_week = recent_weeks[-2] if len(recent_weeks) >= 2 else None
+
+    latest = selected.at_week(latest_week, dora_means)
+    prev = selected.at_week(prev_week, dora_means) if prev_week is not None else None
+
+    deploy_cur = latest["deployment_frequency"]
+    lead_cur = latest["lead_time_days"]
+    cfr_cur = latest["change_failure_rate"]
+    mttr_cur = latest["mttr_hours"]
 
     deploy_delta = None
     lead_delta = None
     cfr_delta = None
     mttr_delta = None
     if prev is not None:
-        deploy_delta = format_percent_delta(deploy_cur, prev["deployment_frequency"].mean())
-        lead_delta = format_percent_delta(lead_cur, prev["lead_time_days"].mean())
-        cfr_delta = format_percent_delta(cfr_cur, prev["change_failure_rate"].mean())
-        mttr_delta = format_percent_delta(mttr_cur, prev["mttr_hours"].mean())
+        deploy_delta = format_percent_delta(deploy_cur, prev["deployment_frequency"])
+        lead_delta = format_percent_delta(lead_cur, prev["lead_time_days"])
+        cfr_delta = format_percent_delta(cfr_cur, prev["change_failure_rate"])
+        mttr_delta = format_percent_delta(mttr_cur, prev["mttr_hours"])
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
@@ -81,41 +92,38 @@ def render():
     st.markdown("---")
 
     # DORA metrics chart with benchmark bands
-    st.plotly_chart(dora_metrics_chart(filtered), use_container_width=True)
+    st.plotly_chart(dora_metrics_chart(selected), use_container_width=True)
 
     # DORA Maturity by Program
     st.subheader("DORA Maturity by Program")
-    maturity_rows = []
-    for pid in selected_ids:
-        prog_latest = latest[latest["program_id"] == pid]
-        if prog_latest.empty:
-            continue
-        prog_name = programs[programs["id"] == pid]["name"].values
-        name = prog_name[0] if len(prog_name) > 0 else pid
-        df_val = prog_latest["deployment_frequency"].mean()
-        lt_val = prog_latest["lead_time_days"].mean()
-        cfr_val = prog_latest["change_failure_rate"].mean()
-        mttr_val = prog_latest["mttr_hours"].mean()
-        level = classify_dora_maturity(df_val, lt_val, cfr_val, mttr_val)
-        maturity_rows.append({
-            "Program": name,
-            "Deploy Freq": f"{df_val:.1f}/wk",
-            "Lead Time": f"{lt_val:.1f}d",
-            "CFR": f"{cfr_val:.1f}%",
-            "MTTR": f"{mttr_val:.1f}h",
-            "Maturity": level,
-        })
-
-    if maturity_rows:
-        maturity_df = pd.DataFrame(maturity_rows)
+    latest_by_program = selected.by_program(latest_week, list(dora_means))
+    if not latest_by_program.empty:
+        names = programs.set_index("id")["name"]
+        order = pd.Index(selected_ids).intersection(latest_by_program.index, sort=False)
+        prog_latest = latest_by_program.reindex(order)
+        maturity_df = pd.DataFrame(
+            {
+                "Program": names.reindex(order).fillna(order.to_series()).to_numpy(),
+                "Deploy Freq": prog_latest["deployment_frequency"].to_numpy(),
+                "Lead Time": prog_latest["lead_time_days"].to_numpy(),
+                "CFR": prog_latest["change_failure_rate"].to_numpy(),
+                "MTTR": prog_latest["mttr_hours"].to_numpy(),
+                "Maturity": classify_dora_frame(prog_latest).astype(str).to_numpy(),
+            }
+        )
         maturity_colors = {
-            "Elite": "color: #2E8B57; font-weight: 600",
-            "High": "color: #1B6AC9; font-weight: 600",
-            "Medium": "color: #D4A017; font-weight: 600",
-            "Low": "color: #C0392B; font-weight: 600",
+            level: f"color: {color}; font-weight: 600"
+            for level, color in DORA_MATURITY_COLORS.items()
         }
         st.dataframe(
-            maturity_df.style.applymap(
+            maturity_df.style.format(
+                {
+                    "Deploy Freq": "{:.1f}/wk",
+                    "Lead Time": "{:.1f}d",
+                    "CFR": "{:.1f}%",
+                    "MTTR": "{:.1f}h",
+                }
+            ).map(
                 lambda v: maturity_colors.get(v, ""),
                 subset=["Maturity"],
             ),
@@ -123,6 +131,8 @@ def render():
             hide_index=True,
         )
 
+    st.plotly_chart(dora_maturity_trend(selected), use_container_width=True)
+
     st.markdown("---")
 
     # Velocity and defects side by side
@@ -136,7 +146,7 @@ def render():
         pid = None
         if program_select != "All Programs":
             pid = programs[programs["name"] == program_select]["id"].values[0]
-        st.plotly_chart(velocity_trend(filtered, program_id=pid), use_container_width=True)
+        st.plotly_chart(velocity_trend(selected, program_id=pid), use_container_width=True)
 
     with col2:
-        st.plotly_chart(defect_incident_trend(filtered), use_container_width=True)
+        st.plotly_chart(defect_incident_trend(selected), use_container_width=True)
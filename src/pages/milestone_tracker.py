@@ -1,21 +1,24 @@
 """Gantt chart, delivery predictability, milestone details."""
 
+from datetime import date
+
+import pandas as pd
 import streamlit as st
 
 from src.components.charts import delivery_predictability, gantt_chart, milestone_status_bar
 from src.components.filters import program_filter, quarter_filter
 from src.components.status_cards import metric_card
 from src.components.tables import styled_milestone_table
-from src.data.data_loader import load_milestones, load_programs
+from src.data.data_loader import count_rows, load_programs, milestone_quarters, query
+from src.data.query_spec import QuerySpec
 from src.utils.constants import MilestoneStatus
-from src.utils.helpers import current_quarter, days_until, format_delta
+from src.utils.helpers import current_quarter, format_delta
 
 
 def render():
     st.title("Milestone Tracker")
 
     programs = load_programs()
-    milestones = load_milestones()
 
     # Filters
     with st.expander("Filters", expanded=False):
@@ -23,15 +26,15 @@ def render():
         with col1:
             selected_ids = program_filter(programs, key="mt_prog")
         with col2:
-            selected_quarters = quarter_filter(key="mt_qtr", milestones_df=milestones)
+            selected_quarters = quarter_filter(key="mt_qtr", options=milestone_quarters())
 
-    filtered = milestones[
-        (milestones["program_id"].isin(selected_ids))
-        & (milestones["quarter"].isin(selected_quarters))
-    ]
+    filtered = query(
+        "milestones", QuerySpec(program_ids=selected_ids, quarters=selected_quarters)
+    )
 
     # Summary metrics
     total = len(filtered)
+    st.caption(f"Showing {total:,} of {count_rows('milestones'):,} milestones")
     completed = len(filtered[filtered["status"] == MilestoneStatus.COMPLETED.value])
     in_progress = len(filtered[filtered["status"] == MilestoneStatus.IN_PROGRESS.value])
     delayed = len(filtered[filtered["status"] == MilestoneStatus.DELAYED.value])
@@ -64,14 +67,14 @@ def render():
 
     if not upcoming.empty:
         st.subheader("Upcoming Milestones")
-        for _, row in upcoming.iterrows():
-            days = days_until(row["due_date"])
+        days_left = (upcoming["due_date"] - pd.Timestamp(date.today())).dt.days
+        for (_, row), days in zip(upcoming.iterrows(), days_left):
             delta_str = format_delta(days)
             q_label = " **(current)**" if row["quarter"] == cur_q else ""
             key_label = " :star:" if row["is_key_milestone"] else ""
             st.markdown(
                 f"- **{row['name']}**{key_label} — {delta_str} "
-                f"(due {row['due_date']}, {row['quarter']}{q_label})"
+                f"(due {row['due_date']:%Y-%m-%d}, {row['quarter']}{q_label})"
             )
         st.markdown("---")
 
@@ -1,16 +1,28 @@
 """Portfolio overview — status cards, completion bars, program details."""
 
+from datetime import date
+
+import pandas as pd
 import streamlit as st
 
 from src.components.charts import (
     budget_utilization_bar,
     completion_bar_chart,
     program_status_donut,
+    schedule_status_trend,
 )
 from src.components.filters import program_filter, status_filter
 from src.components.status_cards import metric_card, program_card
 from src.components.tables import styled_program_table
-from src.data.data_loader import load_programs
+from src.data.data_loader import (
+    history_start,
+    load_as_of,
+    load_portfolio_tree,
+    load_programs,
+    load_schedule_history,
+    query,
+)
+from src.data.query_spec import QuerySpec
 from src.utils.constants import ProgramStatus
 
 
@@ -27,9 +39,7 @@ def render():
         with col2:
             selected_statuses = status_filter(key="ph_status")
 
-    filtered = programs[
-        (programs["id"].isin(selected_ids)) & (programs["status"].isin(selected_statuses))
-    ]
+    filtered = query("programs", QuerySpec(program_ids=selected_ids, statuses=selected_statuses))
 
     # Top-level metrics
     total = len(filtered)
@@ -66,6 +76,30 @@ def render():
     st.subheader("Budget")
     st.plotly_chart(budget_utilization_bar(filtered), use_container_width=True)
 
+    # Schedule status over the last six months, weekly
+    dates = pd.date_range(end=pd.Timestamp(date.today()), periods=27, freq="7D")
+    counts = load_schedule_history(dates).counts(dates, selected_ids)
+    st.plotly_chart(schedule_status_trend(counts), use_container_width=True)
+
+    # Portfolio hierarchy, rolled up from projects
+    with st.expander("Portfolio Hierarchy"):
+        tree = load_portfolio_tree().frame()
+        indent = tree["depth"].map(lambda depth: "\u2003" * depth)
+        st.dataframe(
+            {
+                "Node": (indent + tree["name"]).tolist(),
+                "Level": tree["level"].astype(str).tolist(),
+                "% Complete": tree["percent_complete"].round(0).tolist(),
+                "Budget ($M)": tree["budget_millions"].round(1).tolist(),
+                "Spent ($M)": tree["budget_spent_millions"].round(1).tolist(),
+                "Open Risks": tree["open_risks"].astype(int).tolist(),
+                "Risk Exposure": tree["risk_exposure"].astype(int).tolist(),
+                "Late Milestones": tree["milestones_late"].astype(int).tolist(),
+            },
+            use_container_width=True,
+            hide_index=True,
+        )
+
     # Program cards
     st.subheader("Program Details")
     cols = st.columns(2)
@@ -84,3 +118,15 @@ def render():
     # Table view
     with st.expander("Detailed Table View"):
         styled_program_table(filtered)
+
+    # Past state, reconstructed from the snapshot history
+    start = history_start()
+    if start is not None:
+        with st.expander("Programs As Of"):
+            when = st.date_input(
+                "As of", value=date.today(), min_value=start, max_value=date.today(), key="ph_as_of"
+            )
+            past = load_as_of("programs", when)
+            if selected_ids:
+                past = past[past["id"].isin(selected_ids)]
+            styled_program_table(past)
@@ -6,17 +6,15 @@ from src.components.charts import risk_heatmap, risk_trend
 from src.components.filters import program_filter, severity_filter
 from src.components.status_cards import metric_card
 from src.components.tables import styled_escalation_table, styled_risk_table
-from src.data.data_loader import load_escalations, load_programs, load_risks
-from src.utils.constants import RiskLikelihood, RiskSeverity
-from src.utils.helpers import risk_score
+from src.data.data_loader import count_rows, load_programs, query
+from src.data.query_spec import QuerySpec
+from src.utils.constants import RiskSeverity
 
 
 def render():
     st.title("Risk Management")
 
     programs = load_programs()
-    risks = load_risks()
-    escalations = load_escalations()
 
     # Filters
     with st.expander("Filters", expanded=False):
@@ -26,10 +24,10 @@ def render():
         with col2:
             selected_severities = severity_filter(key="rm_sev")
 
-    filtered_risks = risks[
-        (risks["program_id"].isin(selected_ids)) & (risks["severity"].isin(selected_severities))
-    ]
-    filtered_esc = escalations[escalations["program_id"].isin(selected_ids)]
+    spec = QuerySpec(program_ids=selected_ids, severities=selected_severities)
+    filtered_risks = query("risks", spec)
+    filtered_esc = query("escalations", spec)
+    st.caption(f"Showing {len(filtered_risks):,} of {count_rows('risks'):,} risks")
 
     # Summary
     open_risks = filtered_risks[filtered_risks["is_open"] == True]
@@ -60,19 +58,12 @@ def render():
     # Risk table — sorted by risk score (highest first)
     st.subheader("Risk Register")
     open_only = st.checkbox("Open risks only", value=True, key="rm_open_only")
-    display_risks = filtered_risks[filtered_risks["is_open"] == True] if open_only else filtered_risks
+    display_risks = filtered_risks
+    if open_only:
+        display_risks = filtered_risks[filtered_risks["is_open"] == True]
 
     if not display_risks.empty:
-        scored = display_risks.copy()
-        scored["_risk_score"] = scored.apply(
-            lambda r: risk_score(
-                RiskSeverity(r["severity"]),
-                RiskLikelihood(r["likelihood"]),
-            ),
-            axis=1,
-        )
-        scored = scored.sort_values("_risk_score", ascending=False).drop(columns=["_risk_score"])
-        styled_risk_table(scored)
+        styled_risk_table(display_risks.sort_values("risk_score", ascending=False, kind="stable"))
     else:
         st.info("No risks match the selected filters.")
 
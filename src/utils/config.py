@@ -1,6 +1,22 @@
-"""YAML configuration loader."""
+"""YAML configuration loader.
 
+One deployment can serve several tenants (business units). Each tenant's
+settings live under ``tenants.<key>`` and override the top-level sections
+they name, e.g. its own ``asana.portfolio_gid``. Code running inside
+:func:`tenant_scope` sees that tenant's settings through :func:`get` and
+:func:`get_nested`.
+
+Settings are re-read when the settings file changes on disk (checked at most
+once per :data:`CHECK_INTERVAL_SECONDS`); callbacks registered with
+:func:`on_reload` then drop whatever was built from the old settings.
+"""
+
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+import threading
+import time
 
 import yaml
 
@@ -8,29 +24,129 @@ _CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
 _DEFAULT_PATH = _CONFIG_DIR / "settings.yaml"
 _EXAMPLE_PATH = _CONFIG_DIR / "settings.example.yaml"
 
+DEFAULT_TENANT = "default"
+
+CHECK_INTERVAL_SECONDS = 2.0
+
 _config: dict | None = None
+# The file the cached settings came from, and its mtime when it was read.
+_source: tuple[Path, int] | None = None
+_checked_at = 0.0
+_reload_lock = threading.RLock()
+_reload_hooks: list[Callable[[], None]] = []
+_tenant: ContextVar[str] = ContextVar("tenant", default=DEFAULT_TENANT)
+
+
+def _settings_path() -> Path:
+    return _DEFAULT_PATH if _DEFAULT_PATH.exists() else _EXAMPLE_PATH
+
+
+def _changed_on_disk() -> bool:
+    """Whether the settings file was edited, created or removed since it was read."""
+    global _checked_at
+    now = time.monotonic()
+    if _source is None or now - _checked_at < CHECK_INTERVAL_SECONDS:
+        return False
+    _checked_at = now
+    path = _settings_path()
+    try:
+        return (path, path.stat().st_mtime_ns) != _source
+    except OSError:
+        return False
 
 
 def load_config(path: Path | None = None) -> dict:
-    """Load and cache settings from YAML. Falls back to example config."""
-    global _config
+    """Load and cache settings from YAML. Falls back to example config.
+
+    The default settings file is re-read, and the reload callbacks run, once
+    it changes on disk.
+    """
+    global _config, _source
     if _config is not None and path is None:
+        if _changed_on_disk():
+            return reload_config()
         return _config
 
     config_path = path or _DEFAULT_PATH
     if not config_path.exists():
         config_path = _EXAMPLE_PATH
-
     with open(config_path) as f:
         _config = yaml.safe_load(f) or {}
+    # An explicit path is read once; only the default settings file is watched.
+    _source = None if path is not None else (config_path, config_path.stat().st_mtime_ns)
     return _config
 
 
+def on_reload(callback: Callable[[], None]):
+    """Register ``callback`` to run whenever :func:`reload_config` re-reads the settings."""
+    _reload_hooks.append(callback)
+
+
+def reload_config(path: Path | None = None) -> dict:
+    """Re-read settings from disk and let dependent caches invalidate themselves."""
+    global _config
+    with _reload_lock:
+        _config = None
+        config = load_config(path)
+        for callback in _reload_hooks:
+            callback()
+    return config
+
+
+def tenants() -> list[str]:
+    """Configured tenant keys, or just the default tenant."""
+    return list(load_config().get("tenants") or {}) or [DEFAULT_TENANT]
+
+
+def current_tenant() -> str:
+    return _tenant.get()
+
+
+@contextmanager
+def tenant_scope(tenant: str):
+    """Read settings, caches and stores as ``tenant`` within the block."""
+    token = _tenant.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _tenant.reset(token)
+
+
+def _overrides() -> dict:
+    return (load_config().get("tenants") or {}).get(current_tenant()) or {}
+
+
 def get(key: str, default=None):
-    """Get a top-level config value."""
+    """Get a top-level config value, as overridden for the current tenant."""
+    overrides = _overrides()
+    if key in overrides:
+        return overrides[key]
     return load_config().get(key, default)
 
 
 def get_nested(section: str, key: str, default=None):
-    """Get a nested config value like get_nested('jira', 'server')."""
-    return load_config().get(section, {}).get(key, default)
+    """Get a nested config value like get_nested('jira', 'server').
+
+    A tenant's section overrides the keys it sets; other keys fall back to
+    the top-level section.
+    """
+    overrides = _overrides().get(section) or {}
+    if key in overrides:
+        return overrides[key]
+    return (load_config().get(section) or {}).get(key, default)
+
+
+def tenant_path(path: str | Path) -> Path:
+    """``path`` namespaced for the current tenant.
+
+    The default tenant keeps ``path`` as is. Other tenants get a sibling
+    file (``history-<tenant>.sqlite``) or, for a directory, a
+    ``tenants/<tenant>`` subdirectory.
+    """
+    path = Path(path)
+    tenant = current_tenant()
+    if tenant == DEFAULT_TENANT or str(path) == ":memory:":
+        return path
+    if path.suffix:
+        return path.with_name(f"{path.stem}-{tenant}{path.suffix}")
+    return path / "tenants" / tenant
@@ -39,6 +39,12 @@ class EscalationLevel(str, Enum):
     C_SUITE = "C-Suite"
 
 
+class NodeLevel(str, Enum):
+    PORTFOLIO = "Portfolio"
+    PROGRAM = "Program"
+    PROJECT = "Project"
+
+
 # Professional muted color palette
 STATUS_COLORS = {
     ProgramStatus.ON_TRACK: "#2E8B57",
@@ -54,6 +60,20 @@ SEVERITY_COLORS = {
     RiskSeverity.CRITICAL: "#C0392B",
 }
 
+# Risk score = severity weight x likelihood weight (1-12)
+RISK_SEVERITY_WEIGHTS = {
+    RiskSeverity.LOW: 1,
+    RiskSeverity.MEDIUM: 2,
+    RiskSeverity.HIGH: 3,
+    RiskSeverity.CRITICAL: 4,
+}
+
+RISK_LIKELIHOOD_WEIGHTS = {
+    RiskLikelihood.LOW: 1,
+    RiskLikelihood.MEDIUM: 2,
+    RiskLikelihood.HIGH: 3,
+}
+
 MILESTONE_COLORS = {
     MilestoneStatus.NOT_STARTED: "#95A5A6",
     MilestoneStatus.IN_PROGRESS: "#1B6AC9",
@@ -119,6 +139,13 @@ DORA_BAND_COLORS = {
     "low": "rgba(192, 57, 43, 0.10)",      # red
 }
 
+DORA_MATURITY_COLORS = {
+    "Elite": "#2E8B57",
+    "High": "#1B6AC9",
+    "Medium": "#D4A017",
+    "Low": "#C0392B",
+}
+
 DEPARTMENTS = [
     "Cloud Engineering",
     "SRE",
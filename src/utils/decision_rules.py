@@ -0,0 +1,496 @@
+"""Decision rules: declarative conditions compiled to vectorized masks.
+
+A rule names an entity (one of the loader datasets), a condition on its
+columns, a severity and text templates for the decision it raises::
+
+    decisions:
+      rules:
+        - name: aging-high-risks
+          entity: risks
+          when: {is_open: true, severity: High, age_days: {gt: 60}}
+          severity: medium
+          title: "Risk open {age_days} days: {title}"
+          recommendation: "Review mitigation with {owner}"
+
+``when`` maps each column to a value (equality), a list (membership) or a
+dict of comparisons (``eq``, ``ne``, ``lt``, ``le``, ``gt``, ``ge``,
+``in``, ``not_in``, ``null``); all of them must hold. Templates use
+``str.format`` fields naming columns, e.g. ``{percent_complete:.0f}``.
+``program`` defaults to ``{name}`` for programs and ``{program_id}``
+otherwise. Any entity with a ``raised_date`` also offers ``age_days``.
+
+:data:`BUILTIN_RULES` are the standard leadership rules; configured rules
+follow them unless ``decisions.builtin_rules`` is false. Rules are compiled
+once per tenant (and again after :func:`src.utils.config.reload_config`),
+and each evaluation is a handful of column operations per rule.
+
+A :class:`DecisionTracker` keeps the decisions between refreshes and
+re-evaluates only the rows whose contents changed, reporting which
+decisions were added, removed or changed.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from string import Formatter
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.utils.config import current_tenant, get, on_reload
+from src.utils.constants import MilestoneStatus, ProgramStatus, RiskLikelihood, RiskSeverity
+
+DECISION_COLUMNS = ["severity", "program", "title", "recommendation"]
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2}
+ENTITIES = ("programs", "risks", "milestones", "escalations")
+
+BUILTIN_RULES = [
+    {
+        "name": "off-track-programs",
+        "entity": "programs",
+        "when": {"status": ProgramStatus.OFF_TRACK.value},
+        "severity": "critical",
+        "title": "{name} is off track at {percent_complete:.0f}%",
+        "recommendation": "Re-scope deliverables or add resources",
+    },
+    {
+        "name": "critical-risks",
+        "entity": "risks",
+        "when": {
+            "is_open": True,
+            "severity": RiskSeverity.CRITICAL.value,
+            "likelihood": RiskLikelihood.HIGH.value,
+        },
+        "severity": "critical",
+        "title": "Critical risk: {title}",
+        "recommendation": "Accept, mitigate, or transfer risk",
+    },
+    {
+        "name": "stale-escalations",
+        "entity": "escalations",
+        "when": {"resolved_date": {"null": True}, "age_days": {"gt": 30}},
+        "severity": "high",
+        "title": "Escalation open {age_days} days: {title}",
+        "recommendation": "Escalate to next level",
+    },
+    {
+        "name": "blocked-milestones",
+        "entity": "milestones",
+        "when": {"status": MilestoneStatus.BLOCKED.value},
+        "severity": "high",
+        "title": "Blocked milestone: {name}",
+        "recommendation": "Unblock milestone for {program_id}",
+    },
+]
+
+_OPERATORS: dict[str, Callable[[pd.Series, object], pd.Series]] = {
+    "eq": lambda col, v: col == v,
+    "ne": lambda col, v: col != v,
+    "lt": lambda col, v: col < v,
+    "le": lambda col, v: col <= v,
+    "gt": lambda col, v: col > v,
+    "ge": lambda col, v: col >= v,
+    "in": lambda col, v: col.isin(v),
+    "not_in": lambda col, v: ~col.isin(v),
+    "null": lambda col, v: col.isna() == bool(v),
+}
+
+
+def _age_days(df: pd.DataFrame, today: date) -> pd.Series:
+    return (pd.Timestamp(today) - pd.to_datetime(df["raised_date"])).dt.days
+
+
+# Columns computed on demand when a rule names them and the frame lacks them.
+_DERIVED: dict[str, Callable[[pd.DataFrame, date], pd.Series]] = {"age_days": _age_days}
+_DERIVED_FROM = {"age_days": "raised_date"}
+
+
+def _column(df: pd.DataFrame, column: str, today: date) -> pd.Series:
+    if column in df.columns:
+        return df[column]
+    if column in _DERIVED:
+        return _DERIVED[column](df, today)
+    raise KeyError(column)
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+
+def _condition(column: str, test) -> Callable[[pd.DataFrame, date], pd.Series]:
+    if isinstance(test, dict):
+        unknown = set(test) - set(_OPERATORS)
+        if unknown:
+            raise ValueError(
+                f"Unknown operator(s) {sorted(unknown)} for column '{column}'. "
+                f"Use one of {sorted(_OPERATORS)}."
+            )
+        checks = [(_OPERATORS[op], value) for op, value in test.items()]
+    elif isinstance(test, list):
+        checks = [(_OPERATORS["in"], test)]
+    else:
+        checks = [(_OPERATORS["eq"], test)]
+
+    def evaluate(df: pd.DataFrame, today: date) -> pd.Series:
+        values = _column(df, column, today)
+        mask = pd.Series(True, index=df.index)
+        for check, value in checks:
+            mask &= check(values, value).fillna(False).astype(bool)
+        return mask
+
+    return evaluate
+
+
+def _template(text: str) -> Callable[[pd.DataFrame, date], pd.Series]:
+    """Vectorized ``text.format(**row)``: literals and columns concatenated as string columns.
+
+    Fields with a format spec are formatted value by value, over the matched rows only.
+    """
+    parts = list(Formatter().parse(text))
+
+    def render(df: pd.DataFrame, today: date) -> pd.Series:
+        out = pd.Series("", index=df.index, dtype=object)
+        for literal, field, spec, _ in parts:
+            if literal:
+                out = out + literal
+            if field is None:
+                continue
+            values = _column(df, field, today)
+            if spec:
+                out = out + values.map(("{:" + spec + "}").format).astype(object)
+            else:
+                out = out + values.astype(str).astype(object)
+        return out
+
+    return render
+
+
+@dataclass(frozen=True)
+class DecisionRule:
+    """A compiled rule: a mask over one entity's frame plus the decision's text columns."""
+
+    name: str
+    entity: str
+    severity: str
+    when: Callable[[pd.DataFrame, date], pd.Series]
+    program: Callable[[pd.DataFrame, date], pd.Series]
+    title: Callable[[pd.DataFrame, date], pd.Series]
+    recommendation: Callable[[pd.DataFrame, date], pd.Series]
+    # Source columns the rule reads; a row change elsewhere cannot change its decision.
+    columns: frozenset[str] = frozenset()
+
+    def evaluate(self, df: pd.DataFrame, today: date) -> pd.DataFrame:
+        """One row of :data:`DECISION_COLUMNS` per row of ``df`` the rule matches."""
+        try:
+            matched = df[self.when(df, today)]
+            return pd.DataFrame(
+                {
+                    "severity": self.severity,
+                    "program": self.program(matched, today),
+                    "title": self.title(matched, today),
+                    "recommendation": self.recommendation(matched, today),
+                },
+                index=matched.index,
+            )
+        except KeyError as exc:
+            raise ValueError(
+                f"Decision rule '{self.name}' refers to column {exc} missing from {self.entity}"
+            ) from None
+
+
+def compile_rule(spec: dict) -> DecisionRule:
+    """Compile one rule definition; raises ``ValueError`` for an invalid one."""
+    name = spec.get("name") or spec.get("title", "?")
+    entity = spec.get("entity")
+    if entity not in ENTITIES:
+        raise ValueError(f"Decision rule '{name}': entity must be one of {list(ENTITIES)}")
+    severity = spec.get("severity", "medium")
+    if severity not in SEVERITY_RANK:
+        raise ValueError(f"Decision rule '{name}': severity must be one of {list(SEVERITY_RANK)}")
+    if "title" not in spec or "recommendation" not in spec:
+        raise ValueError(f"Decision rule '{name}' needs a title and a recommendation")
+    conditions = [_condition(column, test) for column, test in (spec.get("when") or {}).items()]
+    program = spec.get("program") or ("{name}" if entity == "programs" else "{program_id}")
+    fields = {
+        field
+        for text in (program, spec["title"], spec["recommendation"])
+        for _, field, _, _ in Formatter().parse(text)
+        if field is not None
+    }
+
+    def when(df: pd.DataFrame, today: date) -> pd.Series:
+        mask = pd.Series(True, index=df.index)
+        for condition in conditions:
+            mask &= condition(df, today)
+        return mask
+
+    return DecisionRule(
+        name=name,
+        entity=entity,
+        severity=severity,
+        when=when,
+        program=_template(program),
+        title=_template(spec["title"]),
+        recommendation=_template(spec["recommendation"]),
+        columns=frozenset(
+            _DERIVED_FROM.get(column, column) for column in {*fields, *(spec.get("when") or {})}
+        ),
+    )
+
+
+def compile_rules(specs: list[dict]) -> tuple[DecisionRule, ...]:
+    """Compile rule definitions; names must be unique, as decisions are tracked by rule name."""
+    rules = tuple(compile_rule(spec) for spec in specs)
+    names = [rule.name for rule in rules]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Decision rule names must be unique; repeated: {duplicates}")
+    return rules
+
+
+_compiled: dict[str, tuple[DecisionRule, ...]] = {}
+_compiled_lock = threading.Lock()
+
+
+def configured_rules() -> tuple[DecisionRule, ...]:
+    """The current tenant's rules: the built-in ones, then ``decisions.rules``."""
+    tenant = current_tenant()
+    with _compiled_lock:
+        if tenant in _compiled:
+            return _compiled[tenant]
+    settings = get("decisions") or {}
+    specs = BUILTIN_RULES if settings.get("builtin_rules", True) else []
+    rules = compile_rules([*specs, *(settings.get("rules") or [])])
+    with _compiled_lock:
+        return _compiled.setdefault(tenant, rules)
+
+
+def clear_compiled():
+    with _compiled_lock:
+        _compiled.clear()
+
+
+on_reload(clear_compiled)
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+def evaluate_rules(
+    rules: tuple[DecisionRule, ...] | list[DecisionRule],
+    frames: dict[str, pd.DataFrame],
+    today: date | None = None,
+) -> pd.DataFrame:
+    """Decisions raised by ``rules`` over ``frames`` (entity -> frame).
+
+    Rows keep rule order within each severity, most severe first. Entities
+    that are missing or empty raise nothing.
+    """
+    today = today or date.today()
+    parts = []
+    for rule in rules:
+        df = frames.get(rule.entity)
+        if df is None or df.empty:
+            continue
+        part = rule.evaluate(df, today)
+        if not part.empty:
+            parts.append(part)
+    if not parts:
+        return pd.DataFrame(columns=DECISION_COLUMNS)
+    decisions = pd.concat(parts, ignore_index=True)
+    return decisions.sort_values(
+        "severity", key=lambda s: s.map(SEVERITY_RANK), kind="stable"
+    ).reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# Incremental evaluation
+# ---------------------------------------------------------------------------
+
+# Decisions are tracked by the rule that raised them and the entity row's id.
+_KEY = ["rule", "entity_id"]
+_TRACKED = [*DECISION_COLUMNS, *_KEY, "entity", "rule_index", "position"]
+
+
+def _empty_decisions() -> pd.DataFrame:
+    return pd.DataFrame(columns=_TRACKED)
+
+
+@dataclass
+class DecisionChanges:
+    """Decisions added, removed and changed by one :meth:`DecisionTracker.update`."""
+
+    added: pd.DataFrame
+    removed: pd.DataFrame
+    changed: pd.DataFrame
+
+    def __bool__(self) -> bool:
+        return not (self.added.empty and self.removed.empty and self.changed.empty)
+
+
+@dataclass
+class _EntityUpdate:
+    kept: pd.DataFrame  # previous decisions of unchanged rows
+    fresh: list[pd.DataFrame]  # decisions of new and changed rows
+    stale: pd.DataFrame  # previous decisions of changed and removed rows
+    moved: bool = False  # rows were reordered, so the kept positions changed
+
+
+class DecisionTracker:
+    """Keeps decisions per entity row and re-evaluates only the rows that changed.
+
+    Every rule looks at one row at a time, so a row whose columns are
+    unchanged raises the same decisions as before. Each update fingerprints
+    the columns the rules read (``id`` identifies a row across refreshes),
+    evaluates the rules over new and changed rows only, keeps the rest, and
+    reports the difference as :class:`DecisionChanges`. A change of rules or
+    of the date re-evaluates everything, since ages move with the date.
+    """
+
+    def __init__(self):
+        self.rules: tuple[DecisionRule, ...] = ()
+        self.today: date | None = None
+        self.changes: DecisionChanges | None = None
+        self.updates = 0
+        self._fingerprints: dict[str, pd.Series] = {}
+        self._decisions = _empty_decisions()
+        self._lock = threading.Lock()
+
+    @property
+    def decisions(self) -> pd.DataFrame:
+        """Current decisions, as :func:`evaluate_rules` would return them."""
+        return self._decisions[DECISION_COLUMNS].reset_index(drop=True)
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self._decisions.memory_usage(deep=True).sum()
+            + sum(fp.memory_usage(deep=True) for fp in self._fingerprints.values())
+        )
+
+    def update(
+        self,
+        frames: dict[str, pd.DataFrame],
+        rules: tuple[DecisionRule, ...],
+        today: date | None = None,
+    ) -> DecisionChanges:
+        """Bring the decisions up to date with ``frames`` and return what changed."""
+        today = today or date.today()
+        with self._lock:
+            if rules != self.rules or today != self.today:
+                self.rules, self.today, self._fingerprints = rules, today, {}
+            updates = [
+                self._update_entity(entity, frames.get(entity), self._decisions)
+                for entity in ENTITIES
+            ]
+            fresh = [part for update in updates for part in update.fresh]
+            stale = _concat([update.stale for update in updates])
+            if fresh or not stale.empty or any(update.moved for update in updates):
+                self._decisions = _sorted_decisions([*(u.kept for u in updates), *fresh])
+            self.changes = _diff(stale, _concat(fresh))
+            self.updates += 1
+            return self.changes
+
+    def _update_entity(
+        self, entity: str, df: pd.DataFrame | None, previous: pd.DataFrame
+    ) -> _EntityUpdate:
+        before = previous[previous["entity"] == entity]
+        rules = [(index, rule) for index, rule in enumerate(self.rules) if rule.entity == entity]
+        if not rules or df is None or df.empty:
+            self._fingerprints.pop(entity, None)
+            return _EntityUpdate(before.iloc[:0], [], before)
+
+        columns = sorted(set().union(*(rule.columns for _, rule in rules)) & set(df.columns))
+        ids = pd.Index(df["id"])
+        fingerprints = pd.Series(
+            pd.util.hash_pandas_object(df[columns], index=False).to_numpy(), index=ids
+        )
+        known = self._fingerprints.get(entity)
+        self._fingerprints[entity] = fingerprints
+        if known is not None and ids.equals(known.index):
+            changed = fingerprints.to_numpy() != known.to_numpy()
+            dirty, moved = ids[changed], False
+        elif known is not None and ids.is_unique and known.index.is_unique:
+            changed = (fingerprints != known.reindex(ids)).to_numpy()
+            dirty, moved = ids[changed].append(known.index[~known.index.isin(ids)]), True
+            before = before.assign(position=ids.get_indexer(before["entity_id"]))
+        else:
+            changed = np.ones(len(df), dtype=bool)
+            return _EntityUpdate(before.iloc[:0], self._evaluate(df, changed, ids, rules), before)
+        stale = before["entity_id"].isin(dirty).to_numpy()
+        return _EntityUpdate(
+            before[~stale], self._evaluate(df, changed, ids, rules), before[stale], moved
+        )
+
+    def _evaluate(
+        self,
+        df: pd.DataFrame,
+        changed: np.ndarray,
+        ids: pd.Index,
+        rules: list[tuple[int, DecisionRule]],
+    ) -> list[pd.DataFrame]:
+        """Decisions of the ``changed`` rows, tagged with rule, row id and row position."""
+        rows = df[changed]
+        if rows.empty:
+            return []
+        row_ids = pd.Series(ids[changed], index=rows.index)
+        positions = pd.Series(np.flatnonzero(changed), index=rows.index)
+        fresh = []
+        for index, rule in rules:
+            part = rule.evaluate(rows, self.today)
+            if part.empty:
+                continue
+            # Built in one go, in column order, so parts concatenate without re-consolidating.
+            fresh.append(
+                pd.DataFrame(
+                    {
+                        **{column: part[column].to_numpy() for column in DECISION_COLUMNS},
+                        "rule": rule.name,
+                        "entity_id": row_ids.loc[part.index].to_numpy(),
+                        "entity": pd.Categorical.from_codes(
+                            np.full(len(part), ENTITIES.index(rule.entity)), categories=ENTITIES
+                        ),
+                        "rule_index": index,
+                        "position": positions.loc[part.index].to_numpy(),
+                    }
+                )
+            )
+        return fresh
+
+
+def _concat(parts: list[pd.DataFrame]) -> pd.DataFrame:
+    parts = [part for part in parts if not part.empty]
+    return pd.concat(parts, ignore_index=True) if parts else _empty_decisions()
+
+
+def _sorted_decisions(parts: list[pd.DataFrame]) -> pd.DataFrame:
+    """Decisions in :func:`evaluate_rules` order: severity, rule, then row position."""
+    decisions = _concat(parts)
+    order = np.lexsort(
+        (
+            decisions["position"].to_numpy(dtype=np.int64),
+            decisions["rule_index"].to_numpy(dtype=np.int64),
+            decisions["severity"].map(SEVERITY_RANK).to_numpy(dtype=np.int64),
+        )
+    )
+    decisions = decisions.take(order)
+    decisions.index = pd.RangeIndex(len(decisions))
+    return decisions
+
+
+def _diff(old: pd.DataFrame, new: pd.DataFrame) -> DecisionChanges:
+    old, new = old.set_index(_KEY), new.set_index(_KEY)
+    in_old = new.index.isin(old.index)
+    common = new[in_old]
+    differs = (
+        common[DECISION_COLUMNS].to_numpy() != old.loc[common.index, DECISION_COLUMNS].to_numpy()
+    ).any(axis=1)
+    return DecisionChanges(
+        added=new.loc[~in_old, DECISION_COLUMNS].reset_index(drop=True),
+        removed=old.loc[~old.index.isin(new.index), DECISION_COLUMNS].reset_index(drop=True),
+        changed=common.loc[differs, DECISION_COLUMNS].reset_index(drop=True),
+    )
@@ -3,13 +3,23 @@
 from dataclasses import dataclass
 from datetime import date, timedelta
 
+import numpy as np
+import pandas as pd
+
 from src.utils.constants import (
     DORA_BENCHMARKS,
-    MilestoneStatus,
+    RISK_LIKELIHOOD_WEIGHTS,
+    RISK_SEVERITY_WEIGHTS,
     ProgramStatus,
     RiskLikelihood,
     RiskSeverity,
 )
+from src.utils.decision_rules import (  # noqa: F401 (DECISION_COLUMNS re-exported)
+    DECISION_COLUMNS,
+    DecisionRule,
+    configured_rules,
+    evaluate_rules,
+)
 
 
 def current_quarter() -> str:
@@ -33,6 +43,56 @@ def quarter_date_range(quarter: str) -> tuple[date, date]:
     return start, end
 
 
+PROGRAM_STATUSES = [s.value for s in ProgramStatus]
+
+# RAG outcomes as positions in PROGRAM_STATUSES, checked in this order; the
+# last one is the fallback.
+_RAG_CODES = [
+    PROGRAM_STATUSES.index(s.value)
+    for s in (
+        ProgramStatus.COMPLETED,
+        ProgramStatus.ON_TRACK,
+        ProgramStatus.AT_RISK,
+        ProgramStatus.OFF_TRACK,
+    )
+]
+
+
+def _as_days(values) -> np.ndarray:
+    """Dates, timestamps or datetime64 values of any shape as ``datetime64[D]``."""
+    values = np.asarray(values)
+    if values.dtype.kind != "M":
+        values = np.asarray(pd.to_datetime(values.ravel())).reshape(values.shape)
+    return values.astype("datetime64[D]")
+
+
+def schedule_percent(start_date, target_end_date, when) -> np.ndarray:
+    """Percent of each schedule elapsed on ``when``, clipped to 0-100.
+
+    Arguments broadcast together, so one call covers every program on every
+    date (e.g. dates shaped ``(n, 1)`` against per-program arrays). A
+    schedule that starts and ends on the same day is 100% from that day on;
+    missing dates give NaN.
+    """
+    start, end, when = _as_days(start_date), _as_days(target_end_date), _as_days(when)
+    elapsed = (when - start) / np.timedelta64(1, "D")
+    length = (end - start) / np.timedelta64(1, "D")
+    elapsed, length = np.broadcast_arrays(elapsed, length)
+    percent = np.divide(
+        elapsed * 100, length, out=np.where(elapsed >= 0, 100.0, 0.0), where=length > 0
+    )
+    percent = np.where(np.isnan(elapsed) | np.isnan(length), np.nan, percent)
+    return np.clip(percent, 0, 100)
+
+
+def rag_status_codes(percent_complete, target_percent) -> np.ndarray:
+    """Vectorized :func:`rag_status`: int8 positions in :data:`PROGRAM_STATUSES`."""
+    percent = np.asarray(percent_complete, dtype=np.float64)
+    gap = np.asarray(target_percent, dtype=np.float64) - percent
+    conditions = [percent >= 100, gap <= 10, gap <= 25]
+    return np.select(conditions, _RAG_CODES[:3], default=_RAG_CODES[3]).astype(np.int8)
+
+
 def rag_status(percent_complete: float, target_percent: float) -> ProgramStatus:
     """Determine RAG status based on completion vs target.
 
@@ -40,32 +100,20 @@ def rag_status(percent_complete: float, target_percent: float) -> ProgramStatus:
     - At Risk: 10-25% behind target
     - Off Track: >25% behind target
     - Completed: 100%
+
+    For whole frames use :func:`rag_status_codes` (or the loader's
+    ``schedule_status`` column) instead of calling this per row.
     """
-    if percent_complete >= 100:
-        return ProgramStatus.COMPLETED
-    gap = target_percent - percent_complete
-    if gap <= 10:
-        return ProgramStatus.ON_TRACK
-    elif gap <= 25:
-        return ProgramStatus.AT_RISK
-    else:
-        return ProgramStatus.OFF_TRACK
+    return ProgramStatus(PROGRAM_STATUSES[int(rag_status_codes(percent_complete, target_percent))])
 
 
 def risk_score(severity: RiskSeverity, likelihood: RiskLikelihood) -> int:
-    """Calculate numeric risk score (1-16) from severity and likelihood."""
-    severity_map = {
-        RiskSeverity.LOW: 1,
-        RiskSeverity.MEDIUM: 2,
-        RiskSeverity.HIGH: 3,
-        RiskSeverity.CRITICAL: 4,
-    }
-    likelihood_map = {
-        RiskLikelihood.LOW: 1,
-        RiskLikelihood.MEDIUM: 2,
-        RiskLikelihood.HIGH: 3,
-    }
-    return severity_map[severity] * likelihood_map[likelihood]
+    """Calculate numeric risk score (1-12) from severity and likelihood.
+
+    For whole frames use the loader's ``risk_score`` column
+    (``schema.risk_scores``) instead of calling this per row.
+    """
+    return RISK_SEVERITY_WEIGHTS[severity] * RISK_LIKELIHOOD_WEIGHTS[likelihood]
 
 
 def days_until(target: date) -> int:
@@ -109,6 +157,42 @@ def format_percent_delta(current: float, previous: float) -> str | None:
 # ---------------------------------------------------------------------------
 
 
+DORA_LEVELS = ["Low", "Medium", "High", "Elite"]
+
+# Whether a larger value is better, per benchmarked metric.
+_DORA_HIGHER_IS_BETTER = {
+    "deployment_frequency": True,
+    "lead_time_days": False,
+    "change_failure_rate": False,
+    "mttr_hours": False,
+}
+
+
+def dora_maturity_codes(metrics) -> np.ndarray:
+    """Weakest-link DORA maturity for arrays of metric values.
+
+    ``metrics`` maps each benchmarked metric to an array (a DataFrame works);
+    the arrays broadcast together. Returns int8 positions in
+    :data:`DORA_LEVELS`, 0 (Low) to 3 (Elite). Boundaries are inclusive and a
+    NaN value rates Low, as in :func:`classify_dora_maturity`.
+    """
+    codes = None
+    for metric, higher_is_better in _DORA_HIGHER_IS_BETTER.items():
+        values = np.asarray(metrics[metric], dtype=np.float64)
+        bands = DORA_BENCHMARKS[metric]
+        if higher_is_better:
+            # Count of thresholds met: value >= medium, high, elite.
+            edges = [bands["medium"], bands["high"], bands["elite"]]
+            level = np.searchsorted(edges, values, side="right")
+        else:
+            # Count of thresholds missed: value > elite, high, medium.
+            edges = [bands["elite"], bands["high"], bands["medium"]]
+            level = 3 - np.searchsorted(edges, values, side="left")
+        level = np.where(np.isnan(values), 0, level)
+        codes = level if codes is None else np.minimum(codes, level)
+    return codes.astype(np.int8)
+
+
 def classify_dora_maturity(
     deploy_freq: float,
     lead_time: float,
@@ -119,39 +203,26 @@ def classify_dora_maturity(
 
     Returns one of: 'Elite', 'High', 'Medium', 'Low'.
     """
-    benchmarks = DORA_BENCHMARKS
-
-    def _classify_metric(value: float, metric: str, higher_is_better: bool) -> str:
-        thresholds = benchmarks[metric]
-        if higher_is_better:
-            if value >= thresholds["elite"]:
-                return "Elite"
-            elif value >= thresholds["high"]:
-                return "High"
-            elif value >= thresholds["medium"]:
-                return "Medium"
-            else:
-                return "Low"
-        else:
-            if value <= thresholds["elite"]:
-                return "Elite"
-            elif value <= thresholds["high"]:
-                return "High"
-            elif value <= thresholds["medium"]:
-                return "Medium"
-            else:
-                return "Low"
-
-    levels = [
-        _classify_metric(deploy_freq, "deployment_frequency", higher_is_better=True),
-        _classify_metric(lead_time, "lead_time_days", higher_is_better=False),
-        _classify_metric(cfr, "change_failure_rate", higher_is_better=False),
-        _classify_metric(mttr, "mttr_hours", higher_is_better=False),
-    ]
-
-    rank = {"Elite": 3, "High": 2, "Medium": 1, "Low": 0}
-    weakest = min(levels, key=lambda lvl: rank[lvl])
-    return weakest
+    code = dora_maturity_codes(
+        {
+            "deployment_frequency": deploy_freq,
+            "lead_time_days": lead_time,
+            "change_failure_rate": cfr,
+            "mttr_hours": mttr,
+        }
+    )
+    return DORA_LEVELS[int(code)]
+
+
+def classify_dora_frame(metrics: pd.DataFrame) -> pd.Series:
+    """Maturity level of every row of a frame with the four DORA columns.
+
+    Returns an ordered categorical (Low < Medium < High < Elite) aligned to
+    ``metrics.index``.
+    """
+    codes = dora_maturity_codes(metrics)
+    levels = pd.Categorical.from_codes(codes, DORA_LEVELS, ordered=True)
+    return pd.Series(levels, index=metrics.index, name="maturity")
 
 
 # ---------------------------------------------------------------------------
@@ -169,86 +240,42 @@ class DecisionItem:
     recommendation: str
 
 
-def generate_decisions(
-    programs_df,
-    risks_df,
-    milestones_df,
-    escalations_df,
-) -> list[DecisionItem]:
-    """Generate actionable decisions from current data.
+def decisions_frame(
+    programs_df: pd.DataFrame,
+    risks_df: pd.DataFrame,
+    milestones_df: pd.DataFrame,
+    escalations_df: pd.DataFrame,
+    today: date | None = None,
+    rules: tuple[DecisionRule, ...] | None = None,
+) -> pd.DataFrame:
+    """Actionable decisions from current data, one row per decision.
+
+    Evaluates ``rules`` (the current tenant's configured rules by default,
+    see :mod:`src.utils.decision_rules`). The built-in rules are:
 
-    Rules:
     - OFF_TRACK programs -> "Re-scope or add resources"
+    - CRITICAL+HIGH likelihood open risks -> "Accept, mitigate, or transfer"
     - Open escalations >30 days -> "Escalate to next level"
-    - CRITICAL+HIGH likelihood risks -> "Accept, mitigate, or transfer"
     - BLOCKED milestones -> "Unblock milestone"
+
+    Rows keep rule order within each severity, most severe first. Columns are
+    :data:`DECISION_COLUMNS`.
     """
-    decisions = []
-    today = date.today()
+    frames = {
+        "programs": programs_df,
+        "risks": risks_df,
+        "milestones": milestones_df,
+        "escalations": escalations_df,
+    }
+    return evaluate_rules(configured_rules() if rules is None else rules, frames, today)
+
 
-    # OFF_TRACK programs
-    off_track = programs_df[programs_df["status"] == ProgramStatus.OFF_TRACK.value]
-    for _, row in off_track.iterrows():
-        decisions.append(
-            DecisionItem(
-                severity="critical",
-                program=row["name"],
-                title=f"{row['name']} is off track at {row['percent_complete']:.0f}%",
-                recommendation="Re-scope deliverables or add resources",
-            )
-        )
-
-    # CRITICAL severity + HIGH likelihood open risks
-    if not risks_df.empty:
-        critical_risks = risks_df[
-            (risks_df["is_open"] == True)
-            & (risks_df["severity"] == RiskSeverity.CRITICAL.value)
-            & (risks_df["likelihood"] == RiskLikelihood.HIGH.value)
-        ]
-        for _, row in critical_risks.iterrows():
-            prog_name = row.get("program_id", "Unknown")
-            decisions.append(
-                DecisionItem(
-                    severity="critical",
-                    program=prog_name,
-                    title=f"Critical risk: {row['title']}",
-                    recommendation="Accept, mitigate, or transfer risk",
-                )
-            )
-
-    # Open escalations > 30 days
-    if not escalations_df.empty:
-        open_esc = escalations_df[escalations_df["resolved_date"].isna()].copy()
-        for _, row in open_esc.iterrows():
-            raised = row["raised_date"]
-            if hasattr(raised, "date"):
-                raised = raised.date()
-            age = (today - raised).days
-            if age > 30:
-                decisions.append(
-                    DecisionItem(
-                        severity="high",
-                        program=row.get("program_id", "Unknown"),
-                        title=f"Escalation open {age} days: {row['title']}",
-                        recommendation="Escalate to next level",
-                    )
-                )
-
-    # BLOCKED milestones
-    if not milestones_df.empty:
-        blocked = milestones_df[milestones_df["status"] == MilestoneStatus.BLOCKED.value]
-        for _, row in blocked.iterrows():
-            decisions.append(
-                DecisionItem(
-                    severity="high",
-                    program=row.get("program_id", "Unknown"),
-                    title=f"Blocked milestone: {row['name']}",
-                    recommendation=f"Unblock milestone for {row.get('program_id', 'program')}",
-                )
-            )
-
-    # Sort by severity
-    severity_rank = {"critical": 0, "high": 1, "medium": 2}
-    decisions.sort(key=lambda d: severity_rank.get(d.severity, 3))
-
-    return decisions
+def generate_decisions(
+    programs_df,
+    risks_df,
+    milestones_df,
+    escalations_df,
+) -> list[DecisionItem]:
+    """:func:`decisions_frame` as a list of :class:`DecisionItem`."""
+    frame = decisions_frame(programs_df, risks_df, milestones_df, escalations_df)
+    return [DecisionItem(*row) for row in frame.itertuples(index=False, name=None)]
@@ -1,6 +1,7 @@
 """Shared test fixtures."""
 
 import pytest
+import yaml
 
 from src.data.mock_data import (
     get_escalations,
@@ -10,6 +11,7 @@ from src.data.mock_data import (
     get_risks,
     get_weekly_snapshots,
 )
+from src.utils import config
 
 
 @pytest.fixture
@@ -40,3 +42,24 @@ def metrics():
 @pytest.fixture
 def weekly_snapshots():
     return get_weekly_snapshots()
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    """Point the app at a temporary settings file.
+
+    ``settings({...})`` writes the file and reloads it, so every cache built
+    from the previous settings is dropped. The real settings are reloaded
+    after the test.
+    """
+    path = tmp_path / "settings.yaml"
+    monkeypatch.setattr(config, "_DEFAULT_PATH", path)
+
+    def write(values: dict) -> dict:
+        path.write_text(yaml.safe_dump(values))
+        return config.reload_config()
+
+    write({})
+    yield write
+    monkeypatch.undo()
+    config.reload_config()
@@ -0,0 +1,41 @@
+"""Tests for the vectorized weekly snapshot aggregation."""
+
+import pandas as pd
+
+from src.data.aggregation import weekly_snapshots
+from src.data.mock_data import get_status_history
+from src.data.schema import METRIC_SCHEMA, apply_schema
+from src.data.sources import fetch_dataset
+from src.data.status_history import TRANSITION_COLUMNS, StatusHistory
+
+
+def _metrics():
+    return fetch_dataset("metrics")
+
+
+class TestWeeklySnapshots:
+    def test_totals_match_groupby(self):
+        metrics = _metrics()
+        snapshots = weekly_snapshots(metrics, get_status_history())
+        first = metrics[metrics["week_start"] == metrics["week_start"].min()]
+        row = snapshots.iloc[0]
+        assert row["total_defects"] == first["defect_count"].sum()
+        assert abs(row["total_velocity"] - first["velocity"].astype(float).sum()) < 0.06
+        assert abs(row["avg_mttr_hours"] - first["mttr_hours"].astype(float).mean()) < 0.06
+
+    def test_status_counts_cover_all_programs(self):
+        snapshots = weekly_snapshots(_metrics(), get_status_history())
+        totals = snapshots[["programs_on_track", "programs_at_risk", "programs_off_track"]]
+        # The remaining program each week is Completed.
+        assert (totals.sum(axis=1) <= 6).all()
+        assert snapshots["week_start"].is_monotonic_increasing
+
+    def test_empty_metrics(self):
+        empty = apply_schema(pd.DataFrame(columns=list(METRIC_SCHEMA)), "metrics")
+        history = StatusHistory(pd.DataFrame(columns=TRANSITION_COLUMNS))
+        snapshots = weekly_snapshots(empty, history)
+        assert snapshots.empty
+        assert snapshots["total_defects"].dtype == "int32"
+
+    def test_available_for_every_source_via_fetch(self):
+        assert len(fetch_dataset("weekly_snapshots")) == _metrics()["week_start"].nunique()
@@ -9,15 +9,23 @@ from src.components.charts import (
     completion_bar_chart,
     defect_incident_trend,
     delivery_predictability,
+    dora_maturity_trend,
     dora_metrics_chart,
     gantt_chart,
     milestone_status_bar,
     program_status_donut,
     risk_heatmap,
     risk_trend,
+    schedule_status_trend,
     velocity_trend,
 )
-from src.data.mock_data import get_metrics, get_milestones, get_programs, get_risks
+from src.data.mock_data import (
+    get_metrics,
+    get_milestones,
+    get_programs,
+    get_risks,
+    get_status_history,
+)
 
 
 def _programs_df():
@@ -79,6 +87,10 @@ class TestChartRendering:
         fig = dora_metrics_chart(_metrics_df())
         assert fig is not None
 
+    def test_dora_maturity_trend(self):
+        fig = dora_maturity_trend(_metrics_df())
+        assert len(fig.data) == 4
+
     def test_defect_incident_trend(self):
         fig = defect_incident_trend(_metrics_df())
         assert fig is not None
@@ -95,3 +107,9 @@ class TestChartRendering:
     def test_budget_utilization_bar(self):
         fig = budget_utilization_bar(_programs_df())
         assert fig is not None
+
+    def test_schedule_status_trend(self):
+        dates = pd.date_range("2025-01-01", periods=8, freq="MS")
+        fig = schedule_status_trend(get_status_history().counts(dates))
+        assert len(fig.data) > 0
+        assert schedule_status_trend(pd.DataFrame()) is not None
@@ -0,0 +1,121 @@
+"""Tests for the data loader's queries over the mock source."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.data import data_loader
+from src.data.data_loader import (
+    count_rows,
+    history_start,
+    load_as_of,
+    load_hierarchy,
+    load_metrics,
+    load_metrics_cube,
+    load_milestones,
+    load_portfolio_tree,
+    load_programs,
+    load_risks,
+    load_rollup,
+    load_schedule_history,
+    query,
+)
+from src.data.hierarchy import PortfolioTree
+from src.data.query_spec import QuerySpec
+from src.data.sources import fetch_dataset
+from src.utils.config import current_tenant
+from src.utils.helpers import rag_status, schedule_percent
+
+
+def _rated(programs, program_id: str, dates) -> list[str]:
+    """Reference schedule status of one program row on each of ``dates``."""
+    row = programs.set_index("id").loc[program_id]
+    target = schedule_percent(row["start_date"], row["target_end_date"], dates)
+    return [rag_status(row["percent_complete"], t).value for t in target]
+
+
+class TestCountRows:
+    def test_counts_whole_dataset(self, settings):
+        assert count_rows("milestones") == len(load_milestones())
+        assert count_rows("risks") == len(load_risks())
+
+    def test_ignores_page_filters(self, settings):
+        filtered = query("milestones", QuerySpec(program_ids=["PRG-001"]))
+        assert 0 < len(filtered) < count_rows("milestones")
+
+
+class TestLoadAsOf:
+    def test_reads_each_snapshot_as_of_its_day(self, settings, tmp_path):
+        settings({"history": {"path": str(tmp_path / "history.sqlite")}})
+        before = fetch_dataset("programs")
+        after = before.copy()
+        after.loc[0, "percent_complete"] = 99.0
+        data_loader._history().record("programs", before, date(2025, 1, 1))
+        data_loader._history().record("programs", after, date(2025, 2, 1))
+
+        assert history_start() == date(2025, 1, 1)
+        january = load_as_of("programs", date(2025, 1, 31))
+        february = load_as_of("programs", date(2025, 2, 1))
+        assert january["percent_complete"].tolist() == before["percent_complete"].tolist()
+        assert february["percent_complete"].tolist() == after["percent_complete"].tolist()
+        assert "schedule_status" in february.columns
+        assert load_as_of("programs", date(2024, 12, 31)).empty
+
+    def test_requires_history(self, settings):
+        assert history_start() is None
+        with pytest.raises(RuntimeError, match="history.path"):
+            load_as_of("programs", date(2025, 1, 1))
+
+
+class TestLoadScheduleHistory:
+    _DATES = [date(2025, 1, 1), date(2025, 4, 1), date(2025, 7, 1)]
+    _IDS = ["PRG-002", "PRG-006"]
+
+    def test_rates_current_programs_without_history(self, settings):
+        grid = load_schedule_history(self._DATES).status_grid(self._DATES, self._IDS)
+        for pid in self._IDS:
+            assert grid[pid].tolist() == _rated(load_programs(), pid, self._DATES)
+
+    def test_rates_each_date_on_its_snapshot(self, settings, tmp_path):
+        settings({"history": {"path": str(tmp_path / "history.sqlite")}})
+        before = fetch_dataset("programs")
+        stalled = before.copy()
+        stalled.loc[stalled["id"] == "PRG-002", "percent_complete"] = 0.0
+        data_loader._history().record("programs", before, date(2025, 3, 1))
+        data_loader._history().record("programs", stalled, date(2025, 6, 1))
+
+        grid = load_schedule_history(self._DATES).status_grid(self._DATES, self._IDS)
+        # January precedes the first snapshot, so it is rated on that snapshot.
+        assert grid["PRG-002"].tolist() == [
+            *_rated(before, "PRG-002", self._DATES[:2]),
+            *_rated(stalled, "PRG-002", self._DATES[2:]),
+        ]
+        assert grid["PRG-006"].tolist() == ["Completed"] * 3
+
+
+class TestLoadPortfolioTree:
+    def test_reloaded_data_updates_the_cached_tree(self, settings):
+        tree = load_portfolio_tree()
+        data_loader._tenant_cache().invalidate(current_tenant(), "risks")
+        assert load_portfolio_tree() is tree
+        expected = PortfolioTree.from_frames(load_hierarchy(), load_risks(), load_milestones())
+        pd.testing.assert_frame_equal(tree.frame(), expected.frame())
+
+
+class TestLoadRollup:
+    def test_rebuilt_once_per_data_refresh(self, settings):
+        rollup = load_rollup()
+        assert load_rollup() is rollup
+        data_loader._tenant_cache().invalidate(current_tenant(), "programs")
+        assert load_rollup() is not rollup
+
+
+class TestLoadMetricsCube:
+    def test_follows_the_metrics_frame(self, settings):
+        cube = load_metrics_cube()
+        assert load_metrics_cube() is cube
+        data_loader._tenant_cache().invalidate(current_tenant(), "metrics")
+        rebuilt = load_metrics_cube()
+        assert rebuilt is not cube
+        assert rebuilt.program_ids == sorted(load_metrics()["program_id"].astype(str).unique())
@@ -0,0 +1,174 @@
+"""Tests for config-driven decision rules."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.utils import config, decision_rules
+from src.utils.decision_rules import DecisionTracker, compile_rule, configured_rules, evaluate_rules
+
+TODAY = date(2026, 3, 1)
+
+
+def _risks() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "program_id": ["PRG-001", "PRG-002", "PRG-003"],
+            "title": ["Vendor exit", "Key hire", "Audit"],
+            "severity": pd.Categorical(["High", "Critical", "High"]),
+            "is_open": [True, True, False],
+            "owner": ["Ana", "Ben", "Cy"],
+            "raised_date": pd.to_datetime(["2025-12-01", "2026-02-20", "2025-11-01"]),
+        }
+    )
+
+
+def _rule(**spec) -> dict:
+    return {
+        "name": "test",
+        "entity": "risks",
+        "severity": "medium",
+        "title": "{title}",
+        "recommendation": "Review with {owner}",
+        **spec,
+    }
+
+
+class TestCompileRule:
+    def test_comparisons_and_derived_age(self):
+        rule = compile_rule(
+            _rule(
+                when={"is_open": True, "age_days": {"gt": 60}},
+                title="Risk open {age_days} days: {title}",
+            )
+        )
+        frame = evaluate_rules([rule], {"risks": _risks()}, TODAY)
+        assert frame.to_dict("records") == [
+            {
+                "severity": "medium",
+                "program": "PRG-001",
+                "title": "Risk open 90 days: Vendor exit",
+                "recommendation": "Review with Ana",
+            }
+        ]
+
+    def test_membership_and_negation(self):
+        rule = compile_rule(
+            _rule(when={"severity": ["High", "Critical"], "owner": {"not_in": ["Ben"]}})
+        )
+        frame = evaluate_rules([rule], {"risks": _risks()}, TODAY)
+        assert frame["title"].tolist() == ["Vendor exit", "Audit"]
+
+    def test_format_spec(self):
+        programs = pd.DataFrame({"name": ["Atlas"], "percent_complete": [33.4]})
+        rule = compile_rule(
+            _rule(
+                entity="programs",
+                when={},
+                title="{name} at {percent_complete:.1f}%",
+                recommendation="Review",
+            )
+        )
+        frame = evaluate_rules([rule], {"programs": programs}, TODAY)
+        assert frame["program"].tolist() == ["Atlas"]
+        assert frame["title"].tolist() == ["Atlas at 33.4%"]
+
+    def test_sorted_by_severity_then_rule_order(self):
+        rules = [
+            compile_rule(_rule(name="m", when={"owner": "Ana"})),
+            compile_rule(_rule(name="c", severity="critical", when={"owner": "Cy"})),
+            compile_rule(_rule(name="h", severity="high", when={"owner": "Ben"})),
+        ]
+        frame = evaluate_rules(rules, {"risks": _risks()}, TODAY)
+        assert frame["title"].tolist() == ["Audit", "Key hire", "Vendor exit"]
+
+    @pytest.mark.parametrize(
+        "spec, message",
+        [
+            ({"entity": "budgets"}, "entity"),
+            ({"severity": "urgent"}, "severity"),
+            ({"when": {"owner": {"like": "A%"}}}, "like"),
+        ],
+    )
+    def test_invalid_rules(self, spec, message):
+        with pytest.raises(ValueError, match=message):
+            compile_rule(_rule(**spec))
+
+    def test_unknown_column(self):
+        rule = compile_rule(_rule(when={"budget": 1}))
+        with pytest.raises(ValueError, match="budget"):
+            evaluate_rules([rule], {"risks": _risks()}, TODAY)
+
+
+class TestConfiguredRules:
+    def test_configured_rules_follow_builtins(self, settings):
+        settings({"decisions": {"rules": [_rule(name="org")]}})
+        names = [rule.name for rule in configured_rules()]
+        assert names[: len(decision_rules.BUILTIN_RULES)] == [
+            spec["name"] for spec in decision_rules.BUILTIN_RULES
+        ]
+        assert names[-1] == "org"
+        assert configured_rules() is configured_rules()
+
+    def test_builtins_can_be_disabled_per_tenant(self, settings):
+        settings(
+            {
+                "tenants": {
+                    "emea": {"decisions": {"builtin_rules": False, "rules": [_rule(name="org")]}}
+                }
+            }
+        )
+        with config.tenant_scope("emea"):
+            assert [rule.name for rule in configured_rules()] == ["org"]
+        assert len(configured_rules()) == len(decision_rules.BUILTIN_RULES)
+
+
+class TestDecisionTracker:
+    RULES = (
+        compile_rule(_rule(name="open", when={"is_open": True})),
+        compile_rule(_rule(name="critical", severity="critical", when={"severity": "Critical"})),
+    )
+
+    @staticmethod
+    def _frames(risks: pd.DataFrame) -> dict:
+        return {"risks": risks.assign(id=[f"RSK-{i}" for i in risks.index])}
+
+    def test_first_update_adds_everything(self):
+        frames = self._frames(_risks())
+        tracker = DecisionTracker()
+        changes = tracker.update(frames, self.RULES, TODAY)
+        assert tracker.decisions.equals(evaluate_rules(self.RULES, frames, TODAY))
+        assert len(changes.added) == 3
+        assert not tracker.update(frames, self.RULES, TODAY)
+
+    def test_reports_changes_and_matches_full_evaluation(self):
+        tracker = DecisionTracker()
+        tracker.update(self._frames(_risks()), self.RULES, TODAY)
+        risks = _risks()
+        risks.loc[0, "is_open"] = False  # "open" decision removed
+        risks.loc[1, "title"] = "Key hires"  # both decisions changed
+        risks.loc[2, "severity"] = "Critical"  # "critical" decision added
+        frames = self._frames(risks)
+        changes = tracker.update(frames, self.RULES, TODAY)
+        assert changes.removed["title"].tolist() == ["Vendor exit"]
+        assert changes.added["title"].tolist() == ["Audit"]
+        assert sorted(changes.changed["title"]) == ["Key hires", "Key hires"]
+        assert tracker.decisions.equals(evaluate_rules(self.RULES, frames, TODAY))
+
+    def test_removed_and_reordered_rows(self):
+        tracker = DecisionTracker()
+        tracker.update(self._frames(_risks()), self.RULES, TODAY)
+        frames = {"risks": self._frames(_risks())["risks"].iloc[[2, 1]]}
+        changes = tracker.update(frames, self.RULES, TODAY)
+        assert changes.removed["title"].tolist() == ["Vendor exit"]
+        assert changes.added.empty and changes.changed.empty
+        assert tracker.decisions.equals(evaluate_rules(self.RULES, frames, TODAY))
+
+    def test_new_day_re_evaluates_ages(self):
+        rules = (compile_rule(_rule(name="age", title="{age_days}")),)
+        frames = self._frames(_risks())
+        tracker = DecisionTracker()
+        tracker.update(frames, rules, TODAY)
+        changes = tracker.update(frames, rules, date(2026, 3, 2))
+        assert len(changes.changed) == 3
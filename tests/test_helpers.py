@@ -2,25 +2,33 @@
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
+from src.data.synthetic import generate_portfolio
 from src.utils.constants import (
+    DORA_BENCHMARKS,
     MilestoneStatus,
     ProgramStatus,
     RiskLikelihood,
     RiskSeverity,
 )
 from src.utils.helpers import (
+    classify_dora_frame,
     classify_dora_maturity,
     current_quarter,
     days_until,
+    decisions_frame,
+    dora_maturity_codes,
     format_delta,
     format_percent_delta,
     generate_decisions,
     percent_change,
     quarter_date_range,
     rag_status,
+    rag_status_codes,
     risk_score,
+    schedule_percent,
 )
 
 
@@ -59,6 +67,30 @@ class TestRagStatus:
     def test_off_track(self):
         assert rag_status(40, 75) == ProgramStatus.OFF_TRACK
 
+    def test_codes_match_scalar(self):
+        percent, target = np.meshgrid(np.arange(0, 101, 2.5), np.arange(0, 101, 2.5))
+        codes = rag_status_codes(percent, target)
+        statuses = list(ProgramStatus)
+        for p, t, code in zip(percent.ravel(), target.ravel(), codes.ravel()):
+            assert statuses[code] == rag_status(p, t)
+
+
+class TestSchedulePercent:
+    def test_elapsed_share_clipped(self):
+        start, end = date(2025, 1, 1), date(2025, 4, 11)
+        whens = [date(2024, 12, 1), date(2025, 2, 10), date(2026, 1, 1)]
+        assert schedule_percent(start, end, whens).tolist() == [0.0, 40.0, 100.0]
+
+    def test_broadcasts_programs_against_dates(self):
+        starts = pd.Series(pd.to_datetime(["2025-01-01", "2025-02-01", None]))
+        ends = pd.Series(pd.to_datetime(["2025-04-11", "2025-02-01", "2025-06-01"]))
+        whens = pd.to_datetime(["2025-01-31", "2025-02-10"]).to_numpy()[:, None]
+        grid = schedule_percent(starts, ends, whens)
+        assert grid.shape == (2, 3)
+        # Same-day schedules are due in full from that day on; missing dates give NaN
+        assert grid[:, 1].tolist() == [0.0, 100.0]
+        assert np.isnan(grid[:, 2]).all()
+
 
 class TestRiskScore:
     def test_low_low(self):
@@ -147,6 +179,42 @@ class TestClassifyDoraMaturity:
         )
         assert level == "Medium"
 
+    def test_thresholds_are_inclusive(self):
+        elite = {
+            "deployment_frequency": 100.0,
+            "lead_time_days": 0.0,
+            "change_failure_rate": 0.0,
+            "mttr_hours": 0.0,
+        }
+        for metric, bands in DORA_BENCHMARKS.items():
+            for code, band in enumerate(["medium", "high", "elite"], start=1):
+                values = {**elite, metric: bands[band]}
+                assert dora_maturity_codes(values) == code
+                # Just past the threshold on the wrong side drops a level
+                step = -1e-6 if metric == "deployment_frequency" else 1e-6
+                values[metric] = bands[band] + step
+                assert dora_maturity_codes(values) == code - 1
+
+    def test_nan_rates_low(self):
+        level = classify_dora_maturity(deploy_freq=10.0, lead_time=float("nan"), cfr=3.0, mttr=0.5)
+        assert level == "Low"
+
+    def test_frame_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        frame = pd.DataFrame(
+            {
+                "deployment_frequency": rng.uniform(0, 10, 500),
+                "lead_time_days": rng.uniform(0, 40, 500),
+                "change_failure_rate": rng.uniform(0, 20, 500),
+                "mttr_hours": rng.uniform(0, 200, 500),
+            }
+        )
+        levels = classify_dora_frame(frame)
+        expected = [classify_dora_maturity(*row) for row in frame.itertuples(index=False)]
+        assert list(levels.astype(str)) == expected
+        assert levels.cat.ordered
+        assert levels.min() == "Low"
+
 
 class TestGenerateDecisions:
     def _make_programs_df(self, statuses):
@@ -196,6 +264,26 @@ class TestGenerateDecisions:
         )
         assert any("Blocked" in d.title for d in decisions)
 
+    def test_stale_escalation_generates_decision(self):
+        programs = self._make_programs_df([ProgramStatus.ON_TRACK])
+        escalations = pd.DataFrame(
+            [
+                {
+                    "resolved_date": pd.NaT,
+                    "raised_date": pd.Timestamp(date.today()) - pd.Timedelta(days=45),
+                    "title": "Vendor blocked",
+                    "program_id": "PRG-000",
+                }
+            ]
+        )
+        decisions = generate_decisions(
+            programs,
+            self._empty_df(["severity", "likelihood", "is_open", "title", "program_id"]),
+            self._empty_df(["status", "name", "program_id"]),
+            escalations,
+        )
+        assert [d.title for d in decisions] == ["Escalation open 45 days: Vendor blocked"]
+
     def test_clean_state_empty(self):
         programs = self._make_programs_df([ProgramStatus.ON_TRACK])
         decisions = generate_decisions(
@@ -205,3 +293,68 @@ class TestGenerateDecisions:
             self._empty_df(["resolved_date", "raised_date", "title", "program_id"]),
         )
         assert len(decisions) == 0
+
+    def test_frame_orders_by_severity_then_rule(self):
+        programs = self._make_programs_df([ProgramStatus.OFF_TRACK, ProgramStatus.ON_TRACK])
+        risks = pd.DataFrame(
+            [
+                {
+                    "severity": RiskSeverity.CRITICAL.value,
+                    "likelihood": RiskLikelihood.HIGH.value,
+                    "is_open": True,
+                    "title": "Vendor exit",
+                    "program_id": "PRG-001",
+                },
+                {
+                    "severity": RiskSeverity.CRITICAL.value,
+                    "likelihood": RiskLikelihood.HIGH.value,
+                    "is_open": False,
+                    "title": "Closed",
+                    "program_id": "PRG-001",
+                },
+            ]
+        )
+        milestones = pd.DataFrame(
+            [
+                {
+                    "status": MilestoneStatus.BLOCKED.value,
+                    "name": "Cutover",
+                    "program_id": "PRG-001",
+                }
+            ]
+        )
+        escalations = pd.DataFrame(
+            [
+                {
+                    "resolved_date": pd.NaT,
+                    "raised_date": pd.Timestamp(2026, 1, 1),
+                    "title": "Budget freeze",
+                    "program_id": "PRG-000",
+                }
+            ]
+        )
+        frame = decisions_frame(programs, risks, milestones, escalations, today=date(2026, 2, 15))
+        assert list(frame.columns) == ["severity", "program", "title", "recommendation"]
+        assert frame["title"].tolist() == [
+            "Program 0 is off track at 30%",
+            "Critical risk: Vendor exit",
+            "Escalation open 45 days: Budget freeze",
+            "Blocked milestone: Cutover",
+        ]
+        assert frame["severity"].tolist() == ["critical", "critical", "high", "high"]
+        assert frame["recommendation"].iloc[3] == "Unblock milestone for PRG-001"
+
+    def test_frame_on_categorical_columns(self):
+        frames = generate_portfolio(programs=300, weeks=2)
+        programs = frames["programs"]
+        frame = decisions_frame(
+            programs, frames["risks"], frames["milestones"], frames["escalations"]
+        )
+        off_track = programs[programs["status"] == ProgramStatus.OFF_TRACK.value]
+        assert frame["program"].head(len(off_track)).tolist() == off_track["name"].tolist()
+        assert frame["severity"].is_monotonic_increasing  # "critical" < "high"
+        assert len(
+            generate_decisions(
+                programs, frames["risks"], frames["milestones"], frames["escalations"]
+            )
+        ) == len(frame)
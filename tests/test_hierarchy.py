@@ -0,0 +1,120 @@
+"""Tests for the portfolio hierarchy and its bottom-up rollups."""
+
+import pandas as pd
+import pytest
+
+from src.data.hierarchy import PortfolioTree
+from src.data.schema import add_derived_columns
+from src.data.sources import fetch_dataset
+
+
+def _nested() -> pd.DataFrame:
+    """A portfolio with one program split into a sub-portfolio of two projects and a project."""
+    rows = [
+        ("ROOT", None, "Portfolio", None, None, 0.0),
+        ("PRG-001", "ROOT", "Program", "PRG-001", None, 0.0),
+        ("PF-1", "PRG-001", "Portfolio", "PRG-001", None, 0.0),
+        ("PRJ-1", "PF-1", "Project", "PRG-001", 20.0, 1.0),
+        ("PRJ-2", "PF-1", "Project", "PRG-001", 60.0, 2.0),
+        ("PRJ-3", "PRG-001", "Project", "PRG-001", 100.0, 3.0),
+        ("PRG-002", "ROOT", "Program", "PRG-002", 50.0, 4.0),
+    ]
+    columns = ["id", "parent_id", "level", "program_id", "percent_complete", "budget_millions"]
+    df = pd.DataFrame(rows, columns=columns)
+    df["name"] = df["id"]
+    return df
+
+
+class TestPortfolioTree:
+    def test_rolls_up_bottom_up(self):
+        tree = PortfolioTree(_nested())
+        assert tree.node("PF-1")["budget_millions"] == 3.0
+        assert tree.node("PF-1")["percent_complete"] == pytest.approx(40.0)
+        assert tree.node("PRG-001")["percent_complete"] == pytest.approx(60.0)
+        assert tree.node("ROOT")["budget_millions"] == 10.0
+        assert tree.node("ROOT")["leaves"] == 4
+
+    def test_update_touches_only_ancestors(self):
+        tree = PortfolioTree(_nested())
+        touched = tree.update("PRJ-1", percent_complete=80.0, budget_millions=5.0)
+        assert set(touched) == {"PRJ-1", "PF-1", "PRG-001", "ROOT"}
+        assert tree.node("PF-1")["percent_complete"] == pytest.approx(70.0)
+        assert tree.node("ROOT")["budget_millions"] == 14.0
+        assert tree.node("PRG-002")["budget_millions"] == 4.0
+
+    def test_incremental_matches_rebuild(self):
+        tree = PortfolioTree(_nested())
+        tree.update_many(pd.DataFrame({"budget_millions": [7.0, 0.5]}, index=["PRJ-2", "PRG-002"]))
+        rebuilt = _nested().set_index("id")
+        rebuilt.loc["PRJ-2", "budget_millions"] = 7.0
+        rebuilt.loc["PRG-002", "budget_millions"] = 0.5
+        expected = PortfolioTree(rebuilt.reset_index()).frame()
+        pd.testing.assert_frame_equal(tree.frame(), expected)
+
+    def test_unchanged_fields_are_kept(self):
+        tree = PortfolioTree(_nested())
+        tree.update("PRJ-3", budget_millions=1.0)
+        assert tree.node("PRJ-3")["percent_complete"] == 100.0
+        assert tree.node("ROOT")["leaves"] == 4
+
+    def test_rejects_bad_structure(self):
+        nodes = _nested()
+        nodes.loc[0, "parent_id"] = "PRJ-1"
+        with pytest.raises(ValueError, match="cycle"):
+            PortfolioTree(nodes)
+        nodes = _nested()
+        nodes.loc[3, "parent_id"] = "MISSING"
+        with pytest.raises(ValueError, match="Unknown"):
+            PortfolioTree(nodes)
+
+    def test_mock_hierarchy_attaches_program_stats(self):
+        risks = add_derived_columns(fetch_dataset("risks"), "risks")
+        milestones = fetch_dataset("milestones")
+        tree = PortfolioTree.from_frames(fetch_dataset("hierarchy"), risks, milestones)
+        root = tree.node("PORTFOLIO")
+        programs = fetch_dataset("programs")
+        assert root["open_risks"] == risks["is_open"].sum()
+        assert root["milestones"] == len(milestones)
+        assert root["percent_complete"] == pytest.approx(programs["percent_complete"].mean())
+        assert len(tree.children("PORTFOLIO")) == len(programs)
+
+    def test_mock_projects_roll_up_to_their_program(self):
+        tree = PortfolioTree.from_frames(fetch_dataset("hierarchy"))
+        for _, program in fetch_dataset("programs").iterrows():
+            node = tree.node(program["id"])
+            assert len(tree.children(program["id"])) == 3
+            assert node["percent_complete"] == pytest.approx(program["percent_complete"])
+            assert node["budget_millions"] == pytest.approx(program["budget_millions"])
+
+
+class TestSync:
+    def _frames(self):
+        hierarchy = fetch_dataset("hierarchy")
+        risks = add_derived_columns(fetch_dataset("risks"), "risks")
+        return hierarchy, risks, fetch_dataset("milestones")
+
+    def test_updates_only_changed_nodes_and_ancestors(self):
+        hierarchy, risks, milestones = self._frames()
+        tree = PortfolioTree.from_frames(hierarchy, risks, milestones)
+        hierarchy.loc[hierarchy["id"] == "PRG-002-PRJ-1", "percent_complete"] = 5.0
+        risks.loc[risks["program_id"] == "PRG-004", "is_open"] = False
+
+        touched = tree.sync(hierarchy, risks, milestones)
+        assert set(touched) == {"PRG-002-PRJ-1", "PRG-002", "PRG-004", "PORTFOLIO"}
+        expected = PortfolioTree.from_frames(hierarchy, risks, milestones).frame()
+        pd.testing.assert_frame_equal(tree.frame(), expected)
+
+    def test_unchanged_frames_touch_nothing(self):
+        frames = self._frames()
+        tree = PortfolioTree.from_frames(*frames)
+        assert tree.sync(*frames) == []
+
+    def test_structure_change_needs_rebuild(self):
+        hierarchy, risks, milestones = self._frames()
+        tree = PortfolioTree.from_frames(hierarchy, risks, milestones)
+        before = tree.frame()
+        assert tree.sync(hierarchy.iloc[:-1], risks, milestones) is None
+        moved = hierarchy.copy()
+        moved.loc[moved["id"] == "PRG-001-PRJ-1", "parent_id"] = "PRG-002"
+        assert tree.sync(moved, risks, milestones) is None
+        pd.testing.assert_frame_equal(tree.frame(), before)
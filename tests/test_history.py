@@ -0,0 +1,71 @@
+"""Tests for the deduplicated snapshot history and as-of queries."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.data.history import SnapshotHistory
+from src.data.sources import fetch_dataset
+
+
+def _programs():
+    return fetch_dataset("programs")
+
+
+class TestSnapshotHistory:
+    def test_unchanged_snapshots_are_not_stored(self):
+        history = SnapshotHistory()
+        assert history.record("programs", _programs(), date(2025, 1, 1)) == 6
+        assert history.record("programs", _programs(), date(2025, 1, 2)) == 0
+        assert len(history.versions("programs")) == 6
+
+    def test_as_of_reconstructs_past_state(self):
+        history = SnapshotHistory()
+        before = _programs()
+        history.record("programs", before, date(2025, 1, 1))
+        after = before.copy()
+        after.loc[0, "percent_complete"] = 99.0
+        history.record("programs", after, date(2025, 2, 1))
+
+        pd.testing.assert_frame_equal(history.as_of("programs", date(2025, 1, 31)), before)
+        pd.testing.assert_frame_equal(history.as_of("programs", date(2025, 2, 1)), after)
+        assert history.as_of("programs", date(2024, 12, 31)).empty
+
+    def test_vanished_entities_are_closed(self):
+        history = SnapshotHistory()
+        history.record("programs", _programs(), date(2025, 1, 1))
+        history.record("programs", _programs().iloc[1:], date(2025, 3, 1))
+        assert "PRG-001" in history.as_of("programs", date(2025, 2, 1))["id"].tolist()
+        assert "PRG-001" not in history.as_of("programs", date(2025, 3, 1))["id"].tolist()
+
+    def test_same_day_snapshot_replaces_version(self):
+        history = SnapshotHistory()
+        history.record("programs", _programs(), date(2025, 1, 1))
+        changed = _programs()
+        changed.loc[0, "owner"] = "Someone Else"
+        history.record("programs", changed, date(2025, 1, 1))
+        versions = history.versions("programs", ["PRG-001"])
+        assert versions["owner"].tolist() == ["Someone Else"]
+
+    def test_versions_report_validity(self):
+        history = SnapshotHistory()
+        history.record("programs", _programs(), date(2025, 1, 1))
+        changed = _programs()
+        changed.loc[0, "status"] = "At Risk"
+        history.record("programs", changed, date(2025, 2, 1))
+        versions = history.versions("programs", ["PRG-001"])
+        assert versions["status"].tolist() == [_programs().loc[0, "status"], "At Risk"]
+        assert versions["valid_to"].iloc[0] == pd.Timestamp("2025-02-01")
+        assert pd.isna(versions["valid_to"].iloc[1])
+
+    def test_out_of_order_snapshot_rejected(self):
+        history = SnapshotHistory()
+        history.record("programs", _programs(), date(2025, 2, 1))
+        with pytest.raises(ValueError):
+            history.record("programs", _programs(), date(2025, 1, 1))
+
+    def test_persists_to_file(self, tmp_path):
+        SnapshotHistory(tmp_path / "h.sqlite").record("risks", fetch_dataset("risks"))
+        reopened = SnapshotHistory(tmp_path / "h.sqlite")
+        assert len(reopened.as_of("risks", date.today())) == len(fetch_dataset("risks"))
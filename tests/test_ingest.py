@@ -0,0 +1,41 @@
+"""Tests for the ingestion daemon's single-pass publishing."""
+
+from datetime import date
+
+from src.data.history import SnapshotHistory
+from src.data.ingest import run_once
+from src.data.shared_store import SharedStore
+
+
+class TestRunOnce:
+    def test_publishes_each_dataset(self, tmp_path):
+        store = SharedStore(tmp_path)
+        published = run_once(store, ["programs", "risks"])
+        assert published == {"programs": 1, "risks": 1}
+        assert len(store.read("programs")) == 6
+        assert store.read("risks")["raised_date"].dtype == "datetime64[ns]"
+
+    def test_prunes_old_versions(self, tmp_path):
+        store = SharedStore(tmp_path)
+        for _ in range(4):
+            run_once(store, ["programs"], keep_versions=2)
+        assert len(list((tmp_path / "programs").glob("v*.arrow"))) == 2
+        assert store.manifest()["programs"]["version"] == 4
+
+    def test_skips_dataset_leased_by_replica(self, tmp_path):
+        store = SharedStore(tmp_path)
+        store.acquire_lease("programs", holder="web-1:1")
+        assert run_once(store, ["programs"]) == {}
+        assert store.read("programs") is None
+
+    def test_skips_dataset_leased_by_other_daemon(self, tmp_path):
+        store = SharedStore(tmp_path)
+        store.acquire_lease("programs", holder="ingest-worker-2:77")
+        assert run_once(store, ["programs"]) == {}
+
+    def test_records_history(self, tmp_path):
+        store = SharedStore(tmp_path)
+        history = SnapshotHistory(tmp_path / "history.sqlite")
+        run_once(store, ["programs", "metrics"], history=history)
+        assert len(history.as_of("programs", date.today())) == 6
+        assert history.as_of("metrics", date.today()).empty
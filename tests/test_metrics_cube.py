@@ -0,0 +1,94 @@
+"""Tests for the program x week x metric cube."""
+
+import numpy as np
+import pandas as pd
+
+from src.data.metrics_cube import MetricsCube
+from src.data.schema import METRIC_SCHEMA, apply_schema
+from src.data.sources import fetch_dataset
+from src.utils.helpers import classify_dora_maturity
+
+
+def _metrics():
+    return fetch_dataset("metrics")
+
+
+class TestMetricsCube:
+    def test_weekly_matches_groupby(self):
+        metrics = _metrics()
+        expected = (
+            metrics.groupby("week_start")
+            .agg({"velocity": "sum", "mttr_hours": "mean"})
+            .astype("float64")
+        )
+        weekly = MetricsCube.from_frame(metrics).weekly({"velocity": "sum", "mttr_hours": "mean"})
+        np.testing.assert_allclose(weekly["velocity"], expected["velocity"], rtol=1e-5)
+        np.testing.assert_allclose(weekly["mttr_hours"], expected["mttr_hours"], rtol=1e-5)
+        assert list(weekly["week_start"]) == list(expected.index)
+
+    def test_select_skips_missing_cells(self):
+        metrics = _metrics()
+        late_start = metrics[
+            (metrics["program_id"] == "PRG-001")
+            | (metrics["week_start"] >= metrics["week_start"].max() - pd.Timedelta(weeks=3))
+        ]
+        cube = MetricsCube.from_frame(late_start).select(["PRG-002", "PRG-003"])
+        weekly = cube.weekly({"deployment_frequency": "mean"})
+        assert len(weekly) == 4
+        assert not weekly["deployment_frequency"].isna().any()
+
+    def test_select_ignores_unknown_programs(self):
+        cube = MetricsCube.from_frame(_metrics()).select(["PRG-001", "PRG-999"])
+        assert cube.program_ids == ["PRG-001"]
+
+    def test_latest_week_reductions(self):
+        metrics = _metrics()
+        cube = MetricsCube.from_frame(metrics)
+        prev_week, latest_week = cube.latest_weeks(2)
+        assert latest_week == metrics["week_start"].max()
+        latest = metrics[metrics["week_start"] == latest_week]
+        totals = cube.at_week(latest_week, {"incident_count": "sum", "lead_time_days": "mean"})
+        assert totals["incident_count"] == latest["incident_count"].sum()
+        assert abs(totals["lead_time_days"] - latest["lead_time_days"].mean()) < 1e-4
+        assert prev_week < latest_week
+
+    def test_by_program(self):
+        metrics = _metrics()
+        cube = MetricsCube.from_frame(metrics)
+        week = cube.latest_weeks(1)[0]
+        per_program = cube.by_program(week, ["velocity"])
+        row = metrics[(metrics["week_start"] == week) & (metrics["program_id"] == "PRG-001")]
+        assert per_program.loc["PRG-001", "velocity"] == row["velocity"].iloc[0]
+
+    def test_empty_frame(self):
+        cube = MetricsCube.from_frame(
+            apply_schema(pd.DataFrame(columns=list(METRIC_SCHEMA)), "metrics")
+        )
+        assert cube.empty
+        assert cube.latest_weeks(2) == []
+        assert cube.weekly({"velocity": "sum"}).empty
+
+    def test_maturity_per_program_and_week(self):
+        metrics = _metrics()
+        subset = metrics[metrics["program_id"] != "PRG-002"].iloc[1:]
+        cube = MetricsCube.from_frame(subset)
+        codes = cube.maturity()
+        assert codes.shape == cube.present.shape
+        assert (codes[~cube.present] == -1).all()
+        row = subset.iloc[-1]
+        levels = ["Low", "Medium", "High", "Elite"]
+        p = cube.program_ids.index(row["program_id"])
+        w = cube.weeks.get_loc(row["week_start"])
+        assert levels[codes[p, w]] == classify_dora_maturity(
+            row["deployment_frequency"],
+            row["lead_time_days"],
+            row["change_failure_rate"],
+            row["mttr_hours"],
+        )
+
+    def test_maturity_counts(self):
+        cube = MetricsCube.from_frame(_metrics())
+        counts = cube.maturity_counts()
+        assert list(counts.columns) == ["week_start", "Low", "Medium", "High", "Elite"]
+        totals = counts[["Low", "Medium", "High", "Elite"]].sum(axis=1)
+        assert (totals == cube.present.sum(axis=0)).all()
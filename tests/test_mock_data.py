@@ -1,5 +1,25 @@
 """Tests for mock data consistency and completeness."""
 
+from datetime import date, timedelta
+import random
+
+import pandas as pd
+import pytest
+
+from src.data import mock_data
+from src.data.mock_data import (
+    _generate_metrics,
+    _generate_milestones,
+    _generate_risks,
+    _program_metrics,
+    current_scenario,
+    get_frame,
+    get_metrics,
+    get_status_history,
+    get_weekly_snapshots,
+)
+from src.data.sources import fetch_dataset
+
 
 class TestPrograms:
     def test_six_programs(self, programs):
@@ -129,3 +149,90 @@ class TestWeeklySnapshots:
                 or first.programs_off_track != last.programs_off_track
             )
             assert changed
+
+
+class TestPerProgramStreams:
+    def test_program_data_independent_of_others(self):
+        alone = _program_metrics("PRG-003")
+        together = [m for m in get_metrics() if m.program_id == "PRG-003"]
+        assert alone == together
+
+    def test_same_result_for_any_worker_count(self):
+        for generate in (_generate_milestones, _generate_risks, _generate_metrics):
+            assert generate(workers=2) == generate()
+
+    def test_leaves_global_random_untouched(self):
+        random.seed(0)
+        expected = random.random()
+        random.seed(0)
+        _generate_metrics()
+        assert random.random() == expected
+
+
+class TestMemoization:
+    def test_generated_once(self):
+        assert get_metrics() is get_metrics()
+        assert get_weekly_snapshots() is get_weekly_snapshots()
+
+    def test_frames_are_copies(self):
+        frame = get_frame("programs")
+        frame["percent_complete"] = 0
+        assert get_frame("programs")["percent_complete"].max() == 100
+
+    def test_reload_with_new_seed_regenerates(self, settings):
+        before = mock_data.get_metrics()
+        settings({"mock": {"seed": 7}})
+        reseeded = mock_data.get_metrics()
+        assert reseeded != before
+        assert [m.program_id for m in reseeded] == [m.program_id for m in before]
+        settings({})
+        assert mock_data.get_metrics() == before
+
+
+class TestScenarios:
+    @pytest.fixture
+    def configure(self, settings):
+        return lambda mock: settings({"data_source": "mock", "mock": mock})
+
+    def test_demo_is_default(self, configure):
+        configure({})
+        assert current_scenario().name == "demo"
+        assert len(get_frame("programs")) == 6
+
+    def test_generated_scenario_with_overrides(self, configure):
+        configure({"scenario": "enterprise", "scenarios": {"enterprise": {"programs": 50}}})
+        scenario = current_scenario()
+        assert (scenario.programs, scenario.weeks, scenario.seed) == (50, 52, 500)
+        assert len(get_frame("programs")) == 50
+        assert len(fetch_dataset("metrics")) == 50 * 52
+        snapshots = fetch_dataset("weekly_snapshots")
+        assert len(snapshots) == 52
+        assert set(get_status_history().program_ids) == set(get_frame("programs")["id"])
+
+    def test_generated_history_ends_today_or_as_configured(self, configure):
+        small = {"scenario": "enterprise", "scenarios": {"enterprise": {"programs": 20}}}
+        configure(small)
+        assert current_scenario().as_of == date.today()
+        last_week = get_frame("metrics")["week_start"].max().date()
+        assert date.today() - timedelta(days=13) <= last_week <= date.today() - timedelta(days=7)
+        small["scenarios"]["enterprise"]["as_of"] = "2025-03-14"
+        configure(small)
+        assert current_scenario().as_of == date(2025, 3, 14)
+        assert get_frame("risks")["raised_date"].max() <= pd.Timestamp("2025-03-14")
+
+    def test_seed_override_changes_data(self, configure):
+        small = {"scenario": "enterprise", "scenarios": {"enterprise": {"programs": 20}}}
+        configure(small)
+        baseline = get_frame("metrics")
+        configure({**small, "seed": 1})
+        assert not get_frame("metrics").equals(baseline)
+
+    def test_unknown_scenario(self, configure):
+        configure({"scenario": "galactic"})
+        with pytest.raises(ValueError, match="galactic"):
+            current_scenario()
+
+    def test_unknown_override_key(self, configure):
+        configure({"scenario": "enterprise", "scenarios": {"enterprise": {"program": 50}}})
+        with pytest.raises(ValueError, match="program"):
+            current_scenario()
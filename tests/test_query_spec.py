@@ -0,0 +1,64 @@
+"""Tests for filter pushdown via QuerySpec."""
+
+from datetime import date
+
+import pandas as pd
+
+from src.data.jira_client import build_jql
+from src.data.query_spec import QuerySpec
+from src.data.query_store import QueryStore
+from src.data.sources import fetch_dataset
+
+
+class TestQuerySpec:
+    def test_lists_become_tuples(self):
+        spec = QuerySpec(program_ids=["PRG-001"], quarters=["Q1 2025"])
+        assert spec.program_ids == ("PRG-001",)
+        assert hash(spec) == hash(QuerySpec(program_ids=("PRG-001",), quarters=("Q1 2025",)))
+
+    def test_where_only_uses_dataset_columns(self):
+        spec = QuerySpec(program_ids=["PRG-001"], severities=["High"], quarters=["Q1 2025"])
+        assert spec.where("risks") == {"program_id": ("PRG-001",), "severity": ("High",)}
+        assert spec.where("programs") == {"id": ("PRG-001",)}
+        assert spec.where("weekly_snapshots") == {}
+
+    def test_between(self):
+        spec = QuerySpec(start=date(2025, 1, 1))
+        assert spec.between("metrics") == {"week_start": (date(2025, 1, 1), None)}
+        assert spec.between("programs") == {}
+        assert QuerySpec().between("metrics") == {}
+
+
+class TestPushdown:
+    def test_mock_fetch_matches_full_mask(self):
+        spec = QuerySpec(program_ids=["PRG-002", "PRG-004"], severities=["High", "Critical"])
+        full = fetch_dataset("risks")
+        expected = full[spec.mask(full, "risks")].reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            fetch_dataset("risks", spec), expected, check_categorical=False
+        )
+
+    def test_empty_selection(self):
+        assert fetch_dataset("milestones", QuerySpec(program_ids=[])).empty
+
+    def test_query_store_matches_source(self):
+        spec = QuerySpec(program_ids=["PRG-001"], start=date(2025, 3, 1))
+        store = QueryStore()
+        store.replace("metrics", fetch_dataset("metrics"))
+        from_store = store.select("metrics", spec.where("metrics"), spec.between("metrics"))
+        from_source = fetch_dataset("metrics", spec)
+        assert len(from_store) == len(from_source) > 0
+
+    def test_jql(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.data.jira_client.get_nested",
+            lambda section, key, default=None: ["CLOUD", "SRE", "SEC"],
+        )
+        jql = build_jql("milestones", QuerySpec(program_ids=["PRG-002"], quarters=["Q3 2025"]))
+        assert jql == (
+            'project in ("SRE") AND ((duedate >= "2025-07-01" AND duedate <= "2025-09-30"))'
+        )
+        assert build_jql("risks", QuerySpec(severities=["High"])) == (
+            'project in ("CLOUD", "SRE", "SEC") AND priority in ("High")'
+        )
+        assert build_jql("risks", QuerySpec(program_ids=[])) == "project is EMPTY"
@@ -0,0 +1,78 @@
+"""Tests for the indexed SQLite query store."""
+
+from datetime import date
+
+import pandas as pd
+
+from src.data.query_store import QueryStore
+from src.data.sources import fetch_dataset
+
+
+def _store(*names):
+    store = QueryStore()
+    for name in names:
+        store.replace(name, fetch_dataset(name))
+    return store
+
+
+class TestQueryStore:
+    def test_round_trip_keeps_schema(self):
+        store = _store("milestones")
+        expected = fetch_dataset("milestones")
+        result = store.select("milestones")
+        assert result.dtypes.to_dict() == expected.dtypes.to_dict()
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_where_matches_mask(self):
+        store = _store("milestones")
+        df = fetch_dataset("milestones")
+        ids = df["program_id"].unique()[:2].tolist()
+        quarters = df["quarter"].unique()[:1].tolist()
+        result = store.select("milestones", {"program_id": ids, "quarter": quarters})
+        expected = df[df["program_id"].isin(ids) & df["quarter"].isin(quarters)]
+        assert sorted(result["id"]) == sorted(expected["id"])
+
+    def test_empty_selection_matches_nothing(self):
+        store = _store("risks")
+        assert store.select("risks", {"severity": []}).empty
+
+    def test_between_dates(self):
+        store = _store("metrics")
+        df = fetch_dataset("metrics")
+        start = df["week_start"].sort_values().iloc[len(df) // 2].date()
+        result = store.select("metrics", between={"week_start": (start, None)})
+        assert len(result) == (df["week_start"] >= pd.Timestamp(start)).sum()
+        assert store.select("metrics", between={"week_start": (None, date(1990, 1, 1))}).empty
+
+    def test_filters_use_indexes(self):
+        store = _store("milestones")
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM milestones "
+            "WHERE program_id IN (?) AND quarter IN (?)",
+            ("PRG-001", "Q1 2025"),
+        ).fetchall()
+        assert any("USING INDEX" in row[-1] for row in plan)
+
+    def test_distinct_and_count(self):
+        store = _store("milestones")
+        df = fetch_dataset("milestones")
+        assert sorted(store.distinct("milestones", "quarter")) == sorted(df["quarter"].unique())
+        assert store.count("milestones") == len(df)
+
+    def test_empty_source_gets_schema_table(self):
+        store = QueryStore()
+        store.replace("metrics", pd.DataFrame())
+        assert store.count("metrics") == 0
+        assert "program_id" in store.select("metrics", {"program_id": ["PRG-001"]}).columns
+
+    def test_is_fresh(self):
+        store = _store("programs")
+        assert store.is_fresh("programs", max_age_seconds=60)
+        assert not store.is_fresh("programs", max_age_seconds=0)
+        assert not store.is_fresh("risks", max_age_seconds=60)
+
+    def test_expire_keeps_tables(self):
+        store = _store("programs")
+        store.expire()
+        assert not store.is_fresh("programs", max_age_seconds=60)
+        assert len(store.select("programs")) == 6
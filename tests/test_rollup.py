@@ -0,0 +1,74 @@
+"""Tests for the department x status x quarter portfolio rollup."""
+
+import pandas as pd
+import pytest
+
+from src.data.rollup import ALL, PortfolioRollup
+from src.data.schema import PROGRAM_SCHEMA, add_derived_columns, apply_schema
+from src.data.sources import fetch_dataset
+
+
+@pytest.fixture
+def frames():
+    programs = fetch_dataset("programs")
+    risks = add_derived_columns(fetch_dataset("risks"), "risks")
+    return programs, risks
+
+
+class TestPortfolioRollup:
+    def test_portfolio_total(self, frames):
+        programs, risks = frames
+        total = PortfolioRollup.from_frames(programs, risks).total()
+        assert total["programs"] == len(programs)
+        assert total["budget_millions"] == pytest.approx(programs["budget_millions"].sum())
+        assert total["avg_completion"] == pytest.approx(programs["percent_complete"].mean())
+        assert total["open_risks"] == risks["is_open"].sum()
+
+    def test_breakdown_matches_groupby(self, frames):
+        programs, risks = frames
+        rollup = PortfolioRollup.from_frames(programs, risks)
+        by_status = rollup.breakdown("status")["budget_millions"]
+        expected = programs.groupby("status", observed=True)["budget_millions"].sum()
+        for status, budget in expected.items():
+            assert by_status[status] == pytest.approx(budget)
+        assert ALL not in by_status.index
+
+    def test_drill_down_subtotals_add_up(self, frames):
+        programs, risks = frames
+        rollup = PortfolioRollup.from_frames(programs, risks)
+        for department in programs["department"].unique():
+            split = rollup.breakdown("status", department=department)
+            assert split["programs"].sum() == rollup.total(department=department)["programs"]
+
+    def test_dora_means_skip_programs_without_metrics(self, frames):
+        programs, risks = frames
+        dora = pd.DataFrame(
+            {
+                "deployment_frequency": [4.0, 2.0],
+                "lead_time_days": [1.0, 3.0],
+                "change_failure_rate": [5.0, 15.0],
+                "mttr_hours": [2.0, 6.0],
+            },
+            index=["PRG-001", "PRG-002"],
+        )
+        total = PortfolioRollup.from_frames(programs, risks, dora).total()
+        assert total["dora_programs"] == 2
+        assert total["avg_deployment_frequency"] == pytest.approx(3.0)
+        assert total["avg_mttr_hours"] == pytest.approx(4.0)
+
+    def test_missing_cell_is_zero(self, frames):
+        rollup = PortfolioRollup.from_frames(*frames)
+        missing = rollup.total(department="No Such Department")
+        assert missing["programs"] == 0
+        assert pd.isna(missing["avg_completion"])
+        assert rollup.breakdown("status", department="No Such Department").empty
+
+    def test_empty_portfolio(self):
+        programs = apply_schema(pd.DataFrame(columns=list(PROGRAM_SCHEMA)), "programs")
+        rollup = PortfolioRollup.from_frames(programs)
+        assert rollup.total()["programs"] == 0
+        assert rollup.breakdown("department").empty
+
+    def test_unknown_dimension(self, frames):
+        with pytest.raises(ValueError):
+            PortfolioRollup.from_frames(*frames).breakdown("owner")
@@ -0,0 +1,144 @@
+"""Tests for loader schemas and compact dtypes."""
+
+from datetime import date
+from itertools import product
+
+import pandas as pd
+
+from src.data import mock_data
+from src.data.schema import (
+    SCHEMAS,
+    add_derived_columns,
+    apply_schema,
+    enum_dtype,
+    frame_from_models,
+    risk_scores,
+)
+from src.data.sources import fetch_dataset
+from src.utils.constants import ProgramStatus, RiskLikelihood, RiskSeverity
+from src.utils.helpers import rag_status, risk_score
+
+
+class TestEnumDtype:
+    def test_categories_follow_enum_order(self):
+        dtype = enum_dtype(RiskSeverity)
+        assert list(dtype.categories) == ["Low", "Medium", "High", "Critical"]
+
+    def test_enum_members_cast_to_values(self):
+        s = pd.Series([ProgramStatus.ON_TRACK, ProgramStatus.OFF_TRACK])
+        result = s.astype(enum_dtype(ProgramStatus))
+        assert result.tolist() == ["On Track", "Off Track"]
+
+
+class TestApplySchema:
+    def test_skips_missing_columns(self):
+        df = pd.DataFrame({"status": ["On Track"], "extra": [1]})
+        result = apply_schema(df, "programs")
+        assert isinstance(result["status"].dtype, pd.CategoricalDtype)
+        assert result["extra"].dtype == "int64"
+
+    def test_empty_frame(self):
+        df = pd.DataFrame(columns=list(SCHEMAS["metrics"]))
+        result = apply_schema(df, "metrics")
+        assert result["defect_count"].dtype == "int32"
+
+
+class TestFrameFromModels:
+    def test_matches_model_dump_path(self):
+        for name, models in (
+            ("programs", mock_data.get_programs()),
+            ("milestones", mock_data.get_milestones()),
+            ("escalations", mock_data.get_escalations()),
+            ("metrics", mock_data.get_metrics()),
+        ):
+            expected = apply_schema(pd.DataFrame([m.model_dump() for m in models]), name)
+            pd.testing.assert_frame_equal(frame_from_models(models, name), expected)
+
+    def test_empty(self):
+        df = frame_from_models([], "risks")
+        assert df.empty
+        assert df["severity"].dtype == enum_dtype(RiskSeverity)
+
+
+class TestAddDerivedColumns:
+    def test_risk_age_days(self):
+        df = apply_schema(pd.DataFrame({"raised_date": [date(2025, 1, 1)]}), "risks")
+        result = add_derived_columns(df, "risks", today=date(2025, 1, 31))
+        assert result["risk_age_days"].tolist() == [30]
+        assert result["risk_age_days"].dtype == "int32"
+
+    def test_risk_score_matches_scalar(self):
+        pairs = list(product(RiskSeverity, RiskLikelihood))
+        severity, likelihood = zip(*((s.value, lk.value) for s, lk in pairs))
+        df = apply_schema(pd.DataFrame({"severity": severity, "likelihood": likelihood}), "risks")
+        result = add_derived_columns(df, "risks")
+        assert result["risk_score"].tolist() == [risk_score(s, lk) for s, lk in pairs]
+        assert result["risk_score"].dtype == "int8"
+
+    def test_risk_score_of_plain_or_missing_values(self):
+        severity = pd.Series(["Critical", None, "Extreme"])
+        likelihood = pd.Series(["High", "Low", "Low"])
+        assert risk_scores(severity, likelihood).tolist() == [12, 0, 0]
+
+    def test_program_schedule_status(self):
+        df = apply_schema(
+            pd.DataFrame(
+                {
+                    "percent_complete": [40.0, 60.0, 40.0, 100.0],
+                    "start_date": [date(2025, 1, 1)] * 4,
+                    "target_end_date": [
+                        date(2025, 4, 11),
+                        date(2025, 2, 20),
+                        date(2025, 2, 9),
+                        date(2025, 2, 9),
+                    ],
+                }
+            ),
+            "programs",
+        )
+        result = add_derived_columns(df, "programs", today=date(2025, 2, 10))
+        assert result["target_percent"].tolist() == [40.0, 80.0, 100.0, 100.0]
+        assert result["schedule_status"].tolist() == [
+            rag_status(p, t).value
+            for p, t in zip(result["percent_complete"], result["target_percent"])
+        ]
+        assert result["schedule_status"].tolist() == [
+            "On Track",
+            "At Risk",
+            "Off Track",
+            "Completed",
+        ]
+        assert result["schedule_status"].dtype == enum_dtype(ProgramStatus)
+
+    def test_other_datasets_unchanged(self):
+        df = fetch_dataset("milestones")
+        assert add_derived_columns(df, "milestones") is df
+
+
+class TestLoaderDtypes:
+    def test_programs(self):
+        df = fetch_dataset("programs")
+        assert df["status"].dtype == enum_dtype(ProgramStatus)
+        assert df["department"].dtype == "category"
+        assert df["percent_complete"].dtype == "float32"
+
+    def test_metrics(self):
+        df = fetch_dataset("metrics")
+        assert df["program_id"].dtype == "category"
+        assert df["velocity"].dtype == "float32"
+        assert df["incident_count"].dtype == "int32"
+
+    def test_risks(self):
+        df = fetch_dataset("risks")
+        assert df["severity"].dtype == enum_dtype(RiskSeverity)
+        assert df["is_open"].dtype == "bool"
+        assert df["raised_date"].dtype == "datetime64[ns]"
+
+    def test_optional_dates_become_nat(self):
+        df = fetch_dataset("escalations")
+        assert df["resolved_date"].dtype == "datetime64[ns]"
+        assert df["resolved_date"].isna().any()
+
+    def test_status_comparison_still_works(self):
+        df = fetch_dataset("programs")
+        assert (df["status"] == ProgramStatus.OFF_TRACK.value).sum() == 1
@@ -0,0 +1,57 @@
+"""Tests for the host-level shared dataset store."""
+
+import pandas as pd
+
+from src.data.shared_store import SharedStore
+
+
+def _df():
+    return pd.DataFrame({"id": ["PRG-001", "PRG-002"], "percent_complete": [72.0, 85.0]})
+
+
+class TestSharedStore:
+    def test_read_missing_returns_none(self, tmp_path):
+        store = SharedStore(tmp_path)
+        assert store.read("programs") is None
+        assert store.age("programs") is None
+
+    def test_write_then_read_round_trip(self, tmp_path):
+        store = SharedStore(tmp_path)
+        store.write("programs", _df())
+        result = store.read("programs")
+        pd.testing.assert_frame_equal(result, _df())
+
+    def test_versions_increment(self, tmp_path):
+        store = SharedStore(tmp_path)
+        assert store.write("programs", _df()) == 1
+        assert store.write("programs", _df()) == 2
+        assert store.manifest()["programs"]["version"] == 2
+
+    def test_replicas_share_published_data(self, tmp_path):
+        SharedStore(tmp_path).write("programs", _df())
+        assert SharedStore(tmp_path).read("programs") is not None
+
+    def test_is_fresh(self, tmp_path):
+        store = SharedStore(tmp_path)
+        store.write("programs", _df())
+        assert store.is_fresh("programs", max_age_seconds=60)
+        assert not store.is_fresh("programs", max_age_seconds=0)
+
+
+class TestLease:
+    def test_single_holder(self, tmp_path):
+        store = SharedStore(tmp_path)
+        assert store.acquire_lease("programs", holder="a")
+        assert not store.acquire_lease("programs", holder="b")
+        assert store.acquire_lease("programs", holder="a")  # renewal
+
+    def test_release_allows_other_holder(self, tmp_path):
+        store = SharedStore(tmp_path)
+        store.acquire_lease("programs", holder="a")
+        store.release_lease("programs", holder="a")
+        assert store.acquire_lease("programs", holder="b")
+
+    def test_expired_lease_can_be_taken(self, tmp_path):
+        store = SharedStore(tmp_path, lease_seconds=0)
+        store.acquire_lease("programs", holder="a")
+        assert store.acquire_lease("programs", holder="b")
@@ -0,0 +1,105 @@
+"""Tests for the sorted-array program status history."""
+
+from datetime import date
+
+import pandas as pd
+
+from src.data.history import SnapshotHistory
+from src.data.mock_data import _STATUS_HISTORY, get_status_history
+from src.data.sources import fetch_dataset
+from src.data.status_history import TRANSITION_COLUMNS, StatusHistory
+from src.utils.constants import ProgramStatus
+from src.utils.helpers import rag_status, schedule_percent
+
+
+def _status_at(program_id: str, as_of: date) -> str:
+    """Reference linear scan over the mock transition table."""
+    status = ProgramStatus.ON_TRACK
+    for changed_at, new_status in _STATUS_HISTORY.get(program_id, []):
+        if as_of >= changed_at:
+            status = new_status
+    return status.value
+
+
+class TestStatusHistory:
+    def test_matches_linear_scan(self):
+        dates = pd.date_range("2024-12-01", "2026-03-01", freq="W-MON").date
+        grid = get_status_history().status_grid(dates)
+        for pid in grid.columns:
+            assert grid[pid].tolist() == [_status_at(pid, d) for d in dates]
+
+    def test_transition_day_is_inclusive(self):
+        grid = get_status_history().status_grid([date(2025, 7, 31), date(2025, 8, 1)], ["PRG-003"])
+        assert grid["PRG-003"].tolist() == ["On Track", "At Risk"]
+
+    def test_unknown_program_and_early_dates_use_default(self):
+        history = get_status_history()
+        grid = history.status_grid([date(2020, 1, 1)], ["PRG-005", "PRG-999"])
+        assert grid.iloc[0].tolist() == ["On Track", "On Track"]
+
+    def test_counts(self):
+        counts = get_status_history().counts([date(2025, 11, 1)])
+        assert counts.iloc[0].to_dict() == {
+            "On Track": 4,
+            "At Risk": 1,
+            "Off Track": 1,
+            "Completed": 0,
+        }
+
+    def test_empty_transitions(self):
+        history = StatusHistory(pd.DataFrame(columns=TRANSITION_COLUMNS))
+        counts = history.counts([date(2025, 1, 1)], ["PRG-001", "PRG-002"])
+        assert counts.loc[:, "On Track"].tolist() == [2]
+
+    def test_from_snapshot_versions(self):
+        snapshots = SnapshotHistory()
+        programs = fetch_dataset("programs")
+        snapshots.record("programs", programs, date(2025, 1, 1))
+        changed = programs.copy()
+        changed.loc[changed["id"] == "PRG-001", "status"] = "Off Track"
+        snapshots.record("programs", changed, date(2025, 3, 1))
+
+        history = StatusHistory.from_versions(snapshots.versions("programs"))
+        grid = history.status_grid([date(2025, 2, 1), date(2025, 3, 1)], ["PRG-001"])
+        assert grid["PRG-001"].tolist() == [programs.loc[0, "status"], "Off Track"]
+
+
+class TestFromSchedule:
+    def test_matches_scalar_rag_status(self):
+        programs = fetch_dataset("programs")
+        dates = pd.date_range("2024-06-01", "2027-01-01", freq="MS")
+        grid = StatusHistory.from_schedule(programs, dates).status_grid(dates, programs["id"])
+        for _, row in programs.iterrows():
+            expected = [
+                rag_status(
+                    row["percent_complete"],
+                    schedule_percent(row["start_date"], row["target_end_date"], d),
+                ).value
+                for d in dates
+            ]
+            assert grid[row["id"]].tolist() == expected
+
+    def test_keeps_only_changes(self):
+        programs = fetch_dataset("programs")
+        dates = pd.date_range("2024-06-01", "2027-01-01", freq="W-MON")
+        history = StatusHistory.from_schedule(programs, dates)
+        grid = history.status_grid(dates)
+        # One transition per program for the first date, plus one per status change
+        assert len(history._codes) == (grid != grid.shift()).to_numpy().sum()
+
+    def test_from_snapshot_versions(self):
+        snapshots = SnapshotHistory()
+        programs = fetch_dataset("programs")
+        snapshots.record("programs", programs, date(2025, 1, 1))
+        stalled = programs.copy()
+        stalled.loc[stalled["id"] == "PRG-002", "percent_complete"] = 0.0
+        snapshots.record("programs", stalled, date(2025, 9, 1))
+
+        dates = [date(2025, 8, 1), date(2025, 9, 1)]
+        history = StatusHistory.from_schedule(snapshots.versions("programs"), dates)
+        grid = history.status_grid(dates, ["PRG-002"])
+        target = schedule_percent(programs["start_date"][1], programs["target_end_date"][1], dates)
+        assert grid["PRG-002"].tolist() == [
+            rag_status(programs["percent_complete"][1], target[0]).value,
+            rag_status(0.0, target[1]).value,
+        ]
@@ -0,0 +1,85 @@
+"""Tests for the vectorized synthetic portfolio generator."""
+
+from datetime import date
+
+import pandas as pd
+
+from src.data.hierarchy import PortfolioTree
+from src.data.schema import SCHEMAS
+from src.data.status_history import StatusHistory
+from src.data.synthetic import PROJECT_SHARES, generate_portfolio
+from src.data.validation import validate_frame
+from src.utils.constants import ProgramStatus
+
+_DATASETS = ["programs", "milestones", "risks", "escalations", "metrics", "hierarchy"]
+
+
+_AS_OF = date(2025, 11, 20)
+
+
+def _frames(**kwargs):
+    return generate_portfolio(**{"programs": 400, "weeks": 20, "as_of": _AS_OF, **kwargs})
+
+
+class TestGeneratePortfolio:
+    def test_scales_with_parameters(self):
+        frames = _frames(programs=300, weeks=12)
+        assert len(frames["programs"]) == 300
+        assert len(frames["metrics"]) == 300 * 12
+        assert len(frames["hierarchy"]) == 1 + 300 * (1 + len(PROJECT_SHARES))
+        dense = _frames(programs=300, milestones_per_program=20)
+        assert len(dense["milestones"]) > 2 * len(frames["milestones"])
+
+    def test_history_ends_on_as_of(self):
+        frames = _frames()
+        last_week = frames["metrics"]["week_start"].max()
+        # The last full week: Monday 2025-11-10, before the week of Thursday the 20th.
+        assert last_week == pd.Timestamp("2025-11-10")
+        assert frames["risks"]["raised_date"].max() <= pd.Timestamp(_AS_OF)
+        assert frames["programs"]["start_date"].max() <= pd.Timestamp(_AS_OF)
+
+    def test_frames_match_schema_and_validate(self):
+        frames = _frames()
+        for name in _DATASETS:
+            df = frames[name]
+            assert list(df.columns) == [c for c in SCHEMAS[name] if c in df.columns]
+            for column, dtype in SCHEMAS[name].items():
+                if column in df.columns:
+                    assert df[column].dtype == dtype, (name, column)
+            _, violations = validate_frame(df, name)
+            assert violations.empty, name
+
+    def test_is_deterministic(self):
+        first, second = _frames(seed=7), _frames(seed=7)
+        for name in _DATASETS:
+            pd.testing.assert_frame_equal(first[name], second[name])
+        assert not _frames(seed=8)["metrics"].equals(first["metrics"])
+
+    def test_keeps_status_correlations(self):
+        frames = _frames(programs=2000)
+        status = frames["programs"].set_index("id")["status"]
+        metrics = frames["metrics"]
+        by_status = metrics.groupby(metrics["program_id"].map(status).astype(str))[
+            ["velocity", "change_failure_rate"]
+        ].mean()
+        on, off = ProgramStatus.ON_TRACK.value, ProgramStatus.OFF_TRACK.value
+        assert by_status.loc[on, "velocity"] > by_status.loc[off, "velocity"]
+        assert by_status.loc[on, "change_failure_rate"] < by_status.loc[off, "change_failure_rate"]
+
+        risks = frames["risks"]
+        critical = (
+            (risks["severity"] == "Critical")
+            .groupby(risks["program_id"].map(status).astype(str))
+            .mean()
+        )
+        assert critical[off] > critical[on]
+
+    def test_feeds_status_history_and_hierarchy(self):
+        frames = _frames()
+        history = StatusHistory(frames["status_transitions"])
+        latest = history.status_grid([_AS_OF]).iloc[0]
+        expected = frames["programs"].set_index("id")["status"].astype(str)
+        assert (latest.reindex(expected.index) == expected).all()
+        tree = PortfolioTree.from_frames(frames["hierarchy"], frames["risks"])
+        assert tree.node("PORTFOLIO")["leaves"] == 400 * len(PROJECT_SHARES)
+        assert tree.node("PORTFOLIO")["open_risks"] == frames["risks"]["is_open"].sum()
@@ -0,0 +1,129 @@
+"""Tests for the per-tenant cache and tenant-scoped configuration."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from src.data import data_loader
+from src.data.tenant_cache import TenantCache
+from src.utils import config
+from src.utils.config import current_tenant, get_nested, tenant_path, tenant_scope
+
+
+def _block(kb: int) -> np.ndarray:
+    return np.zeros(kb * 1024, dtype=np.uint8)
+
+
+class TestTenantCache:
+    def test_tenants_are_namespaced(self):
+        cache = TenantCache(10 * 1024)
+        cache.put("a", "programs", "A")
+        assert cache.get("b", "programs", lambda: "B") == "B"
+        assert cache.get("a", "programs", lambda: "rebuilt") == "A"
+
+    def test_evicts_least_recently_used_within_tenant(self):
+        cache = TenantCache(3 * 1024)
+        cache.put("a", "x", _block(1))
+        cache.put("a", "y", _block(1))
+        cache.get("a", "x", lambda: None)  # x is now more recent than y
+        cache.put("a", "z", _block(2))
+        assert set(cache.usage()) == {"a"}
+        assert cache.get("a", "y", lambda: "rebuilt") == "rebuilt"
+        assert cache.get("a", "z", lambda: "rebuilt") is not None
+
+    def test_evicts_coldest_tenant_over_total_budget(self):
+        cache = TenantCache(4 * 1024, total_budget_bytes=5 * 1024)
+        cache.put("a", "x", _block(2))
+        cache.put("b", "x", _block(2))
+        cache.get("a", "x", lambda: None)  # b is now the coldest
+        cache.put("c", "x", _block(2))
+        assert list(cache.usage()) == ["a", "c"]
+        assert cache.total_bytes() == 4 * 1024
+
+    def test_stale_entries_rebuild(self):
+        cache = TenantCache(1024)
+        cache.put("a", "x", "old")
+        assert cache.get("a", "x", lambda: "new", max_age_seconds=0) == "new"
+
+    def test_new_version_rebuilds(self):
+        cache = TenantCache(1024)
+        assert cache.get("a", "x", lambda: "v1", version=1) == "v1"
+        assert cache.get("a", "x", lambda: "rebuilt", version=1) == "v1"
+        assert cache.get("a", "x", lambda: "v2", version=2) == "v2"
+        assert cache.loaded_at("a", "x") is not None
+        assert cache.loaded_at("a", "y") is None
+
+    def test_invalidate_leaves_other_tenants(self):
+        cache = TenantCache(1024)
+        cache.put("a", "x", 1)
+        cache.put("b", "x", 2)
+        cache.invalidate("a")
+        assert cache.get("a", "x", lambda: 3) == 3
+        assert cache.get("b", "x", lambda: 4) == 2
+
+
+class TestTenantConfig:
+    def test_overrides_apply_in_scope(self, settings):
+        settings(
+            {
+                "asana": {"portfolio_gid": "ROOT", "risk_tag": "risk"},
+                "tenants": {"emea": {"asana": {"portfolio_gid": "EMEA"}}},
+            }
+        )
+        assert config.tenants() == ["emea"]
+        with tenant_scope("emea"):
+            assert current_tenant() == "emea"
+            assert get_nested("asana", "portfolio_gid") == "EMEA"
+            assert get_nested("asana", "risk_tag") == "risk"
+        assert get_nested("asana", "portfolio_gid") == "ROOT"
+
+    def test_tenant_path(self):
+        assert tenant_path("/data/history.sqlite") == Path("/data/history.sqlite")
+        with tenant_scope("emea"):
+            assert tenant_path("/data/history.sqlite") == Path("/data/history-emea.sqlite")
+            assert tenant_path("/data/store") == Path("/data/store/tenants/emea")
+
+
+class TestRefreshTenant:
+    def test_refreshes_only_that_tenant(self):
+        with tenant_scope("emea"):
+            emea = data_loader._cached("probe", object, expires=False)
+        default = data_loader._cached("probe", object, expires=False)
+        data_loader.refresh_tenant("emea")
+        with tenant_scope("emea"):
+            assert data_loader._cached("probe", object, expires=False) is not emea
+        assert data_loader._cached("probe", object, expires=False) is default
+
+
+def _edit(values: dict):
+    """Rewrite the settings file with a later mtime, however coarse the filesystem's clock."""
+    path = config._DEFAULT_PATH
+    mtime = path.stat().st_mtime_ns
+    path.write_text(yaml.safe_dump(values))
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+class TestSettingsReload:
+    @pytest.fixture(autouse=True)
+    def _watch(self, settings, monkeypatch):
+        settings({"mock": {"seed": 1}})
+        monkeypatch.setattr(config, "CHECK_INTERVAL_SECONDS", 0)
+
+    def test_edited_file_is_reloaded(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(config, "_reload_hooks", [lambda: calls.append("reloaded")])
+        _edit({"mock": {"seed": 2}})
+        assert get_nested("mock", "seed") == 2
+        assert get_nested("mock", "seed") == 2
+        assert calls == ["reloaded"]
+
+    def test_reload_drops_loader_caches(self):
+        probe = data_loader._cached("probe", object, expires=False)
+        store = data_loader._query_store()
+        _edit({"mock": {"seed": 2}})
+        config.load_config()
+        assert data_loader._cached("probe", object, expires=False) is not probe
+        assert data_loader._query_store() is not store
@@ -0,0 +1,98 @@
+"""Tests for column-wise validation of source frames."""
+
+from datetime import date
+
+import pandas as pd
+
+from src.data.validation import validate_frame
+
+
+def _program(**overrides):
+    row = {
+        "id": "PRG-001",
+        "name": "Cloud Platform Migration",
+        "department": "Cloud Engineering",
+        "status": "On Track",
+        "percent_complete": 72.0,
+        "start_date": date(2025, 4, 1),
+        "target_end_date": date(2026, 6, 30),
+        "owner": "Priya Sharma",
+        "description": "",
+        "budget_millions": 4.2,
+        "budget_spent_millions": 3.0,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestValidateFrame:
+    def test_clean_frame_passes(self):
+        valid, violations = validate_frame(pd.DataFrame([_program()]), "programs")
+        assert len(valid) == 1
+        assert violations.empty
+        assert valid["start_date"].dtype == "datetime64[ns]"
+
+    def test_percent_complete_bounds(self):
+        df = pd.DataFrame(
+            [_program(), _program(percent_complete=101), _program(percent_complete=-1)]
+        )
+        valid, violations = validate_frame(df, "programs")
+        assert len(valid) == 1
+        assert sorted(violations["rule"]) == ["ge", "le"]
+        assert set(violations["row"]) == {1, 2}
+
+    def test_unknown_enum_value(self):
+        df = pd.DataFrame([_program(status="Paused")])
+        valid, violations = validate_frame(df, "programs")
+        assert valid.empty
+        assert violations.iloc[0].to_dict() == {
+            "row": 0,
+            "column": "status",
+            "rule": "enum",
+            "value": "Paused",
+        }
+
+    def test_null_in_required_field(self):
+        df = pd.DataFrame([_program(owner=None)])
+        _, violations = validate_frame(df, "programs")
+        assert violations[["column", "rule"]].values.tolist() == [["owner", "null"]]
+
+    def test_unparseable_number_and_date(self):
+        df = pd.DataFrame([_program(budget_millions="lots", start_date="someday")])
+        _, violations = validate_frame(df, "programs")
+        assert set(zip(violations["column"], violations["rule"])) == {
+            ("budget_millions", "type"),
+            ("start_date", "type"),
+        }
+
+    def test_missing_required_column(self):
+        df = pd.DataFrame([_program()]).drop(columns=["owner"])
+        valid, violations = validate_frame(df, "programs")
+        assert valid.empty
+        assert violations["rule"].tolist() == ["missing"]
+
+    def test_optional_dates_allow_null(self):
+        df = pd.DataFrame(
+            [
+                {
+                    "id": "ESC-001",
+                    "program_id": "PRG-001",
+                    "risk_id": None,
+                    "title": "Blocked",
+                    "level": "VP",
+                    "raised_date": date(2025, 9, 15),
+                    "resolved_date": None,
+                    "resolution": "",
+                }
+            ]
+        )
+        valid, violations = validate_frame(df, "escalations")
+        assert violations.empty
+        assert valid["resolved_date"].isna().all()
+
+    def test_non_integer_count(self):
+        df = pd.DataFrame(
+            [{"program_id": "PRG-001", "week_start": date(2025, 7, 7), "defect_count": 1.5}]
+        )
+        _, violations = validate_frame(df, "metrics")
+        assert violations[["column", "rule"]].values.tolist() == [["defect_count", "type"]]